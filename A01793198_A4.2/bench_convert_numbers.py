@@ -0,0 +1,43 @@
+"""
+Benchmark de to_binary y to_hexadecimal con enteros muy grandes: compara la conversión
+dígito por dígito contra la de divide y vencerás (to_binary_fast, to_hexadecimal_fast)
+y revisa que ambas den el mismo resultado.
+Uso: python bench_convert_numbers.py [bits ...]   (por omisión 1000 10000 100000)
+"""
+
+import random
+import sys
+import time
+
+import convert_numbers
+from convert_numbers import to_binary, to_binary_fast, to_hexadecimal, to_hexadecimal_fast
+
+
+def measure(function, number):
+    """Regresa (segundos, resultado) de convertir number con function."""
+    started = time.perf_counter()
+    result = function(number)
+    return time.perf_counter() - started, result
+
+
+def main(sizes):
+    """Mide ambas conversiones de un positivo y un negativo de cada tamaño."""
+    generator = random.Random(42)
+    # Desactiva el cambio automático para medir la conversión dígito por dígito
+    convert_numbers.LARGE_NUMBER_BITS = max(sizes) + 1
+    print(f"{'bits':>8} {'function':>14} {'digits_s':>10} {'fast_s':>10} {'speedup':>8}")
+    for bits in sizes:
+        magnitude = generator.getrandbits(bits) | 1 << (bits - 1)
+        for number in (magnitude, -magnitude):
+            for name, slow, fast in (("binary", to_binary, to_binary_fast),
+                                     ("hexadecimal", to_hexadecimal, to_hexadecimal_fast)):
+                slow_seconds, expected = measure(slow, number)
+                fast_seconds, result = measure(fast, number)
+                assert result == expected, f"{name} differs for {bits} bits"
+                label = name if number > 0 else f"-{name}"
+                print(f"{bits:>8} {label:>14} {slow_seconds:>10.4f} {fast_seconds:>10.4f} "
+                      f"{slow_seconds / max(fast_seconds, 1e-9):>7.0f}x")
+
+
+if __name__ == "__main__":
+    main([int(bits) for bits in sys.argv[1:]] or [1000, 10000, 100000])
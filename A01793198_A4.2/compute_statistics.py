@@ -1,87 +1,311 @@
-"""
-Este módulo realiza el cálculo de estadísticas descriptivas (media, mediana, moda,
-desviación estándar y varianza) para un conjunto de datos numéricos proporcionados en un archivo.
-"""
-
-import sys
-import time
-def calculate_mean(numbers):
-    """Calcula y retorna la media de una lista de números."""
-    return sum(numbers) / len(numbers) if numbers else 0
-
-def calculate_median(numbers):
-    """Calcula y retorna la mediana de una lista de números."""
-    numbers.sort()
-    num_items = len(numbers)
-    mid_index = num_items // 2
-    if num_items % 2 == 0:
-        median = (numbers[mid_index] + numbers[~mid_index]) / 2
-    else:
-        median = numbers[mid_index]
-    return median
-
-def calculate_mode(numbers):
-    """Calcula y retorna la moda de una lista de números."""
-    frequency = {}
-    for num in numbers:
-        frequency[num] = frequency.get(num, 0) + 1
-    max_freq = max(frequency.values())
-    mode = [key for key, value in frequency.items() if value == max_freq]
-    return mode[0] if len(mode) == 1 else mode
-
-def calculate_variance(numbers):
-    """Calcula y retorna la varianza de una lista de números. """
-    mean = calculate_mean(numbers)
-    return sum((x - mean) ** 2 for x in numbers) / len(numbers) if numbers else 0
-
-def calculate_sample_variance(numbers):
-    """Calcula y retorna la varianza de una muestra de números."""
-    mean = calculate_mean(numbers)
-    num_samples = len(numbers)  # Cambiado de 'n' a 'num_samples'
-    return sum((x - mean) ** 2 for x in numbers) / (num_samples - 1) if num_samples > 1 else 0
-
-def calculate_stdev(numbers):
-    """Calcula y retorna la desviación estándar de una lista de números."""
-    return calculate_variance(numbers) ** 0.5
-
-def compute_statistics(filename):
-    """
-    Calcula y muestra las estadísticas descriptivas de los números en el archivo dado.
-    Los resultados se escriben en un archivo y se muestran en pantalla.
-    """
-    start_time = time.time()
-    numbers = []
-    try:
-        with open(filename, 'r', encoding='utf-8') as file:
-            for line in file:
-                try:
-                    number = float(line.strip())
-                    numbers.append(number)
-                except ValueError as val_error:
-                    print(f"Invalid data found and skipped: {line.strip()} - Error: {val_error}")
-
-        results = (f"Count: {len(numbers)}\n"
-                   f"Mean: {calculate_mean(numbers)}\n"
-                   f"Median: {calculate_median(numbers)}\n"
-                   f"Mode: {calculate_mode(numbers)}\n"
-                   f"Standard Deviation: {calculate_stdev(numbers)}\n"
-                   f"Variance: {calculate_variance(numbers)}\n"
-                   f"Sample Variance: {calculate_sample_variance(numbers)}")
-        print(results)
-
-        with open(filename+'.Results.txt', 'w', encoding='utf-8') as file:
-            file.write(results)
-
-    except FileNotFoundError as fnf_error:
-        print(f"File not found: {filename} - Error: {fnf_error}")
-    finally:
-        elapsed_time = time.time() - start_time
-        print(f"Execution Time: {elapsed_time} seconds")
-        with open('StatisticsResults.txt', 'a', encoding='utf-8') as file:
-            file.write(f"\nExecution Time: {elapsed_time} seconds")
-
-if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: python compute_statistics.py <filename>")
-    else:
-        compute_statistics(sys.argv[1])
+"""
+Este módulo realiza el cálculo de estadísticas descriptivas (media, mediana, moda,
+desviación estándar y varianza) para un conjunto de datos numéricos proporcionados en un archivo.
+Con --grouped el archivo trae pares "clave valor" y se calculan estadísticas por clave en una
+sola pasada.
+"""
+
+import argparse
+import os
+import time
+
+import profiling
+from metrics import DISABLED, add_arguments, from_arguments
+
+MAX_GROUPS = 1000
+OTHER_GROUP = '__other__'
+
+
+def calculate_mean(numbers):
+    """Calcula y retorna la media de una lista de números."""
+    return sum(numbers) / len(numbers) if numbers else 0
+
+def calculate_median(numbers):
+    """Calcula y retorna la mediana de una lista de números."""
+    numbers.sort()
+    num_items = len(numbers)
+    mid_index = num_items // 2
+    if num_items % 2 == 0:
+        median = (numbers[mid_index] + numbers[~mid_index]) / 2
+    else:
+        median = numbers[mid_index]
+    return median
+
+def calculate_mode(numbers):
+    """Calcula y retorna la moda de una lista de números."""
+    frequency = {}
+    for num in numbers:
+        frequency[num] = frequency.get(num, 0) + 1
+    max_freq = max(frequency.values())
+    mode = [key for key, value in frequency.items() if value == max_freq]
+    return mode[0] if len(mode) == 1 else mode
+
+def calculate_variance(numbers):
+    """Calcula y retorna la varianza de una lista de números. """
+    mean = calculate_mean(numbers)
+    return sum((x - mean) ** 2 for x in numbers) / len(numbers) if numbers else 0
+
+def calculate_sample_variance(numbers):
+    """Calcula y retorna la varianza de una muestra de números."""
+    mean = calculate_mean(numbers)
+    num_samples = len(numbers)  # Cambiado de 'n' a 'num_samples'
+    return sum((x - mean) ** 2 for x in numbers) / (num_samples - 1) if num_samples > 1 else 0
+
+def calculate_stdev(numbers):
+    """Calcula y retorna la desviación estándar de una lista de números."""
+    return calculate_variance(numbers) ** 0.5
+
+class RunningStatistics:
+    """
+    Estadísticas de un flujo de números sin guardarlos: conteo, media y varianza con el
+    algoritmo de Welford, mínimo, máximo y la mediana estimada con el algoritmo P² de Jain y
+    Chlamtac, que sigue cinco marcadores en lugar de ordenar todos los valores.
+    """
+
+    __slots__ = ('count', 'mean', 'squares', 'minimum', 'maximum', 'heights', 'positions',
+                 'desired')
+    INCREMENTS = (0, 0.25, 0.5, 0.75, 1)
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.squares = 0.0
+        self.minimum = None
+        self.maximum = None
+        self.heights = []
+        self.positions = [1, 2, 3, 4, 5]
+        self.desired = [1, 2, 3, 4, 5]
+
+    def add(self, value):
+        """Agrega un valor a las estadísticas."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.squares += delta * (value - self.mean)
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+        if self.count <= 5:
+            self.heights.append(value)
+            self.heights.sort()
+            return
+        self._update_markers(value)
+
+    def _update_markers(self, value):
+        """Mueve los cinco marcadores de P² para incluir el valor."""
+        heights = self.heights
+        positions = self.positions
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = 0
+            while value >= heights[cell + 1]:
+                cell += 1
+        for marker in range(cell + 1, 5):
+            positions[marker] += 1
+        for marker in range(5):
+            self.desired[marker] += self.INCREMENTS[marker]
+        for marker in (1, 2, 3):
+            offset = self.desired[marker] - positions[marker]
+            if ((offset >= 1 and positions[marker + 1] - positions[marker] > 1)
+                    or (offset <= -1 and positions[marker - 1] - positions[marker] < -1)):
+                step = 1 if offset > 0 else -1
+                height = self._parabolic(marker, step)
+                if not heights[marker - 1] < height < heights[marker + 1]:
+                    height = heights[marker] + step * (
+                        (heights[marker + step] - heights[marker])
+                        / (positions[marker + step] - positions[marker]))
+                heights[marker] = height
+                positions[marker] += step
+
+    def _parabolic(self, marker, step):
+        """Regresa la altura del marcador ajustada por la fórmula parabólica de P²."""
+        heights = self.heights
+        positions = self.positions
+        return heights[marker] + step / (positions[marker + 1] - positions[marker - 1]) * (
+            (positions[marker] - positions[marker - 1] + step)
+            * (heights[marker + 1] - heights[marker])
+            / (positions[marker + 1] - positions[marker])
+            + (positions[marker + 1] - positions[marker] - step)
+            * (heights[marker] - heights[marker - 1])
+            / (positions[marker] - positions[marker - 1]))
+
+    @property
+    def median(self):
+        """Mediana exacta con hasta cinco valores y estimada por P² después."""
+        if self.count <= 5:
+            return calculate_median(list(self.heights)) if self.heights else 0
+        return self.heights[2]
+
+    @property
+    def variance(self):
+        """Varianza poblacional."""
+        return self.squares / self.count if self.count else 0
+
+    @property
+    def sample_variance(self):
+        """Varianza muestral."""
+        return self.squares / (self.count - 1) if self.count > 1 else 0
+
+    def to_dict(self):
+        """Regresa las estadísticas como diccionario."""
+        return {'count': self.count, 'mean': self.mean, 'median': self.median,
+                'min': self.minimum, 'max': self.maximum,
+                'stdev': self.variance ** 0.5, 'variance': self.variance,
+                'sample_variance': self.sample_variance}
+
+def format_grouped_results(groups):
+    """
+    Regresa la tabla de resultados separada por tabuladores, una fila por clave en orden y
+    OTHER_GROUP al final.
+    """
+    columns = ('count', 'mean', 'median', 'min', 'max', 'stdev', 'variance', 'sample_variance')
+    lines = ["\t".join(('KEY',) + tuple(column.upper() for column in columns))]
+    for key in sorted(groups, key=lambda key: (key == OTHER_GROUP, key)):
+        row = groups[key].to_dict()
+        lines.append("\t".join([key] + [str(row[column]) for column in columns]))
+    return "\n".join(lines)
+
+def compute_grouped_statistics(filename, max_groups=MAX_GROUPS, metrics=DISABLED):
+    """
+    Calcula en una sola pasada las estadísticas por clave de un archivo de líneas
+    "clave valor". Después de max_groups claves distintas, las claves nuevas se acumulan en
+    OTHER_GROUP para acotar la memoria; una línea cuya clave es OTHER_GROUP se omite como
+    inválida para no mezclarse con ese grupo. La tabla combinada y el tiempo de ejecución
+    se escriben en <filename>.Grouped.Results.txt y se muestran en pantalla; si el archivo
+    no existe solo se muestra el tiempo.
+    Regresa el diccionario clave -> estadísticas, o None si el archivo no existe.
+    """
+    start_time = time.time()
+    groups = {}
+    statistics = None
+    opened = False
+    try:
+        with open(filename, 'r', encoding='utf-8') as file:
+            opened = True
+            metrics.count('bytes', os.fstat(file.fileno()).st_size)
+            lines = 0
+            with metrics.phase('compute'):
+                for lines, line in enumerate(file, 1):
+                    fields = line.split()
+                    try:
+                        key, value = fields
+                        value = float(value)
+                        if key == OTHER_GROUP:
+                            raise ValueError(f"{OTHER_GROUP} is a reserved key")
+                    except ValueError as val_error:
+                        metrics.count('invalid_rows')
+                        print(f"Invalid data found and skipped: {line.strip()} - Error: {val_error}")
+                        continue
+                    group = groups.get(key)
+                    if group is None:
+                        if len(groups) >= max_groups:
+                            metrics.count('overflow_rows')
+                            key = OTHER_GROUP
+                        group = groups.setdefault(key, RunningStatistics())
+                    group.add(value)
+            metrics.count('lines', lines)
+        metrics.count('groups', len(groups))
+
+        with metrics.phase('format'):
+            results = format_grouped_results(groups)
+            statistics = {key: group.to_dict() for key, group in groups.items()}
+
+        with metrics.phase('write'):
+            print(results)
+            with open(filename+'.Grouped.Results.txt', 'w', encoding='utf-8') as file:
+                file.write(results)
+
+    except FileNotFoundError as fnf_error:
+        print(f"File not found: {filename} - Error: {fnf_error}")
+    finally:
+        elapsed_time = time.time() - start_time
+        print(f"Execution Time: {elapsed_time} seconds")
+        if opened:
+            with open(filename+'.Grouped.Results.txt', 'a', encoding='utf-8') as file:
+                file.write(f"\nExecution Time: {elapsed_time} seconds")
+        metrics.emit()
+    return statistics
+
+def compute_statistics(filename, metrics=DISABLED):
+    """
+    Calcula y muestra las estadísticas descriptivas de los números en el archivo dado.
+    Los resultados se escriben en un archivo y se muestran en pantalla.
+    El archivo se lee línea por línea. Con metrics se miden las fases parse (que incluye la
+    lectura), compute, format y write.
+    Regresa un diccionario con las estadísticas, o None si el archivo no existe.
+    """
+    start_time = time.time()
+    numbers = []
+    statistics = None
+    try:
+        with open(filename, 'r', encoding='utf-8') as file:
+            metrics.count('bytes', os.fstat(file.fileno()).st_size)
+            lines = 0
+            with metrics.phase('parse'):
+                for lines, line in enumerate(file, 1):
+                    try:
+                        number = float(line.strip())
+                        numbers.append(number)
+                    except ValueError as val_error:
+                        metrics.count('invalid_rows')
+                        print(f"Invalid data found and skipped: {line.strip()} - Error: {val_error}")
+            metrics.count('lines', lines)
+
+        with metrics.phase('compute'):
+            mean = calculate_mean(numbers)
+            median = calculate_median(numbers)
+            mode = calculate_mode(numbers)
+            stdev = calculate_stdev(numbers)
+            variance = calculate_variance(numbers)
+            sample_variance = calculate_sample_variance(numbers)
+            statistics = {'count': len(numbers), 'mean': mean, 'median': median,
+                          'mode': mode, 'stdev': stdev, 'variance': variance,
+                          'sample_variance': sample_variance}
+
+        with metrics.phase('format'):
+            results = (f"Count: {len(numbers)}\n"
+                       f"Mean: {mean}\n"
+                       f"Median: {median}\n"
+                       f"Mode: {mode}\n"
+                       f"Standard Deviation: {stdev}\n"
+                       f"Variance: {variance}\n"
+                       f"Sample Variance: {sample_variance}")
+
+        with metrics.phase('write'):
+            print(results)
+            with open(filename+'.Results.txt', 'w', encoding='utf-8') as file:
+                file.write(results)
+
+    except FileNotFoundError as fnf_error:
+        print(f"File not found: {filename} - Error: {fnf_error}")
+    finally:
+        elapsed_time = time.time() - start_time
+        print(f"Execution Time: {elapsed_time} seconds")
+        with open('StatisticsResults.txt', 'a', encoding='utf-8') as file:
+            file.write(f"\nExecution Time: {elapsed_time} seconds")
+        metrics.emit()
+    return statistics
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Calcula estadísticas descriptivas de un archivo de números.")
+    parser.add_argument('filename')
+    parser.add_argument('--grouped', action='store_true',
+                        help="el archivo trae líneas 'clave valor'; calcula por clave")
+    parser.add_argument('--max-groups', type=int, default=MAX_GROUPS, metavar='N',
+                        help=f"claves distintas antes de acumular en {OTHER_GROUP}")
+    add_arguments(parser)
+    profiling.add_arguments(parser)
+    args = parser.parse_args()
+    with profiling.from_arguments(args, 'compute_statistics'):
+        if args.grouped:
+            compute_grouped_statistics(args.filename, args.max_groups,
+                                       from_arguments(args, 'compute_statistics'))
+        else:
+            compute_statistics(args.filename, from_arguments(args, 'compute_statistics'))
@@ -1,123 +1,234 @@
-"""
-Este módulo realiza la conversión de números de un archivo de texto a sus representaciones
-binarias y hexadecimales. Los resultados se imprimen en pantalla y se guardan en un archivo.
-"""
-
-import sys
-import time
-
-
-def to_binary(number):
-    """
-    Convierte un número entero a su representación binaria sin utilizar funciones incorporadas.
-    Incluye soporte para números negativos utilizando complemento a dos.
-    """
-    if number == 0:
-        return '0'
-
-    is_negative = number < 0
-    if is_negative:
-        number = -number
-
-    binary = ''
-    while number > 0:
-        binary = str(number % 2) + binary
-        number = number // 2
-
-    if is_negative:
-        # Complemento a uno
-        binary = ''.join('1' if b == '0' else '0' for b in binary)
-        # Complemento a dos
-        binary_list = list(binary)
-        # Encuentra el primer '0' desde la derecha (final de la lista)
-        for i in range(len(binary_list) - 1, -1, -1):
-            if binary_list[i] == '0':
-                binary_list[i] = '1'
-                break
-            binary_list[i] = '0'
-        else:
-            # Si todos son '1's, agrega '1' al inicio para manejar el overflow
-            binary_list.insert(0, '1')
-        binary = ''.join(binary_list)
-
-    return binary
-
-
-def to_hexadecimal(number):
-    """
-    Convierte un número entero a su representación hexadecimal sin utilizar funciones incorporadas.
-    Incluye soporte para números negativos utilizando complemento a dos.
-    """
-    if number == 0:
-        return '0'
-
-    is_negative = number < 0
-    if is_negative:
-        number = -number
-
-    hex_map = {0: '0', 1: '1', 2: '2', 3: '3', 4: '4', 5: '5', 6: '6', 7: '7',
-               8: '8', 9: '9', 10: 'A', 11: 'B', 12: 'C', 13: 'D', 14: 'E', 15: 'F'}
-    hexadecimal = ''
-    while number > 0:
-        hexadecimal = hex_map[number % 16] + hexadecimal
-        number = number // 16
-
-    if is_negative:
-        # Complemento a uno
-        hexadecimal = ''.join(hex_map[15 - int(h, 16)] for h in hexadecimal)
-        # Complemento a dos
-        hex_list = ['0' * (len(hexadecimal) - len(hexadecimal.lstrip('F')))
-                    + hexadecimal.lstrip('F')]
-        hex_list = list(hex_list[0])  # Convertir a lista para manipulación
-        carry = 1
-        for i in range(len(hex_list) - 1, -1, -1):
-            if carry == 0:
-                break
-            val = int(hex_list[i], 16) + carry
-            hex_list[i] = hex_map[val % 16]
-            carry = val // 16
-        if carry > 0:
-            hex_list.insert(0, hex_map[carry])
-        hexadecimal = ''.join(hex_list)
-
-    return hexadecimal
-
-
-def convert_numbers(filename):
-    """
-    Lee números de un archivo, los convierte a representaciones binarias y hexadecimales,
-    e imprime los resultados en pantalla y los guarda en un archivo.
-    Maneja valores no numéricos adecuadamente.
-    """
-    start_time = time.time()
-    try:
-        with open(filename, 'r', encoding='utf-8') as file:
-            numbers = []
-            for line in file:
-                try:
-                    number = int(line.strip())
-                    numbers.append(number)
-                except ValueError:
-                    print(f"Invalid data found and skipped: {line.strip()}")
-
-        with open(filename+'.P2.Results.txt', 'w', encoding='utf-8') as file:
-            for number in numbers:
-                binary = to_binary(number)
-                hexadecimal = to_hexadecimal(number)
-                result = f"{number} -> Binary: {binary}, Hexadecimal: {hexadecimal}"
-                print(result)
-                file.write(result + "\n")
-
-    except FileNotFoundError as fnf_error:
-        print(f"File not found: {filename} - Error: {fnf_error}")
-    finally:
-        elapsed_time = time.time() - start_time
-        print(f"Execution Time: {elapsed_time} seconds")
-        with open(filename+'.P2.Results.txt', 'a', encoding='utf-8') as file:
-            file.write(f"\nExecution Time: {elapsed_time} seconds")
-
-if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: python convert_numbers.py <filename>")
-    else:
-        convert_numbers(sys.argv[1])
+"""
+Este módulo realiza la conversión de números de un archivo de texto a sus representaciones
+binarias y hexadecimales. Los resultados se imprimen en pantalla y se guardan en un archivo.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import profiling
+from metrics import DISABLED, add_arguments, from_arguments
+
+# A partir de este número de bits se usa la conversión divide y vencerás
+LARGE_NUMBER_BITS = 256
+# Dígitos hexadecimales que se convierten uno por uno en la base de la recursión
+BLOCK_DIGITS = 64
+HEX_DIGITS = '0123456789ABCDEF'
+NIBBLES = {HEX_DIGITS[value]: ''.join('1' if value >> bit & 1 else '0' for bit in (3, 2, 1, 0))
+           for value in range(16)}
+
+
+def _append_hex(number, powers, level, padded, parts):
+    """
+    Agrega a parts los dígitos hexadecimales de number. En cada nivel lo parte en la mitad
+    alta y la baja con powers[level], que es 16 ** (BLOCK_DIGITS * 2 ** level) como
+    (corrimiento, máscara): al ser potencia de dos, partir cuesta tiempo lineal. Con padded
+    la parte se completa con ceros a la izquierda hasta el ancho de su nivel.
+    """
+    if level < 0:
+        digits = []
+        while number:
+            digits.append(HEX_DIGITS[number & 15])
+            number >>= 4
+        if padded:
+            digits.extend('0' * (BLOCK_DIGITS - len(digits)))
+        parts.append(''.join(reversed(digits)))
+        return
+    shift, mask = powers[level]
+    high = number >> shift
+    if high or padded:
+        _append_hex(high, powers, level - 1, padded, parts)
+        _append_hex(number & mask, powers, level - 1, True, parts)
+    else:
+        _append_hex(number, powers, level - 1, False, parts)
+
+
+def _hex_magnitude(number):
+    """
+    Regresa los dígitos hexadecimales de un entero positivo, precalculando las potencias
+    16 ** (BLOCK_DIGITS * 2 ** k) hasta la mitad de su tamaño.
+    """
+    powers = []
+    shift = BLOCK_DIGITS * 4
+    while number >> shift:
+        powers.append((shift, (1 << shift) - 1))
+        shift *= 2
+    parts = []
+    _append_hex(number, powers, len(powers) - 1, False, parts)
+    return ''.join(parts)
+
+
+def to_hexadecimal_fast(number):
+    """
+    Convierte un entero a hexadecimal por divide y vencerás, en tiempo casi lineal en vez de
+    cuadrático. Da el mismo resultado que to_hexadecimal, también en complemento a dos:
+    un negativo -n de D dígitos se escribe como 16 ** D - n con D dígitos.
+    """
+    if number == 0:
+        return '0'
+    if number > 0:
+        return _hex_magnitude(number)
+    width = len(_hex_magnitude(-number))
+    complement = _hex_magnitude((1 << 4 * width) + number)
+    return '0' * (width - len(complement)) + complement
+
+
+def to_binary_fast(number):
+    """
+    Convierte un entero a binario a partir de sus dígitos hexadecimales (cuatro bits cada
+    uno). Da el mismo resultado que to_binary, también en complemento a dos: un negativo
+    -n de L bits se escribe como 2 ** L - n con L bits.
+    """
+    if number == 0:
+        return '0'
+    if number > 0:
+        return ''.join(NIBBLES[digit] for digit in _hex_magnitude(number)).lstrip('0')
+    width = len(to_binary_fast(-number))
+    complement = to_binary_fast((1 << width) + number)
+    return '0' * (width - len(complement)) + complement
+
+
+def to_binary(number):
+    """
+    Convierte un número entero a su representación binaria sin utilizar funciones incorporadas.
+    Incluye soporte para números negativos utilizando complemento a dos.
+    Los números de más de LARGE_NUMBER_BITS bits se convierten con to_binary_fast.
+    """
+    if number == 0:
+        return '0'
+    if abs(number) >> LARGE_NUMBER_BITS:
+        return to_binary_fast(number)
+
+    is_negative = number < 0
+    if is_negative:
+        number = -number
+
+    binary = ''
+    while number > 0:
+        binary = str(number % 2) + binary
+        number = number // 2
+
+    if is_negative:
+        # Complemento a uno
+        binary = ''.join('1' if b == '0' else '0' for b in binary)
+        # Complemento a dos
+        binary_list = list(binary)
+        # Encuentra el primer '0' desde la derecha (final de la lista)
+        for i in range(len(binary_list) - 1, -1, -1):
+            if binary_list[i] == '0':
+                binary_list[i] = '1'
+                break
+            binary_list[i] = '0'
+        else:
+            # Si todos son '1's, agrega '1' al inicio para manejar el overflow
+            binary_list.insert(0, '1')
+        binary = ''.join(binary_list)
+
+    return binary
+
+
+def to_hexadecimal(number):
+    """
+    Convierte un número entero a su representación hexadecimal sin utilizar funciones incorporadas.
+    Incluye soporte para números negativos utilizando complemento a dos.
+    Los números de más de LARGE_NUMBER_BITS bits se convierten con to_hexadecimal_fast.
+    """
+    if number == 0:
+        return '0'
+    if abs(number) >> LARGE_NUMBER_BITS:
+        return to_hexadecimal_fast(number)
+
+    is_negative = number < 0
+    if is_negative:
+        number = -number
+
+    hex_map = {0: '0', 1: '1', 2: '2', 3: '3', 4: '4', 5: '5', 6: '6', 7: '7',
+               8: '8', 9: '9', 10: 'A', 11: 'B', 12: 'C', 13: 'D', 14: 'E', 15: 'F'}
+    hexadecimal = ''
+    while number > 0:
+        hexadecimal = hex_map[number % 16] + hexadecimal
+        number = number // 16
+
+    if is_negative:
+        # Complemento a uno
+        hexadecimal = ''.join(hex_map[15 - int(h, 16)] for h in hexadecimal)
+        # Complemento a dos
+        hex_list = ['0' * (len(hexadecimal) - len(hexadecimal.lstrip('F')))
+                    + hexadecimal.lstrip('F')]
+        hex_list = list(hex_list[0])  # Convertir a lista para manipulación
+        carry = 1
+        for i in range(len(hex_list) - 1, -1, -1):
+            if carry == 0:
+                break
+            val = int(hex_list[i], 16) + carry
+            hex_list[i] = hex_map[val % 16]
+            carry = val // 16
+        if carry > 0:
+            hex_list.insert(0, hex_map[carry])
+        hexadecimal = ''.join(hex_list)
+
+    return hexadecimal
+
+
+def convert_numbers(filename, metrics=DISABLED):
+    """
+    Lee números de un archivo, los convierte a representaciones binarias y hexadecimales,
+    e imprime los resultados en pantalla y los guarda en un archivo.
+    Maneja valores no numéricos adecuadamente.
+    El archivo se lee y cada resultado se escribe línea por línea. Con metrics se mide la
+    fase compute, que incluye la lectura y la escritura.
+    Regresa la lista de (número, binario, hexadecimal), o None si el archivo no existe.
+    """
+    start_time = time.time()
+    converted = None
+    digit_limit = None
+    if hasattr(sys, 'set_int_max_str_digits'):
+        # Desde Python 3.11 int() y str() rechazan enteros de más de 4300 dígitos; el
+        # límite se quita solo durante la conversión para no afectar al resto del proceso
+        digit_limit = sys.get_int_max_str_digits()
+        sys.set_int_max_str_digits(0)
+    try:
+        with open(filename, 'r', encoding='utf-8') as file, \
+                open(filename+'.P2.Results.txt', 'w', encoding='utf-8') as output:
+            metrics.count('bytes', os.fstat(file.fileno()).st_size)
+            converted = []
+            lines = 0
+            with metrics.phase('compute'):
+                for lines, line in enumerate(file, 1):
+                    try:
+                        number = int(line.strip())
+                    except ValueError:
+                        metrics.count('invalid_rows')
+                        print(f"Invalid data found and skipped: {line.strip()}")
+                        continue
+                    binary = to_binary(number)
+                    hexadecimal = to_hexadecimal(number)
+                    result = f"{number} -> Binary: {binary}, Hexadecimal: {hexadecimal}"
+                    print(result)
+                    output.write(result + "\n")
+                    converted.append((number, binary, hexadecimal))
+            metrics.count('lines', lines)
+
+    except FileNotFoundError as fnf_error:
+        print(f"File not found: {filename} - Error: {fnf_error}")
+    finally:
+        if digit_limit is not None:
+            sys.set_int_max_str_digits(digit_limit)
+        elapsed_time = time.time() - start_time
+        print(f"Execution Time: {elapsed_time} seconds")
+        with open(filename+'.P2.Results.txt', 'a', encoding='utf-8') as file:
+            file.write(f"\nExecution Time: {elapsed_time} seconds")
+        metrics.emit()
+    return converted
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Convierte los números de un archivo a binario y hexadecimal.")
+    parser.add_argument('filename')
+    add_arguments(parser)
+    profiling.add_arguments(parser)
+    args = parser.parse_args()
+    with profiling.from_arguments(args, 'convert_numbers'):
+        convert_numbers(args.filename, from_arguments(args, 'convert_numbers'))
@@ -0,0 +1,147 @@
+"""
+Este módulo ofrece una instrumentación ligera para los scripts: tiempo por fase con
+perf_counter_ns, contadores y pico de memoria, con salida en JSON o en texto de Prometheus.
+Con la instrumentación apagada se usa DISABLED, cuyas operaciones no hacen nada.
+"""
+
+import contextlib
+import json
+import sys
+import time
+
+try:
+    import resource
+except ImportError:  # Windows no tiene el módulo resource
+    resource = None
+
+FORMATS = ('json', 'prometheus')
+
+
+class _Phase:
+    """Context manager que suma el tiempo transcurrido a una fase."""
+
+    __slots__ = ('phases', 'name', 'started')
+
+    def __init__(self, phases, name):
+        self.phases = phases
+        self.name = name
+        self.started = 0
+
+    def __enter__(self):
+        self.started = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter_ns() - self.started
+        self.phases[self.name] = self.phases.get(self.name, 0) + elapsed
+        return False
+
+
+def peak_memory_bytes():
+    """Regresa el pico de memoria residente del proceso en bytes, si se conoce."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS lo reporta en bytes, Linux en KiB
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class Metrics:
+    """
+    Acumula el tiempo de fases con nombre (read, parse, compute, format, write)
+    y contadores (lines, invalid_rows, bytes) de una ejecución.
+    """
+
+    enabled = True
+
+    def __init__(self, script, output_format='json', filename=None):
+        self.script = script
+        self.output_format = output_format
+        self.filename = filename
+        self.phases = {}
+        self.counters = {}
+        self.started = time.perf_counter_ns()
+
+    def phase(self, name):
+        """Regresa un context manager que mide la fase con el nombre dado."""
+        return _Phase(self.phases, name)
+
+    def count(self, name, amount=1):
+        """Suma amount al contador con el nombre dado."""
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def to_dict(self):
+        """Regresa las métricas en segundos, con el total y el pico de memoria."""
+        return {'script': self.script,
+                'total_seconds': (time.perf_counter_ns() - self.started) / 1e9,
+                'phases': {name: elapsed / 1e9 for name, elapsed in self.phases.items()},
+                'counters': dict(self.counters),
+                'peak_memory_bytes': peak_memory_bytes()}
+
+    def to_json(self):
+        """Regresa las métricas como JSON."""
+        return json.dumps(self.to_dict())
+
+    def to_prometheus(self):
+        """Regresa las métricas en el formato de texto de Prometheus."""
+        data = self.to_dict()
+        label = f'script="{self.script}"'
+        lines = ["# TYPE script_total_seconds gauge",
+                 f"script_total_seconds{{{label}}} {data['total_seconds']}",
+                 "# TYPE script_phase_seconds gauge"]
+        lines += [f'script_phase_seconds{{{label},phase="{name}"}} {seconds}'
+                  for name, seconds in data['phases'].items()]
+        lines.append("# TYPE script_events_total counter")
+        lines += [f'script_events_total{{{label},name="{name}"}} {value}'
+                  for name, value in data['counters'].items()]
+        if data['peak_memory_bytes'] is not None:
+            lines += ["# TYPE script_peak_memory_bytes gauge",
+                      f"script_peak_memory_bytes{{{label}}} {data['peak_memory_bytes']}"]
+        return "\n".join(lines) + "\n"
+
+    def emit(self):
+        """Escribe las métricas en su formato al archivo de salida o a stderr."""
+        if self.output_format == 'prometheus':
+            text = self.to_prometheus()
+        else:
+            text = self.to_json() + "\n"
+        if self.filename is None:
+            sys.stderr.write(text)
+        else:
+            with open(self.filename, 'w', encoding='utf-8') as file:
+                file.write(text)
+
+
+class _DisabledMetrics:  # pylint: disable=unused-argument
+    """Métricas apagadas: fase y contadores no hacen nada."""
+
+    enabled = False
+    _phase = contextlib.nullcontext()
+
+    def phase(self, name):
+        """Regresa un context manager vacío."""
+        return self._phase
+
+    def count(self, name, amount=1):
+        """No cuenta nada."""
+
+    def emit(self):
+        """No escribe nada."""
+
+
+DISABLED = _DisabledMetrics()
+
+
+def add_arguments(parser):
+    """Agrega las opciones --metrics y --metrics-output a un ArgumentParser."""
+    parser.add_argument('--metrics', choices=FORMATS,
+                        help="emite tiempos por fase y contadores en este formato")
+    parser.add_argument('--metrics-output', metavar='FILE',
+                        help="archivo de salida de las métricas (por omisión stderr)")
+
+
+def from_arguments(args, script):
+    """Regresa Metrics si se pidió --metrics, o DISABLED."""
+    if not args.metrics:
+        return DISABLED
+    return Metrics(script, args.metrics, args.metrics_output)
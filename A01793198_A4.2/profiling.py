@@ -0,0 +1,178 @@
+"""
+Este módulo agrega la opción --profile a los scripts: perfilado con cProfile o por muestreo
+y snapshots de asignaciones con tracemalloc. Cada corrida escribe en su propio directorio
+las N funciones más costosas y los N sitios que más memoria asignan.
+"""
+
+import contextlib
+import cProfile
+import io
+import json
+import os
+import platform
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+
+PROFILERS = ('cprofile', 'sample')
+SAMPLE_INTERVAL = 0.001
+
+
+class Sampler(threading.Thread):
+    """
+    Perfilador por muestreo: cada SAMPLE_INTERVAL segundos toma la pila del hilo
+    perfilado y cuenta la función en ejecución (propia) y todas las de la pila (acumulada).
+    """
+
+    def __init__(self, thread_id, interval=SAMPLE_INTERVAL):
+        super().__init__(daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples = 0
+        self.own = Counter()
+        self.cumulative = Counter()
+        self._stopped = threading.Event()
+
+    def run(self):
+        while not self._stopped.wait(self.interval):
+            # pylint: disable=protected-access
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            self.samples += 1
+            self.own[_location(frame)] += 1
+            seen = set()
+            while frame is not None:
+                location = _location(frame)
+                if location not in seen:
+                    seen.add(location)
+                    self.cumulative[location] += 1
+                frame = frame.f_back
+
+    def stop(self):
+        """Detiene el muestreo y espera al hilo."""
+        self._stopped.set()
+        self.join()
+
+    def report(self, top):
+        """Regresa las top funciones por muestras propias y acumuladas."""
+        lines = [f"Samples: {self.samples} (interval {self.interval * 1000:g} ms)", "",
+                 "Own samples:"]
+        lines += [f"{count:>8} {count / max(self.samples, 1):>7.1%}  {location}"
+                  for location, count in self.own.most_common(top)]
+        lines += ["", "Cumulative samples:"]
+        lines += [f"{count:>8} {count / max(self.samples, 1):>7.1%}  {location}"
+                  for location, count in self.cumulative.most_common(top)]
+        return "\n".join(lines) + "\n"
+
+
+def _location(frame):
+    """Regresa archivo:línea(función) del código de un frame."""
+    code = frame.f_code
+    return f"{code.co_filename}:{code.co_firstlineno}({code.co_name})"
+
+
+def run_directory(base, script):
+    """Crea y regresa un directorio único para la corrida: base/script-fecha-pid."""
+    path = os.path.join(base, f"{script}-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _write(directory, name, text):
+    """Escribe un archivo de texto del reporte."""
+    with open(os.path.join(directory, name), 'w', encoding='utf-8') as file:
+        file.write(text)
+
+
+def _cprofile_report(profiler, top):
+    """Regresa las top funciones por tiempo acumulado y por tiempo propio."""
+    output = io.StringIO()
+    stats = pstats.Stats(profiler, stream=output)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+    stats.sort_stats(pstats.SortKey.TIME).print_stats(top)
+    return output.getvalue()
+
+
+def _allocation_report(snapshot, peak, top):
+    """Regresa los top sitios de asignación de un snapshot de tracemalloc."""
+    statistics = snapshot.statistics('lineno')
+    total = sum(stat.size for stat in statistics)
+    lines = [f"Peak traced memory: {peak / 1024:.1f} KiB",
+             f"Live at exit: {total / 1024:.1f} KiB in {len(statistics)} sites", ""]
+    lines += [str(stat) for stat in statistics[:top]]
+    return "\n".join(lines) + "\n"
+
+
+@contextlib.contextmanager
+def profile_run(script, profiler=None, memory=False, base='profiles', top=25):
+    """
+    Perfila el bloque y escribe los reportes en un directorio nuevo dentro de base:
+    hot_functions.txt (y profile.pstats con cProfile), allocations.txt y
+    allocations.snapshot con tracemalloc, y run.json con los datos de la corrida.
+    """
+    directory = run_directory(base, script)
+    sampler = None
+    cprofiler = None
+    if profiler == 'cprofile':
+        cprofiler = cProfile.Profile()
+        cprofiler.enable()
+    elif profiler == 'sample':
+        sampler = Sampler(threading.get_ident())
+        sampler.start()
+    if memory:
+        tracemalloc.start()
+    started = time.perf_counter()
+    try:
+        yield directory
+    finally:
+        elapsed = time.perf_counter() - started
+        if cprofiler is not None:
+            cprofiler.disable()
+        if sampler is not None:
+            sampler.stop()
+        if memory:
+            # El snapshot se toma antes de generar los demás reportes
+            snapshot = tracemalloc.take_snapshot().filter_traces(
+                (tracemalloc.Filter(False, tracemalloc.__file__),
+                 tracemalloc.Filter(False, __file__)))
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            snapshot.dump(os.path.join(directory, 'allocations.snapshot'))
+        if cprofiler is not None:
+            cprofiler.dump_stats(os.path.join(directory, 'profile.pstats'))
+            _write(directory, 'hot_functions.txt', _cprofile_report(cprofiler, top))
+        if sampler is not None:
+            _write(directory, 'hot_functions.txt', sampler.report(top))
+        if memory:
+            _write(directory, 'allocations.txt', _allocation_report(snapshot, peak, top))
+        _write(directory, 'run.json', json.dumps({'script': script,
+                                                  'argv': sys.argv,
+                                                  'profiler': profiler,
+                                                  'memory': memory,
+                                                  'elapsed_seconds': elapsed,
+                                                  'python': platform.python_version()},
+                                                 indent=2))
+
+
+def add_arguments(parser):
+    """Agrega las opciones de perfilado a un ArgumentParser."""
+    parser.add_argument('--profile', choices=PROFILERS,
+                        help="perfila la corrida con cProfile o por muestreo")
+    parser.add_argument('--profile-memory', action='store_true',
+                        help="toma un snapshot de asignaciones con tracemalloc")
+    parser.add_argument('--profile-dir', default='profiles',
+                        help="directorio base de los reportes (uno nuevo por corrida)")
+    parser.add_argument('--profile-top', type=int, default=25, metavar='N',
+                        help="número de funciones y sitios en los reportes")
+
+
+def from_arguments(args, script):
+    """Regresa el context manager de perfilado pedido, o uno vacío."""
+    if not args.profile and not args.profile_memory:
+        return contextlib.nullcontext()
+    return profile_run(script, args.profile, args.profile_memory,
+                       args.profile_dir, args.profile_top)
@@ -1,46 +1,67 @@
-"""
-Este módulo cuenta la frecuencia de cada palabra en un archivo de texto. Las palabras se
-consideran distintas sin importar su capitalización. Los resultados se imprimen en pantalla
-y se guardan en un archivo.
-"""
-
-import sys
-import time
-
-def count_words(filename):
-    """
-    Lee un archivo de texto, cuenta la frecuencia de cada palabra y guarda los resultados
-    en un archivo. Las palabras inválidas se omiten y se informa en la consola.
-    """
-    start_time = time.time()
-    word_count = {}
-    try:
-        with open(filename, 'r', encoding='utf-8') as file:
-            for line in file:
-                words = line.strip().split()
-                for word in words:
-                    if word.isalpha():
-                        word = word.lower()
-                        word_count[word] = word_count.get(word, 0) + 1
-                    else:
-                        print(f"Invalid data found and skipped: {word}")
-
-        with open(filename+'.P3.Results.txt', 'w', encoding='utf-8') as file:
-            for word, count in word_count.items():
-                result = f"{word}: {count}"
-                print(result)
-                file.write(result + "\n")
-
-    except FileNotFoundError as file_not_found_error:
-        print(f"File not found: {filename} - Error: {file_not_found_error}")
-    finally:
-        elapsed_time = time.time() - start_time
-        print(f"Execution Time: {elapsed_time} seconds")
-        with open(filename+'.P3.Results.txt', 'a', encoding='utf-8') as file:
-            file.write(f"\nExecution Time: {elapsed_time} seconds")
-
-if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: python word_count.py <filename>")
-    else:
-        count_words(sys.argv[1])
+"""
+Este módulo cuenta la frecuencia de cada palabra en un archivo de texto. Las palabras se
+consideran distintas sin importar su capitalización. Los resultados se imprimen en pantalla
+y se guardan en un archivo.
+"""
+
+import argparse
+import os
+import time
+
+import profiling
+from metrics import DISABLED, add_arguments, from_arguments
+
+def count_words(filename, metrics=DISABLED):
+    """
+    Lee un archivo de texto, cuenta la frecuencia de cada palabra y guarda los resultados
+    en un archivo. Las palabras inválidas se omiten y se informa en la consola.
+    El archivo se lee línea por línea. Con metrics se miden las fases compute (que incluye
+    la lectura) y write.
+    Regresa el diccionario de frecuencias, o None si el archivo no existe.
+    """
+    start_time = time.time()
+    word_count = {}
+    try:
+        with open(filename, 'r', encoding='utf-8') as file:
+            metrics.count('bytes', os.fstat(file.fileno()).st_size)
+            lines = 0
+            with metrics.phase('compute'):
+                for lines, line in enumerate(file, 1):
+                    words = line.strip().split()
+                    for word in words:
+                        if word.isalpha():
+                            word = word.lower()
+                            word_count[word] = word_count.get(word, 0) + 1
+                        else:
+                            metrics.count('invalid_rows')
+                            print(f"Invalid data found and skipped: {word}")
+            metrics.count('lines', lines)
+        metrics.count('words', sum(word_count.values()))
+
+        with metrics.phase('write'):
+            with open(filename+'.P3.Results.txt', 'w', encoding='utf-8') as file:
+                for word, count in word_count.items():
+                    result = f"{word}: {count}"
+                    print(result)
+                    file.write(result + "\n")
+
+    except FileNotFoundError as file_not_found_error:
+        print(f"File not found: {filename} - Error: {file_not_found_error}")
+        word_count = None
+    finally:
+        elapsed_time = time.time() - start_time
+        print(f"Execution Time: {elapsed_time} seconds")
+        with open(filename+'.P3.Results.txt', 'a', encoding='utf-8') as file:
+            file.write(f"\nExecution Time: {elapsed_time} seconds")
+        metrics.emit()
+    return word_count
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Cuenta la frecuencia de cada palabra de un archivo de texto.")
+    parser.add_argument('filename')
+    add_arguments(parser)
+    profiling.add_arguments(parser)
+    args = parser.parse_args()
+    with profiling.from_arguments(args, 'word_count'):
+        count_words(args.filename, from_arguments(args, 'word_count'))
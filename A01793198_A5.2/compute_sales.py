@@ -1,96 +1,314 @@
-"""
-This module contains functions to compute and report total sales
-from a given product catalog and sales record in JSON format.
-"""
-
-import json
-import sys
-import time
-
-
-def load_json_data(file_path):
-    """
-    Load and return the JSON data from a given file path.
-    Handles JSON decoding errors and file not found errors.
-    """
-    try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            return json.load(file)
-    except json.JSONDecodeError as error:
-        print(f"Error decoding JSON from {file_path}: {error}")
-    except FileNotFoundError:
-        print(f"File {file_path} not found.")
-    return None
-
-
-def calculate_total_sales(product_list, sales):
-    """
-    Calculate and return the total sales for each product
-    and the grand total of all sales.
-    """
-    if product_list is None or sales is None:
-        return {}, 0
-    total_sales = {}
-    grand_total = 0
-    for sale in sales:
-        product_name = sale['Product']
-        quantity = sale['Quantity']
-        for product in product_list:
-            if product['title'] == product_name:
-                if product_name not in total_sales:
-                    total_sales[product_name] = {'total_cost': 0,
-                                                 'quantity': 0}
-                total_cost = quantity * product['price']
-                total_sales[product_name]['total_cost'] += total_cost
-                total_sales[product_name]['quantity'] += quantity
-                grand_total += total_cost
-    return total_sales, grand_total
-
-
-def write_results_to_file(results, grand_total, file_name="SalesResults.txt"):
-    """
-    Write the sales results and the grand total to a specified file.
-    """
-    with open(file_name, 'w', encoding='utf-8') as file:
-        for product, details in results.items():
-            file.write(f"{product}: Quantity Sold: {details['quantity']}, "
-                       f"Total Sales: ${details['total_cost']:.2f}\n")
-        file.write(f"\nGrand Total of All Sales: ${grand_total:.2f}\n")
-
-
-def main(product_list_file, sales_file):
-    """
-    Main function to load the product list and sales data,
-    compute the total sales, and write the results to a file.
-    """
-    start_time = time.time()
-    product_list = load_json_data(product_list_file)
-    sales = load_json_data(sales_file)
-
-    if product_list is None or sales is None:
-        print("Error in input files. Exiting...")
-        sys.exit(1)
-
-    total_sales, grand_total = calculate_total_sales(product_list, sales)
-
-    for product, details in total_sales.items():
-        print(f"{product}: Quantity Sold: {details['quantity']}, "
-              f"Total Sales: ${details['total_cost']:.2f}")
-
-    print(f"\nGrand Total of All Sales: ${grand_total:.2f}")
-    write_results_to_file(total_sales, grand_total)
-
-    elapsed_time = time.time() - start_time
-    print(f"Execution and calculus time: {elapsed_time:.2f} seconds.")
-    with open("SalesResults.txt", 'a', encoding='utf-8') as file:
-        file.write(f"Execution and calculus time: "
-                   f"{elapsed_time:.2f} seconds.\n")
-
-
-if __name__ == "__main__":
-    if len(sys.argv) < 3:
-        print("Usage: python computeSales.py "
-              "priceCatalogue.json salesRecord.json")
-        sys.exit(1)
-
-    main(sys.argv[1], sys.argv[2])
+"""
+This module contains functions to compute and report total sales
+from a given product catalog and sales record in JSON format.
+With --follow, the sales record is an append-only JSON Lines file and
+the totals are kept up to date as new sales arrive.
+"""
+
+import argparse
+import json
+import os
+import signal
+import sys
+import time
+
+import profiling
+from metrics import DISABLED, add_arguments, from_arguments
+
+FOLLOW_INTERVAL = 5.0
+POLL_INTERVAL = 0.5
+
+
+def load_json_data(file_path, metrics=DISABLED):
+    """
+    Load and return the JSON data from a given file path.
+    Handles JSON decoding errors and file not found errors.
+    """
+    try:
+        with open(file_path, 'r', encoding='utf-8') as file:
+            with metrics.phase('read'):
+                text = file.read()
+            metrics.count('bytes', os.fstat(file.fileno()).st_size)
+        with metrics.phase('parse'):
+            return json.loads(text)
+    except json.JSONDecodeError as error:
+        print(f"Error decoding JSON from {file_path}: {error}")
+    except FileNotFoundError:
+        print(f"File {file_path} not found.")
+    return None
+
+
+class SalesTotals:
+    """
+    Per-product totals and the grand total, updated one sale at a time.
+    Prices are indexed by title, so each sale costs O(1) instead of a
+    scan of the whole catalogue.
+    """
+
+    def __init__(self, product_list):
+        self.prices = {}
+        for product in product_list:
+            # A title listed twice is charged once per entry, as before
+            self.prices.setdefault(product['title'], []).append(
+                product['price'])
+        self.total_sales = {}
+        self.grand_total = 0
+        self.records = 0
+
+    def add(self, sale):
+        """
+        Apply one sale to the totals. Unknown products are ignored.
+        A sale without a Product or a numeric Quantity raises KeyError
+        or TypeError before any total changes.
+        """
+        product_name = sale['Product']
+        quantity = sale['Quantity']
+        if isinstance(quantity, bool) \
+                or not isinstance(quantity, (int, float)):
+            raise TypeError(f"Quantity must be a number, not {quantity!r}.")
+        self.records += 1
+        for price in self.prices.get(product_name, ()):
+            if product_name not in self.total_sales:
+                self.total_sales[product_name] = {'total_cost': 0,
+                                                  'quantity': 0}
+            total_cost = quantity * price
+            self.total_sales[product_name]['total_cost'] += total_cost
+            self.total_sales[product_name]['quantity'] += quantity
+            self.grand_total += total_cost
+
+
+def calculate_total_sales(product_list, sales):
+    """
+    Calculate and return the total sales for each product
+    and the grand total of all sales.
+    """
+    if product_list is None or sales is None:
+        return {}, 0
+    totals = SalesTotals(product_list)
+    for sale in sales:
+        totals.add(sale)
+    return totals.total_sales, totals.grand_total
+
+
+def write_results_to_file(results, grand_total, file_name="SalesResults.txt"):
+    """
+    Write the sales results and the grand total to a specified file.
+    """
+    with open(file_name, 'w', encoding='utf-8') as file:
+        for product, details in results.items():
+            file.write(f"{product}: Quantity Sold: {details['quantity']}, "
+                       f"Total Sales: ${details['total_cost']:.2f}\n")
+        file.write(f"\nGrand Total of All Sales: ${grand_total:.2f}\n")
+
+
+def replace_results_file(results, grand_total, file_name, footer):
+    """
+    Write the results and a footer line to a temporary file and move
+    it over file_name, so readers never see a partially written file.
+    """
+    temporary = f"{file_name}.{os.getpid()}.tmp"
+    write_results_to_file(results, grand_total, temporary)
+    with open(temporary, 'a', encoding='utf-8') as file:
+        file.write(footer + "\n")
+    os.replace(temporary, file_name)
+
+
+class SalesFollower:
+    """
+    Tail an append-only JSON Lines sales file from the last byte offset
+    read and apply each new sale to the totals, so every poll costs
+    O(new records). A partial last line is kept until it is completed.
+    """
+
+    def __init__(self, product_list, sales_file,
+                 results_file="SalesResults.txt", metrics=DISABLED):
+        self.product_list = product_list
+        self.sales_file = sales_file
+        self.results_file = results_file
+        self.metrics = metrics
+        self.totals = SalesTotals(product_list)
+        self.offset = 0
+        self.pending = b""
+        self.write_requested = False
+        self.stop_requested = False
+
+    def request_write(self, *_):
+        """
+        Ask for the results to be rewritten at the next poll. Also used
+        as the SIGUSR1 handler.
+        """
+        self.write_requested = True
+
+    def request_stop(self, *_):
+        """
+        Ask the follow loop to finish after its next poll. Also used as
+        the SIGTERM handler.
+        """
+        self.stop_requested = True
+
+    def poll(self):
+        """
+        Apply the sales appended since the last poll and return how many
+        were applied. If the file shrank, it was truncated or replaced,
+        so the totals start over from its beginning.
+        """
+        try:
+            size = os.path.getsize(self.sales_file)
+        except FileNotFoundError:
+            return 0
+        if size < self.offset:
+            print(f"{self.sales_file} was truncated, starting over.")
+            self.totals = SalesTotals(self.product_list)
+            self.offset = 0
+            self.pending = b""
+        if size == self.offset:
+            return 0
+        with open(self.sales_file, 'rb') as file:
+            file.seek(self.offset)
+            with self.metrics.phase('read'):
+                data = file.read(size - self.offset)
+        self.offset += len(data)
+        self.metrics.count('bytes', len(data))
+        lines = (self.pending + data).split(b"\n")
+        self.pending = lines.pop()
+        applied = 0
+        with self.metrics.phase('compute'):
+            for line in lines:
+                if not line.strip():
+                    continue
+                try:
+                    self.totals.add(json.loads(line))
+                    applied += 1
+                except (ValueError, KeyError, TypeError) as error:
+                    self.metrics.count('invalid_rows')
+                    print(f"Invalid sale skipped: {line[:80]!r} - {error}")
+        self.metrics.count('records', applied)
+        return applied
+
+    def write(self):
+        """
+        Atomically rewrite the results file with the current totals.
+        """
+        self.write_requested = False
+        with self.metrics.phase('write'):
+            replace_results_file(
+                self.totals.total_sales, self.totals.grand_total,
+                self.results_file,
+                f"Records processed: {self.totals.records}, "
+                f"updated {time.strftime('%Y-%m-%d %H:%M:%S')}.")
+
+    def run(self, interval=FOLLOW_INTERVAL, poll_interval=POLL_INTERVAL):
+        """
+        Poll the sales file until stopped or interrupted, rewriting the
+        results every interval seconds when there are new sales, or as
+        soon as a write is requested. A last write is made on exit.
+        """
+        last_write = time.monotonic()
+        changed = True
+        try:
+            while not self.stop_requested:
+                changed = self.poll() > 0 or changed
+                now = time.monotonic()
+                if self.write_requested or (
+                        changed and now - last_write >= interval):
+                    self.write()
+                    last_write = now
+                    changed = False
+                time.sleep(poll_interval)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.write()
+
+
+def main(product_list_file, sales_file, metrics=DISABLED,
+         results_file="SalesResults.txt"):
+    """
+    Main function to load the product list and sales data,
+    compute the total sales, and write the results to a file.
+    With metrics, the read, parse, compute, format and write phases
+    are timed. Return the per-product totals and the grand total.
+    """
+    start_time = time.time()
+    product_list = load_json_data(product_list_file, metrics)
+    sales = load_json_data(sales_file, metrics)
+
+    if product_list is None or sales is None:
+        print("Error in input files. Exiting...")
+        metrics.emit()
+        sys.exit(1)
+    metrics.count('products', len(product_list))
+    metrics.count('records', len(sales))
+
+    with metrics.phase('compute'):
+        total_sales, grand_total = calculate_total_sales(product_list,
+                                                         sales)
+
+    with metrics.phase('format'):
+        lines = [f"{product}: Quantity Sold: {details['quantity']}, "
+                 f"Total Sales: ${details['total_cost']:.2f}"
+                 for product, details in total_sales.items()]
+
+    with metrics.phase('write'):
+        for line in lines:
+            print(line)
+        print(f"\nGrand Total of All Sales: ${grand_total:.2f}")
+        write_results_to_file(total_sales, grand_total, results_file)
+
+    elapsed_time = time.time() - start_time
+    print(f"Execution and calculus time: {elapsed_time:.2f} seconds.")
+    with open(results_file, 'a', encoding='utf-8') as file:
+        file.write(f"Execution and calculus time: "
+                   f"{elapsed_time:.2f} seconds.\n")
+    metrics.emit()
+    return total_sales, grand_total
+
+
+def follow(product_list_file, sales_file, interval=FOLLOW_INTERVAL,
+           results_file="SalesResults.txt", metrics=DISABLED):
+    """
+    Follow a JSON Lines sales file and keep the results file current.
+    SIGUSR1 asks for an immediate rewrite where the platform has it,
+    and SIGTERM stops following after a last rewrite.
+    """
+    product_list = load_json_data(product_list_file, metrics)
+    if product_list is None:
+        print("Error in input files. Exiting...")
+        metrics.emit()
+        sys.exit(1)
+    metrics.count('products', len(product_list))
+    follower = SalesFollower(product_list, sales_file, results_file,
+                             metrics)
+    if hasattr(signal, 'SIGUSR1'):
+        signal.signal(signal.SIGUSR1, follower.request_write)
+    signal.signal(signal.SIGTERM, follower.request_stop)
+    print(f"Following {sales_file}, writing {results_file} "
+          f"every {interval:g} seconds. Press Ctrl+C to stop.")
+    follower.run(interval)
+    print(f"\nGrand Total of All Sales: "
+          f"${follower.totals.grand_total:.2f}")
+    metrics.emit()
+    return follower.totals.total_sales, follower.totals.grand_total
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compute total sales from a price catalogue "
+                    "and a sales record.")
+    parser.add_argument('product_list_file', metavar='priceCatalogue.json')
+    parser.add_argument('sales_file', metavar='salesRecord.json')
+    parser.add_argument('--follow', action='store_true',
+                        help="follow an append-only JSON Lines sales file")
+    parser.add_argument('--interval', type=float, default=FOLLOW_INTERVAL,
+                        help="seconds between rewrites of the results "
+                             "file in follow mode")
+    add_arguments(parser)
+    profiling.add_arguments(parser)
+    args = parser.parse_args()
+    with profiling.from_arguments(args, 'compute_sales'):
+        if args.follow:
+            follow(args.product_list_file, args.sales_file, args.interval,
+                   metrics=from_arguments(args, 'compute_sales'))
+        else:
+            main(args.product_list_file, args.sales_file,
+                 from_arguments(args, 'compute_sales'))
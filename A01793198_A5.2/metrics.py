@@ -0,0 +1,177 @@
+"""
+This module provides lightweight run instrumentation: per-phase timing
+with perf_counter_ns, counters and peak memory, emitted as JSON or as
+Prometheus text. When instrumentation is off, DISABLED is used and all
+of its operations do nothing.
+"""
+
+import contextlib
+import json
+import sys
+import time
+
+try:
+    import resource
+except ImportError:  # The resource module is not available on Windows
+    resource = None
+
+FORMATS = ('json', 'prometheus')
+
+
+class _Phase:
+    """Context manager that adds the elapsed time to a phase."""
+
+    __slots__ = ('phases', 'name', 'started')
+
+    def __init__(self, phases, name):
+        self.phases = phases
+        self.name = name
+        self.started = 0
+
+    def __enter__(self):
+        self.started = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter_ns() - self.started
+        self.phases[self.name] = self.phases.get(self.name, 0) + elapsed
+        return False
+
+
+def peak_memory_bytes():
+    """
+    Return the peak resident memory of the process in bytes, if known.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux reports KiB
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class Metrics:
+    """
+    Accumulate named phase timings (read, parse, compute, format, write)
+    and counters (records, products, bytes) for a single run.
+    """
+
+    enabled = True
+
+    def __init__(self, script, output_format='json', filename=None):
+        self.script = script
+        self.output_format = output_format
+        self.filename = filename
+        self.phases = {}
+        self.counters = {}
+        self.started = time.perf_counter_ns()
+
+    def phase(self, name):
+        """
+        Return a context manager that times the named phase.
+        """
+        return _Phase(self.phases, name)
+
+    def count(self, name, amount=1):
+        """
+        Add amount to the named counter.
+        """
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def to_dict(self):
+        """
+        Return the metrics in seconds, with the total and the peak memory.
+        """
+        return {'script': self.script,
+                'total_seconds':
+                    (time.perf_counter_ns() - self.started) / 1e9,
+                'phases': {name: elapsed / 1e9
+                           for name, elapsed in self.phases.items()},
+                'counters': dict(self.counters),
+                'peak_memory_bytes': peak_memory_bytes()}
+
+    def to_json(self):
+        """
+        Return the metrics as JSON.
+        """
+        return json.dumps(self.to_dict())
+
+    def to_prometheus(self):
+        """
+        Return the metrics in the Prometheus text exposition format.
+        """
+        data = self.to_dict()
+        label = f'script="{self.script}"'
+        lines = ["# TYPE script_total_seconds gauge",
+                 f"script_total_seconds{{{label}}} {data['total_seconds']}",
+                 "# TYPE script_phase_seconds gauge"]
+        lines += [f'script_phase_seconds{{{label},phase="{name}"}} '
+                  f'{seconds}'
+                  for name, seconds in data['phases'].items()]
+        lines.append("# TYPE script_events_total counter")
+        lines += [f'script_events_total{{{label},name="{name}"}} {value}'
+                  for name, value in data['counters'].items()]
+        if data['peak_memory_bytes'] is not None:
+            lines += ["# TYPE script_peak_memory_bytes gauge",
+                      f"script_peak_memory_bytes{{{label}}} "
+                      f"{data['peak_memory_bytes']}"]
+        return "\n".join(lines) + "\n"
+
+    def emit(self):
+        """
+        Write the metrics in their format to the output file or stderr.
+        """
+        if self.output_format == 'prometheus':
+            text = self.to_prometheus()
+        else:
+            text = self.to_json() + "\n"
+        if self.filename is None:
+            sys.stderr.write(text)
+        else:
+            with open(self.filename, 'w', encoding='utf-8') as file:
+                file.write(text)
+
+
+class _DisabledMetrics:  # pylint: disable=unused-argument
+    """Metrics switched off: phases and counters do nothing."""
+
+    enabled = False
+    _phase = contextlib.nullcontext()
+
+    def phase(self, name):
+        """
+        Return an empty context manager.
+        """
+        return self._phase
+
+    def count(self, name, amount=1):
+        """
+        Count nothing.
+        """
+
+    def emit(self):
+        """
+        Write nothing.
+        """
+
+
+DISABLED = _DisabledMetrics()
+
+
+def add_arguments(parser):
+    """
+    Add the --metrics and --metrics-output options to an ArgumentParser.
+    """
+    parser.add_argument('--metrics', choices=FORMATS,
+                        help="emit phase timings and counters in this "
+                             "format")
+    parser.add_argument('--metrics-output', metavar='FILE',
+                        help="metrics output file (stderr by default)")
+
+
+def from_arguments(args, script):
+    """
+    Return Metrics if --metrics was given, otherwise DISABLED.
+    """
+    if not args.metrics:
+        return DISABLED
+    return Metrics(script, args.metrics, args.metrics_output)
@@ -0,0 +1,208 @@
+"""
+This module adds the --profile options to the script: deterministic
+profiling with cProfile or a sampling profiler, plus allocation
+snapshots with tracemalloc. Each run writes the top N hottest functions
+and the top N allocation sites into a directory of its own.
+"""
+
+import contextlib
+import cProfile
+import io
+import json
+import os
+import platform
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+
+PROFILERS = ('cprofile', 'sample')
+SAMPLE_INTERVAL = 0.001
+
+
+class Sampler(threading.Thread):
+    """
+    Sampling profiler: every SAMPLE_INTERVAL seconds it takes the stack
+    of the profiled thread and counts the running function (own) and
+    every function on the stack (cumulative).
+    """
+
+    def __init__(self, thread_id, interval=SAMPLE_INTERVAL):
+        super().__init__(daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples = 0
+        self.own = Counter()
+        self.cumulative = Counter()
+        self._stopped = threading.Event()
+
+    def run(self):
+        while not self._stopped.wait(self.interval):
+            # pylint: disable=protected-access
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            self.samples += 1
+            self.own[_location(frame)] += 1
+            seen = set()
+            while frame is not None:
+                location = _location(frame)
+                if location not in seen:
+                    seen.add(location)
+                    self.cumulative[location] += 1
+                frame = frame.f_back
+
+    def stop(self):
+        """
+        Stop sampling and wait for the thread.
+        """
+        self._stopped.set()
+        self.join()
+
+    def report(self, top):
+        """
+        Return the top functions by own and cumulative samples.
+        """
+        total = max(self.samples, 1)
+        lines = [f"Samples: {self.samples} "
+                 f"(interval {self.interval * 1000:g} ms)", "",
+                 "Own samples:"]
+        lines += [f"{count:>8} {count / total:>7.1%}  {location}"
+                  for location, count in self.own.most_common(top)]
+        lines += ["", "Cumulative samples:"]
+        lines += [f"{count:>8} {count / total:>7.1%}  {location}"
+                  for location, count in self.cumulative.most_common(top)]
+        return "\n".join(lines) + "\n"
+
+
+def _location(frame):
+    """
+    Return file:line(function) for the code of a frame.
+    """
+    code = frame.f_code
+    return f"{code.co_filename}:{code.co_firstlineno}({code.co_name})"
+
+
+def run_directory(base, script):
+    """
+    Create and return a unique directory for the run: base/script-date-pid.
+    """
+    path = os.path.join(base, f"{script}-{time.strftime('%Y%m%d-%H%M%S')}"
+                              f"-{os.getpid()}")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _write(directory, name, text):
+    """
+    Write one text file of the report.
+    """
+    with open(os.path.join(directory, name), 'w', encoding='utf-8') as file:
+        file.write(text)
+
+
+def _cprofile_report(profiler, top):
+    """
+    Return the top functions by cumulative time and by own time.
+    """
+    output = io.StringIO()
+    stats = pstats.Stats(profiler, stream=output)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+    stats.sort_stats(pstats.SortKey.TIME).print_stats(top)
+    return output.getvalue()
+
+
+def _allocation_report(snapshot, peak, top):
+    """
+    Return the top allocation sites of a tracemalloc snapshot.
+    """
+    statistics = snapshot.statistics('lineno')
+    total = sum(stat.size for stat in statistics)
+    lines = [f"Peak traced memory: {peak / 1024:.1f} KiB",
+             f"Live at exit: {total / 1024:.1f} KiB "
+             f"in {len(statistics)} sites", ""]
+    lines += [str(stat) for stat in statistics[:top]]
+    return "\n".join(lines) + "\n"
+
+
+@contextlib.contextmanager
+def profile_run(script, profiler=None, memory=False, base='profiles',
+                top=25):
+    """
+    Profile the block and write the reports into a new directory under
+    base: hot_functions.txt (and profile.pstats with cProfile),
+    allocations.txt and allocations.snapshot with tracemalloc, and
+    run.json with the details of the run.
+    """
+    directory = run_directory(base, script)
+    sampler = None
+    cprofiler = None
+    if profiler == 'cprofile':
+        cprofiler = cProfile.Profile()
+        cprofiler.enable()
+    elif profiler == 'sample':
+        sampler = Sampler(threading.get_ident())
+        sampler.start()
+    if memory:
+        tracemalloc.start()
+    started = time.perf_counter()
+    try:
+        yield directory
+    finally:
+        elapsed = time.perf_counter() - started
+        if cprofiler is not None:
+            cprofiler.disable()
+        if sampler is not None:
+            sampler.stop()
+        if memory:
+            # The snapshot is taken before building the other reports
+            snapshot = tracemalloc.take_snapshot().filter_traces(
+                (tracemalloc.Filter(False, tracemalloc.__file__),
+                 tracemalloc.Filter(False, __file__)))
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            snapshot.dump(os.path.join(directory, 'allocations.snapshot'))
+        if cprofiler is not None:
+            cprofiler.dump_stats(os.path.join(directory, 'profile.pstats'))
+            _write(directory, 'hot_functions.txt',
+                   _cprofile_report(cprofiler, top))
+        if sampler is not None:
+            _write(directory, 'hot_functions.txt', sampler.report(top))
+        if memory:
+            _write(directory, 'allocations.txt',
+                   _allocation_report(snapshot, peak, top))
+        _write(directory, 'run.json',
+               json.dumps({'script': script,
+                           'argv': sys.argv,
+                           'profiler': profiler,
+                           'memory': memory,
+                           'elapsed_seconds': elapsed,
+                           'python': platform.python_version()},
+                          indent=2))
+
+
+def add_arguments(parser):
+    """
+    Add the profiling options to an ArgumentParser.
+    """
+    parser.add_argument('--profile', choices=PROFILERS,
+                        help="profile the run with cProfile or by sampling")
+    parser.add_argument('--profile-memory', action='store_true',
+                        help="take a tracemalloc allocation snapshot")
+    parser.add_argument('--profile-dir', default='profiles',
+                        help="base directory of the reports "
+                             "(a new one per run)")
+    parser.add_argument('--profile-top', type=int, default=25, metavar='N',
+                        help="number of functions and sites in the reports")
+
+
+def from_arguments(args, script):
+    """
+    Return the requested profiling context manager, or an empty one.
+    """
+    if not args.profile and not args.profile_memory:
+        return contextlib.nullcontext()
+    return profile_run(script, args.profile, args.profile_memory,
+                       args.profile_dir, args.profile_top)
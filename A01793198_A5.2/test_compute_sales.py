@@ -0,0 +1,74 @@
+"""Unit tests for following a JSON Lines sales file."""
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from compute_sales import SalesFollower
+
+PRODUCTS = [{"title": "Coffee", "price": 2.5},
+            {"title": "Tea", "price": 1.5}]
+
+
+class TestSalesFollower(unittest.TestCase):
+    """Class that groups the unit tests
+    needed for SalesFollower.poll."""
+    def setUp(self):
+        """Create an empty sales file in a temporary directory."""
+        self.directory = tempfile.mkdtemp()
+        self.sales_file = os.path.join(self.directory, "sales.jsonl")
+        self.write("", "w")
+        self.follower = SalesFollower(
+            PRODUCTS, self.sales_file,
+            os.path.join(self.directory, "SalesResults.txt"))
+
+    def write(self, text, mode="a"):
+        """Write text to the sales file."""
+        with open(self.sales_file, mode, encoding="utf-8") as file:
+            file.write(text)
+
+    @staticmethod
+    def sale(product, quantity):
+        """Return one sale as a JSON line."""
+        return json.dumps({"Product": product, "Quantity": quantity}) + "\n"
+
+    def test_partial_line_waits_for_the_rest(self):
+        """Test that a partial last line is applied once completed."""
+        line = self.sale("Tea", 4)
+        self.write(self.sale("Coffee", 2) + line[:10])
+        self.assertEqual(self.follower.poll(), 1)
+        self.assertNotIn("Tea", self.follower.totals.total_sales)
+        self.write(line[10:])
+        self.assertEqual(self.follower.poll(), 1)
+        self.assertEqual(self.follower.poll(), 0)
+        self.assertEqual(self.follower.totals.total_sales["Tea"]["quantity"],
+                         4)
+        self.assertAlmostEqual(self.follower.totals.grand_total, 11.0)
+
+    def test_truncation_starts_over(self):
+        """Test that a truncated file resets the totals."""
+        self.write(self.sale("Coffee", 2) + self.sale("Tea", 1))
+        self.assertEqual(self.follower.poll(), 2)
+        self.write(self.sale("Tea", 2), "w")
+        self.assertEqual(self.follower.poll(), 1)
+        self.assertEqual(self.follower.totals.records, 1)
+        self.assertEqual(list(self.follower.totals.total_sales), ["Tea"])
+        self.assertAlmostEqual(self.follower.totals.grand_total, 3.0)
+
+    def test_invalid_rows_are_skipped(self):
+        """Test that invalid rows change neither totals nor counts."""
+        self.write(self.sale("Coffee", "x") + '{"Product": "Tea"\n'
+                   + self.sale("Tea", None) + self.sale("Tea", True)
+                   + json.dumps(["Tea", 1]) + "\n" + self.sale("Tea", 2))
+        self.assertEqual(self.follower.poll(), 1)
+        self.assertEqual(self.follower.totals.records, 1)
+        self.assertEqual(list(self.follower.totals.total_sales), ["Tea"])
+        self.assertAlmostEqual(self.follower.totals.grand_total, 3.0)
+
+    def tearDown(self):
+        """Delete the temporary files."""
+        shutil.rmtree(self.directory)
+
+
+if __name__ == '__main__':
+    unittest.main()
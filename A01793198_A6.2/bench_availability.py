@@ -0,0 +1,64 @@
+"""Benchmark del costo por verificación de disponibilidad de habitaciones.
+
+Compara la verificación original (recorrido con strptime por cada
+reservación) contra Hotel.is_room_available con fechas ordinales.
+Uso: python bench_availability.py [num_reservaciones ...]
+"""
+import datetime
+import sys
+import timeit
+
+from hotel import Hotel
+
+
+def legacy_is_room_available(hotel, room_number, start_date, end_date):
+    """Verificación de disponibilidad previa, con strptime en cada paso."""
+    for reservation in hotel.rooms.get(room_number,
+                                       {}).get('reservations', []):
+        if start_date <= datetime.datetime.strptime(
+                reservation['end_date'], "%Y-%m-%d") \
+                and end_date >= datetime.datetime.strptime(
+                reservation['start_date'], "%Y-%m-%d"):
+            return False
+    return True
+
+
+def build_hotel(num_reservations):
+    """Crea un hotel con una habitación y reservaciones consecutivas."""
+    hotel = Hotel("BENCH", "Bench Hotel", "Bench Location")
+    hotel.add_room("101", 2)
+    first_day = datetime.date(2000, 1, 1)
+    for number in range(num_reservations):
+        start = first_day + datetime.timedelta(days=3 * number)
+        end = start + datetime.timedelta(days=1)
+        hotel.reserve_room("101", f"C{number}",
+                           start.isoformat(), end.isoformat())
+    return hotel
+
+
+def run_benchmark(num_reservations, repeat=200):
+    """Mide el costo por verificación antes y después, en microsegundos."""
+    hotel = build_hotel(num_reservations)
+    # Rango libre al final del historial: el peor caso del recorrido lineal
+    start = datetime.datetime(2000, 1, 1) + datetime.timedelta(
+        days=3 * num_reservations + 10)
+    end = start + datetime.timedelta(days=2)
+    before = timeit.timeit(
+        lambda: legacy_is_room_available(hotel, "101", start, end),
+        number=repeat) / repeat
+    after = timeit.timeit(
+        lambda: hotel.is_room_available("101", start, end),
+        number=repeat) / repeat
+    return before * 1e6, after * 1e6
+
+
+def main(sizes):
+    """Ejecuta el benchmark para cada tamaño e imprime los resultados."""
+    print(f"{'reservations':>12} {'before_us':>12} {'after_us':>12}")
+    for size in sizes:
+        before, after = run_benchmark(size)
+        print(f"{size:>12} {before:>12.2f} {after:>12.2f}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [10, 100, 1000, 10000])
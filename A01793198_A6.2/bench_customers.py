@@ -0,0 +1,42 @@
+"""Benchmark de importación masiva de clientes.
+
+Genera un archivo JSON con N clientes y mide load_customers_from_file.
+Uso: python bench_customers.py [num_clientes]
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+
+from customer import Customer
+
+
+def write_customers(filename, count):
+    """Escribe un archivo JSON con count clientes sintéticos."""
+    with open(filename, "w", encoding="utf-8") as file:
+        json.dump([{'customer_id': f"C{number}",
+                    'name': f"Customer {number}",
+                    'email': f"customer{number}@example.com"}
+                   for number in range(count)], file)
+
+
+def main(count):
+    """Genera los datos, mide la importación e imprime el resultado."""
+    handle, filename = tempfile.mkstemp(suffix=".json")
+    os.close(handle)
+    try:
+        write_customers(filename, count)
+        Customer.customers = []
+        started = time.perf_counter()
+        Customer.load_customers_from_file(filename)
+        elapsed = time.perf_counter() - started
+    finally:
+        os.remove(filename)
+    print(f"Customers loaded: {len(Customer.customers)}")
+    print(f"Load time: {elapsed:.2f} seconds "
+          f"({count / elapsed:,.0f} customers/s)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
@@ -0,0 +1,68 @@
+"""Benchmark de guardado y carga de hoteles en JSON y en binario.
+
+Crea hoteles con N habitaciones en total (cada una con reservaciones)
+y mide save/load_hotels_to_file contra save/load_snapshot.
+Uso: python bench_hotel_snapshot.py [num_habitaciones] [reservas_por_hab]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from dates import format_day, to_day
+from hotel import Hotel
+
+ROOMS_PER_HOTEL = 100
+
+
+def build_hotels(num_rooms, bookings_per_room):
+    """Crea hoteles con num_rooms habitaciones reservadas."""
+    Hotel.hotels = []
+    first_day = to_day("2024-01-01")
+    for number in range(num_rooms):
+        if number % ROOMS_PER_HOTEL == 0:
+            hotel = Hotel.create_hotel(f"H{number // ROOMS_PER_HOTEL}",
+                                       "Bench Hotel", "Bench Location")
+        room = f"{number % ROOMS_PER_HOTEL}"
+        hotel.add_room(room, 2)
+        for booking in range(bookings_per_room):
+            start = first_day + 3 * booking
+            hotel.reserve_room(room, f"C{booking}", format_day(start),
+                               format_day(start + 2))
+
+
+def measure(save, load, filename):
+    """Regresa (segundos al guardar, segundos al cargar, bytes)."""
+    started = time.perf_counter()
+    save(filename)
+    saved = time.perf_counter() - started
+    Hotel.hotels = []
+    started = time.perf_counter()
+    load(filename)
+    loaded = time.perf_counter() - started
+    return saved, loaded, os.path.getsize(filename)
+
+
+def main(num_rooms, bookings_per_room):
+    """Ejecuta el benchmark para ambos formatos e imprime los resultados."""
+    directory = tempfile.mkdtemp()
+    formats = (("json", Hotel.save_hotels_to_file,
+                Hotel.load_hotels_from_file),
+               ("binary", Hotel.save_snapshot, Hotel.load_snapshot))
+    print(f"Rooms: {num_rooms}, bookings per room: {bookings_per_room}")
+    print(f"{'format':>8} {'save_s':>10} {'load_s':>10} {'size_mb':>10}")
+    try:
+        for name, save, load in formats:
+            build_hotels(num_rooms, bookings_per_room)
+            filename = os.path.join(directory, f"hotels.{name}")
+            saved, loaded, size = measure(save, load, filename)
+            print(f"{name:>8} {saved:>10.2f} {loaded:>10.2f} "
+                  f"{size / 2 ** 20:>10.2f}")
+            os.remove(filename)
+    finally:
+        os.rmdir(directory)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 4)
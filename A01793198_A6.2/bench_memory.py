@@ -0,0 +1,84 @@
+"""Benchmark de memoria por registro de reservas y clientes.
+
+Compara la representación previa (diccionarios y objetos con __dict__)
+contra los registros con __slots__ y fechas ordinales.
+Uso: python bench_memory.py [num_registros]
+"""
+import datetime
+import sys
+import tracemalloc
+
+from customer import Customer
+from records import RoomBooking
+from reservation import Reservation, ReservationData
+
+
+class LegacyReservation:  # pylint: disable=too-few-public-methods
+    """Reservación con __dict__ y fechas datetime, como antes."""
+
+    def __init__(self, data):
+        """Inicializa la reservación con fechas datetime."""
+        self.reservation_id = data.reservation_id
+        self.hotel_id = data.hotel_id
+        self.room_number = data.room_number
+        self.customer_id = data.customer_id
+        self.start_date = datetime.datetime.strptime(data.start_date,
+                                                     "%Y-%m-%d")
+        self.end_date = datetime.datetime.strptime(data.end_date,
+                                                   "%Y-%m-%d")
+
+
+class LegacyCustomer:  # pylint: disable=too-few-public-methods
+    """Cliente con __dict__, como antes."""
+
+    def __init__(self, customer_id, name, email):
+        """Inicializa el cliente."""
+        self.customer_id = customer_id
+        self.name = name
+        self.email = email
+
+
+def bytes_per_record(factory, count):
+    """Mide los bytes asignados por registro creado con factory."""
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    records = [factory(number) for number in range(count)]
+    used = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    del records
+    return used / count
+
+
+def reservation_data(number):
+    """Genera los datos de una reservación de prueba."""
+    start = datetime.date(2024, 1, 1) + datetime.timedelta(days=number % 365)
+    end = start + datetime.timedelta(days=2)
+    return ReservationData(f"R{number}", "H001", 100 + number % 50,
+                           f"C{number}", start.isoformat(), end.isoformat())
+
+
+def main(count):
+    """Ejecuta las mediciones e imprime los bytes por registro."""
+    start_day = datetime.date(2024, 1, 1).toordinal()
+    cases = [
+        ("room booking",
+         lambda n: {'customer_id': f"C{n}",
+                    'start_date': "2024-01-01",
+                    'end_date': "2024-01-03"},
+         lambda n: RoomBooking(f"C{n}", start_day + n % 365,
+                               start_day + n % 365 + 2)),
+        ("reservation",
+         lambda n: LegacyReservation(reservation_data(n)),
+         lambda n: Reservation(reservation_data(n))),
+        ("customer",
+         lambda n: LegacyCustomer(f"C{n}", "John Doe", "john@example.com"),
+         lambda n: Customer(f"C{n}", "John Doe", "john@example.com")),
+    ]
+    print(f"{'record':>14} {'before_B':>10} {'after_B':>10}")
+    for name, before, after in cases:
+        print(f"{name:>14} {bytes_per_record(before, count):>10.1f} "
+              f"{bytes_per_record(after, count):>10.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
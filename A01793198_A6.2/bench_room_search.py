@@ -0,0 +1,119 @@
+"""Benchmark de la búsqueda de habitaciones por ciudad, capacidad y fechas.
+
+Crea N habitaciones en hoteles de 100 habitaciones repartidos en 50
+ciudades, con capacidades de 1 a 6 y la mayoría reservadas en el rango de
+consulta, y compara el recorrido de todos los hoteles y habitaciones con
+is_room_available contra Hotel.search_rooms, para la primera página de K
+resultados y para todas las páginas.
+Uso: python bench_room_search.py [num_habitaciones] [k]
+"""
+import random
+import sys
+import time
+
+from dates import format_day, to_day
+from hotel import Hotel
+
+ROOMS_PER_HOTEL = 100
+CITIES = 50
+QUERIES = 50
+OCCUPANCY = 0.8
+
+
+def build_hotels(num_rooms, seed=42):
+    """Crea los hoteles y reserva la mayoría de las habitaciones."""
+    Hotel.hotels = []
+    generator = random.Random(seed)
+    first_day = to_day("2024-01-01")
+    for number in range(num_rooms):
+        if number % ROOMS_PER_HOTEL == 0:
+            hotel_number = number // ROOMS_PER_HOTEL
+            hotel = Hotel.create_hotel(f"H{hotel_number}", "Bench Hotel",
+                                       f"City {hotel_number % CITIES}")
+        room = f"{number % ROOMS_PER_HOTEL}"
+        hotel.add_room(room, generator.randint(1, 6))
+        if generator.random() < OCCUPANCY:
+            start = first_day + generator.randrange(20)
+            hotel.reserve_room(room, "C1", format_day(start),
+                               format_day(start + 14))
+
+
+def scan(location, min_capacity, start_date, end_date, limit=None):
+    """Búsqueda recorriendo todos los hoteles y habitaciones."""
+    matches = []
+    for hotel in Hotel.hotels:
+        if hotel.location != location:
+            continue
+        for room_number, room in hotel.rooms.items():
+            if room.capacity >= min_capacity and hotel.is_room_available(
+                    room_number, start_date, end_date):
+                matches.append((hotel.hotel_id, room_number))
+                if len(matches) == limit:
+                    return matches
+    return matches
+
+
+def search_all(location, min_capacity, start_date, end_date, limit):
+    """Recorre todas las páginas de Hotel.search_rooms."""
+    matches = []
+    cursor = None
+    while True:
+        page, cursor = Hotel.search_rooms(location, min_capacity, start_date,
+                                          end_date, limit, cursor)
+        matches.extend(page)
+        if cursor is None:
+            return matches
+
+
+def timed(function, queries):
+    """Regresa los milisegundos promedio por consulta y los resultados."""
+    started = time.perf_counter()
+    results = [function(*query) for query in queries]
+    return (time.perf_counter() - started) * 1000 / len(queries), results
+
+
+def main(num_rooms, limit):
+    """Ejecuta el benchmark e imprime los resultados."""
+    started = time.perf_counter()
+    build_hotels(num_rooms)
+    print(f"Rooms: {num_rooms}, build {time.perf_counter() - started:.1f} s")
+    started = time.perf_counter()
+    Hotel.search_rooms("City 0", 1, "2024-01-10", "2024-01-12")
+    print(f"Index built in {time.perf_counter() - started:.2f} s")
+    generator = random.Random(7)
+    first_day = to_day("2024-01-01")
+    mixed = []
+    sparse = []
+    for _ in range(QUERIES):
+        city = f"City {generator.randrange(CITIES)}"
+        start = first_day + generator.randrange(30)
+        mixed.append((city, generator.randint(1, 6), format_day(start),
+                      format_day(start + generator.randint(1, 5))))
+        # Capacidad máxima en las noches más ocupadas: pocas coincidencias
+        start = first_day + 14 + generator.randrange(5)
+        sparse.append((city, 6, format_day(start), format_day(start + 2)))
+    print(f"{'queries':>8} {'page':>9} {'scan_ms':>10} {'index_ms':>10} "
+          f"{'speedup':>8}")
+    for name, queries in (("mixed", mixed), ("sparse", sparse)):
+        scan_ms, expected = timed(scan, queries)
+        index_ms, found = timed(
+            lambda *query: search_all(*query, limit), queries)
+        assert [sorted(page) for page in found] == \
+            [sorted(page) for page in expected]
+        first_scan_ms, _ = timed(lambda *query: scan(*query, limit),
+                                 queries)
+        first_index_ms, pages = timed(
+            lambda *query: Hotel.search_rooms(*query, limit)[0], queries)
+        assert all(set(page) <= set(everything)
+                   and len(page) == min(limit, len(everything))
+                   for page, everything in zip(pages, expected))
+        for label, before, after in ((f"first {limit}", first_scan_ms,
+                                      first_index_ms),
+                                     ("all", scan_ms, index_ms)):
+            print(f"{name:>8} {label:>9} {before:>10.3f} {after:>10.3f} "
+                  f"{before / after:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 10)
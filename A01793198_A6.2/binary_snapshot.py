@@ -0,0 +1,112 @@
+"""Módulo con el formato binario compacto para snapshots de hoteles.
+
+Estructura (little-endian):
+    encabezado   b"HTLS" + versión (1 byte) + número de hoteles (uint32)
+    hotel        hotel_id, name, location (valores) + habitaciones (uint32)
+    habitación   room_number, capacity (valores) + reservas (uint32)
+    reserva      customer_id (valor) + inicio (uint32) + noches (uint32)
+Cada valor lleva una etiqueta de un byte: b"s" cadena UTF-8 con longitud
+uint32, b"i" entero de 64 bits, b"n" None.
+"""
+import struct
+
+MAGIC = b"HTLS"
+VERSION = 1
+
+_COUNT = struct.Struct("<I")
+_INT = struct.Struct("<q")
+_BOOKING = struct.Struct("<II")
+
+
+def _write_value(buffer, value):
+    """Agrega un valor etiquetado al buffer.
+
+    Lanza TypeError si el valor no es cadena, entero o None, para no
+    guardarlo como otro tipo.
+    """
+    if value is None:
+        buffer += b"n"
+    elif isinstance(value, int) and not isinstance(value, bool):
+        buffer += b"i"
+        buffer += _INT.pack(value)
+    elif isinstance(value, str):
+        encoded = value.encode("utf-8")
+        buffer += b"s"
+        buffer += _COUNT.pack(len(encoded))
+        buffer += encoded
+    else:
+        raise TypeError(f"Unsupported snapshot value: {value!r}.")
+
+
+def _read_value(data, offset):
+    """Lee un valor etiquetado y regresa (valor, nuevo offset)."""
+    tag = data[offset:offset + 1]
+    offset += 1
+    if tag == b"s":
+        (length,) = _COUNT.unpack_from(data, offset)
+        offset += _COUNT.size
+        return data[offset:offset + length].decode("utf-8"), offset + length
+    if tag == b"i":
+        return _INT.unpack_from(data, offset)[0], offset + _INT.size
+    if tag == b"n":
+        return None, offset
+    raise ValueError("Invalid snapshot value.")
+
+
+def encode_hotels(hotels):
+    """Codifica hoteles (con sus Room y RoomBooking) en bytes."""
+    buffer = bytearray(MAGIC)
+    buffer.append(VERSION)
+    buffer += _COUNT.pack(len(hotels))
+    for hotel in hotels:
+        _write_value(buffer, hotel.hotel_id)
+        _write_value(buffer, hotel.name)
+        _write_value(buffer, hotel.location)
+        buffer += _COUNT.pack(len(hotel.rooms))
+        for room_number, room in hotel.rooms.items():
+            _write_value(buffer, room_number)
+            _write_value(buffer, room.capacity)
+            # Como hotels.json, solo las reservas que tiene el hotel
+            bookings = room.bookings.held_by_hotel()
+            buffer += _COUNT.pack(len(bookings))
+            for booking in bookings:
+                _write_value(buffer, booking.customer_id)
+                buffer += _BOOKING.pack(booking.start_day,
+                                        booking.end_day - booking.start_day)
+    return bytes(buffer)
+
+
+def decode_hotels(data):
+    """Decodifica bytes en una lista de tuplas de hotel.
+
+    Cada hotel es (hotel_id, name, location, rooms) y rooms es una lista
+    de (room_number, capacity, reservas), donde cada reserva es
+    (customer_id, día de inicio, día de fin).
+    """
+    if data[:4] != MAGIC or data[4] != VERSION:
+        raise ValueError("Invalid snapshot header.")
+    offset = 5
+    (hotel_count,) = _COUNT.unpack_from(data, offset)
+    offset += _COUNT.size
+    hotels = []
+    for _ in range(hotel_count):
+        hotel_id, offset = _read_value(data, offset)
+        name, offset = _read_value(data, offset)
+        location, offset = _read_value(data, offset)
+        (room_count,) = _COUNT.unpack_from(data, offset)
+        offset += _COUNT.size
+        rooms = []
+        for _ in range(room_count):
+            room_number, offset = _read_value(data, offset)
+            capacity, offset = _read_value(data, offset)
+            (booking_count,) = _COUNT.unpack_from(data, offset)
+            offset += _COUNT.size
+            bookings = []
+            for _ in range(booking_count):
+                customer_id, offset = _read_value(data, offset)
+                start_day, nights = _BOOKING.unpack_from(data, offset)
+                offset += _BOOKING.size
+                bookings.append((customer_id, start_day, start_day + nights))
+            rooms.append((room_number, capacity, bookings))
+        hotels.append((hotel_id, name, location, rooms))
+    return hotels
@@ -0,0 +1,329 @@
+"""Servicio HTTP/JSON con asyncio para reservar, cancelar y consultar.
+
+Mantiene en memoria el estado de Hotel, Customer y Reservation y lo
+comparte entre todos los clientes. Rutas:
+    POST   /reservations                 crea una reservación (JSON)
+    GET    /reservations/<id>            regresa una reservación
+    DELETE /reservations/<id>            cancela una reservación
+    GET    /availability?hotel_id=...&room_number=...&start_date=...
+           &end_date=...                 verifica disponibilidad
+Las escrituras se encolan y se aplican por lotes; la persistencia de
+cada lote corre en un hilo aparte y se responde cuando terminó. Si la
+persistencia falla, los cambios del lote se deshacen en memoria.
+Uso: python booking_service.py [puerto] [prefijo_journal]
+"""
+import asyncio
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlsplit
+
+import storage
+from journal import Journal
+from reservation import CONFLICT, Reservation, ReservationData
+
+REASONS = {200: "OK", 201: "Created", 400: "Bad Request",
+           404: "Not Found", 405: "Method Not Allowed",
+           409: "Conflict", 500: "Internal Server Error"}
+MAX_BATCH = 256
+
+
+class BatchRecorder:
+    """Backend que acumula las operaciones de un lote en memoria.
+
+    Las clases lo llaman dentro del ciclo de eventos; flush las entrega
+    al backend real desde el hilo de persistencia.
+    """
+
+    def __init__(self, backend):
+        """Inicializa el acumulador para el backend dado."""
+        self.backend = backend
+        self.entries = []
+
+    def record(self, entity, operation, data):
+        """Guarda la operación para el siguiente flush."""
+        self.entries.append((entity, operation, data))
+
+    def drain(self):
+        """Regresa y vacía las operaciones acumuladas."""
+        entries, self.entries = self.entries, []
+        return entries
+
+    def flush(self, entries):
+        """Escribe las operaciones en el backend real.
+
+        Con record_many (Journal, SQLiteStorage) el lote se guarda completo
+        o no se guarda, así que deshacer todo el lote ante un error deja la
+        memoria igual que el backend. Un backend que solo tiene record
+        recibe las operaciones una por una.
+        """
+        record_many = getattr(self.backend, 'record_many', None)
+        if record_many is not None:
+            record_many(entries)
+            return
+        for entity, operation, data in entries:
+            self.backend.record(entity, operation, data)
+
+
+class BookingService:
+    """Servidor asyncio con escrituras por lotes.
+
+    Las lecturas se responden directo en el ciclo de eventos; las
+    escrituras pasan por una cola que un solo consumidor vacía, así que
+    el estado en memoria solo cambia desde una tarea.
+    """
+
+    def __init__(self, backend=None, max_batch=MAX_BATCH):
+        """Inicializa el servicio con un backend opcional de persistencia."""
+        self.recorder = BatchRecorder(backend) if backend else None
+        self.max_batch = max_batch
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.queue = None
+        self.server = None
+        self._worker = None
+        self.batches = 0
+
+    async def start(self, host="127.0.0.1", port=8080):
+        """Abre el puerto y arranca el consumidor de lotes."""
+        if self.recorder is not None:
+            storage.attach(self.recorder)
+        self.queue = asyncio.Queue()
+        self._worker = asyncio.create_task(self._run_batches())
+        self.server = await asyncio.start_server(self._handle, host, port)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        """Cierra el servidor y espera la persistencia pendiente."""
+        self.server.close()
+        await self.server.wait_closed()
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self.executor.shutdown(wait=True)
+        if self.recorder is not None:
+            storage.detach()
+
+    async def submit(self, operation, undo=None):
+        """Encola una escritura y espera su resultado.
+
+        undo(resultado), si se da, deshace la escritura en memoria cuando
+        la persistencia del lote falla.
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((operation, undo, future))
+        return await future
+
+    async def _run_batches(self):
+        """Aplica las escrituras encoladas por lotes."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            while len(batch) < self.max_batch and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+            results = []
+            for operation, undo, future in batch:
+                result, error = _apply(operation)
+                results.append((future, result, error,
+                                undo if error is None else None))
+            if self.recorder is not None:
+                entries = self.recorder.drain()
+                try:
+                    if entries:
+                        await loop.run_in_executor(
+                            self.executor, self.recorder.flush, entries)
+                except OSError as error:
+                    # El lote no quedó guardado (ver BatchRecorder.flush):
+                    # se deshace en memoria en orden inverso
+                    for _, result, failed, undo in reversed(results):
+                        if failed is None and undo is not None:
+                            undo(result)
+                    results = [(future, None, error, None)
+                               for future, *_ in results]
+            self.batches += 1
+            for future, result, error, _ in results:
+                if future.cancelled():
+                    continue
+                if error is None:
+                    future.set_result(result)
+                else:
+                    future.set_exception(error)
+
+    async def _handle(self, reader, writer):
+        """Atiende las peticiones de una conexión (keep-alive)."""
+        try:
+            while True:
+                try:
+                    request = await read_request(reader)
+                except ValueError as error:
+                    # Sin una petición bien formada no se puede seguir
+                    # leyendo la conexión
+                    write_response(writer, 400, {'error': str(error)})
+                    await writer.drain()
+                    break
+                if request is None:
+                    break
+                status, body = await self.dispatch(*request)
+                write_response(writer, status, body)
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def dispatch(self, method, target, payload):
+        """Regresa (estado HTTP, cuerpo) para una petición."""
+        url = urlsplit(target)
+        parts = [part for part in url.path.split("/") if part]
+        try:
+            if parts == ["availability"] and method == "GET":
+                query = {key: values[0]
+                         for key, values in parse_qs(url.query).items()}
+                available = Reservation.is_room_available(
+                    query['hotel_id'], _room(query['room_number']),
+                    query['start_date'], query['end_date'])
+                return 200, {'available': available}
+            if parts == ["reservations"] and method == "POST":
+                data = _reservation_data(payload)
+                reservation = await self.submit(
+                    lambda: Reservation.create_reservation(data),
+                    lambda created: Reservation.booking_store().remove(
+                        created))
+                return 201, reservation.to_dict()
+            if len(parts) == 2 and parts[0] == "reservations":
+                if method == "GET":
+                    return 200, Reservation.get_reservation(
+                        parts[1]).to_dict()
+                if method == "DELETE":
+                    await self.submit(
+                        lambda: _cancel(parts[1]),
+                        lambda cancelled: Reservation.booking_store().add(
+                            cancelled, CONFLICT))
+                    return 200, {'reservation_id': parts[1]}
+                return 405, {'error': "Method not allowed."}
+        except (KeyError, TypeError) as error:
+            return 400, {'error': f"Invalid request: {error}"}
+        except ValueError as error:
+            return _status(error), {'error': str(error)}
+        except OSError as error:
+            return 500, {'error': f"Persistence failed: {error}"}
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            return 500, {'error': f"Internal error: {error}"}
+        return 404, {'error': "Route not found."}
+
+
+def _status(error):
+    """Elige el estado HTTP para un ValueError de las clases."""
+    message = str(error)
+    if "not found" in message:
+        return 404
+    if "already" in message:
+        return 409
+    return 400
+
+
+def _apply(operation):
+    """Ejecuta una escritura y regresa (resultado, None) o (None, error).
+
+    Cualquier excepción falla solo su petición, no el consumidor. Se
+    atrapa aquí y no en el consumidor para que su traceback, que viaja
+    en el future de la petición, no incluya el marco del consumidor.
+    """
+    try:
+        return operation(), None
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        return None, error
+
+
+def _reservation_data(payload):
+    """Convierte el cuerpo JSON en ReservationData validando sus tipos."""
+    if not isinstance(payload, dict):
+        raise TypeError("the body must be a JSON object")
+    data = ReservationData(**payload)
+    for name in ('reservation_id', 'hotel_id', 'customer_id',
+                 'start_date', 'end_date'):
+        if not isinstance(getattr(data, name), str):
+            raise TypeError(f"{name} must be a string")
+    if not isinstance(data.room_number, (int, str)) \
+            or isinstance(data.room_number, bool):
+        raise TypeError("room_number must be an integer or a string")
+    return data
+
+
+def _cancel(reservation_id):
+    """Cancela la reservación y la regresa para poder deshacerlo."""
+    reservation = Reservation.get_reservation(reservation_id)
+    Reservation.cancel_reservation(reservation_id)
+    return reservation
+
+
+def _room(value):
+    """Convierte el número de habitación de la URL como en el JSON."""
+    return int(value) if value.isdigit() else value
+
+
+async def read_request(reader):
+    """Lee una petición HTTP/1.1 y regresa (método, ruta, JSON o None).
+
+    Regresa None al cerrarse la conexión y lanza ValueError si la línea de
+    petición o Content-Length no son válidos.
+    """
+    line = await reader.readline()
+    if not line.strip():
+        return None
+    parts = line.decode("latin-1").split(" ", 2)
+    if len(parts) != 3:
+        raise ValueError("Malformed request line.")
+    method, target, _ = parts
+    length = 0
+    while True:
+        header = await reader.readline()
+        if header in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = header.decode("latin-1").partition(":")
+        if name.strip().lower() == "content-length":
+            value = value.strip()
+            if not value.isdigit():
+                raise ValueError("Invalid Content-Length.")
+            length = int(value)
+    payload = None
+    if length:
+        try:
+            payload = json.loads(await reader.readexactly(length))
+        except json.JSONDecodeError:
+            payload = {}
+    return method, target, payload
+
+
+def write_response(writer, status, body):
+    """Escribe una respuesta JSON con Content-Length."""
+    content = json.dumps(body).encode("utf-8")
+    writer.write(f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                 f"Content-Type: application/json\r\n"
+                 f"Content-Length: {len(content)}\r\n\r\n".encode("latin-1")
+                 + content)
+
+
+async def serve(port, journal_path):
+    """Restaura el estado desde el journal y atiende hasta interrumpir."""
+    journal = Journal(journal_path)
+    storage.restore(journal)
+    service = BookingService(journal)
+    port = await service.start(port=port)
+    print(f"Booking service listening on http://127.0.0.1:{port}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await service.close()
+        storage.compact(journal)
+        journal.close()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(serve(int(sys.argv[1]) if len(sys.argv) > 1 else 8080,
+                          sys.argv[2] if len(sys.argv) > 2
+                          else "booking_service"))
+    except KeyboardInterrupt:
+        pass
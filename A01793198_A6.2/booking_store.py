@@ -0,0 +1,500 @@
+"""Módulo con el almacén de reservas compartido por Hotel y Reservation."""
+from contextlib import ExitStack
+
+from interval_index import IntervalIndex
+from locks import STATE_LOCK, LockTable
+from records import RoomBooking, RoomBookings
+from registry import Registry
+
+DUPLICATE_ID = "A reservation with the given ID already exists."
+NOT_FOUND = "Reservation not found."
+
+
+def room_key(hotel_id, room_number):
+    """Regresa la llave de una habitación.
+
+    Hotel usa números de habitación como cadena y Reservation como
+    entero; ambos nombran la misma habitación.
+    """
+    return (hotel_id, str(room_number))
+
+
+class BookingStore:
+    """Reservas de todas las habitaciones con un calendario por habitación.
+
+    Cada estancia tiene un solo registro en las reservas de su habitación
+    (ver room). Las reservaciones de Reservation son objetos con
+    reservation_id, hotel_id, room_number, customer_id, start_day y
+    end_day, y además están en el registro por ID, por cliente y por
+    fechas de inicio y fin. Las reservas hechas solo con
+    Hotel.reserve_room son RoomBooking ligeros. Si ambas clases reservan
+    la misma estancia (mismo hotel, habitación, cliente y fechas), la
+    segunda toma el registro existente en vez de rechazarla: la
+    reservación queda con held_by_hotel, y cancelarla con una clase la
+    deja a la otra. Las habitaciones de Hotel ven todos los registros.
+
+    El candado de cada habitación cubre la verificación de conflictos y el
+    alta; lock (locks.STATE_LOCK) protege por poco tiempo el registro, los
+    índices compartidos y el registro en la persistencia de cada cambio.
+    Siempre se toma primero el de habitación.
+    """
+
+    def __init__(self):
+        """Inicializa un almacén sin reservas."""
+        self.registry = Registry('reservation_id')
+        self._rooms = {}
+        self._customers = {}
+        self._starts = IntervalIndex()
+        self._ends = IntervalIndex()
+        # Altas que aún no están en _starts y _ends: se ordenan juntas en
+        # la siguiente consulta o baja, no una por una
+        self._unsorted = []
+        self._room_locks = LockTable()
+        self.lock = STATE_LOCK
+
+    def __len__(self):
+        """Regresa el número de reservaciones."""
+        return len(self.registry)
+
+    def __iter__(self):
+        """Itera las reservaciones en orden de alta."""
+        return iter(self.registry)
+
+    def get(self, reservation_id):
+        """Regresa la reservación con el ID dado o None."""
+        return self.registry.get(reservation_id)
+
+    def room(self, hotel_id, room_number):
+        """Regresa las reservas de la habitación, con su calendario.
+
+        El objeto de cada habitación es siempre el mismo, así que quien lo
+        guarda (Room, RoomSearch) ve los cambios posteriores.
+        """
+        return self._room(room_key(hotel_id, room_number))
+
+    def _room(self, key):
+        """Regresa las reservas de la habitación con la llave dada."""
+        bookings = self._rooms.get(key)
+        if bookings is None:
+            with self.lock:
+                bookings = self._rooms.setdefault(key, RoomBookings())
+        return bookings
+
+    def room_lock(self, hotel_id, room_number):
+        """Regresa el candado de la habitación."""
+        return self._room_locks.lock(room_key(hotel_id, room_number))
+
+    def reset(self, bookings=()):
+        """Reemplaza las reservaciones sin validar conflictos.
+
+        Las reservas de Hotel se conservan, incluidas las que compartía con
+        una reservación anterior.
+        """
+        with self.lock:
+            registry = Registry('reservation_id', bookings)
+            for booking in self.registry:
+                self._unplace(booking)
+            self.registry = registry
+            self._customers = {}
+            self._starts = IntervalIndex()
+            self._ends = IntervalIndex()
+            self._unsorted = []
+            for booking in registry:
+                room = self.room(booking.hotel_id, booking.room_number)
+                self._place(room, booking, self._hotel_stay(room, booking))
+            self._index_many(list(registry))
+        return self.registry
+
+    @staticmethod
+    def _hotel_stay(room, booking):
+        """Regresa la reserva solo de Hotel con la misma estancia, o None."""
+        if room.is_free(booking.start_day, booking.end_day):
+            return None
+        same = room.same_stay(booking.customer_id, booking.start_day,
+                              booking.end_day)
+        return same if isinstance(same, RoomBooking) else None
+
+    @staticmethod
+    def _place(room, booking, same):
+        """Pone la reservación en su habitación, tomando la reserva same."""
+        if same is None:
+            booking.held_by_hotel = False
+            room.append(booking)
+        else:
+            room.replace(same, booking)
+            booking.held_by_hotel = True
+
+    def _unplace(self, booking):
+        """Quita la reservación de su habitación.
+
+        Si el hotel también tenía la estancia, la conserva como RoomBooking.
+        """
+        room = self.room(booking.hotel_id, booking.room_number)
+        if booking.held_by_hotel:
+            room.replace(booking, RoomBooking(
+                booking.customer_id, booking.start_day, booking.end_day))
+            booking.held_by_hotel = False
+        else:
+            room.remove(booking)
+
+    def _index_many(self, bookings):
+        """Agrega reservaciones a los índices por cliente y por fechas."""
+        for booking in bookings:
+            self._customers.setdefault(
+                booking.customer_id, {})[booking.reservation_id] = booking
+        self._unsorted.extend(bookings)
+
+    def _sort_dates(self):
+        """Pasa las altas pendientes a los índices por fecha."""
+        if self._unsorted:
+            bookings = self._unsorted
+            self._unsorted = []
+            self._starts.extend((booking.start_day, booking.end_day,
+                                 booking) for booking in bookings)
+            self._ends.extend((booking.end_day, booking.end_day, booking)
+                              for booking in bookings)
+
+    def _unindex_many(self, bookings):
+        """Quita reservaciones de los índices por cliente y por fechas."""
+        for booking in bookings:
+            del self._customers[booking.customer_id][booking.reservation_id]
+        if self._unsorted:
+            # Las altas pendientes se descartan sin ordenarlas
+            removed = {id(booking) for booking in bookings}
+            pending = {id(booking) for booking in self._unsorted}
+            self._unsorted = [booking for booking in self._unsorted
+                              if id(booking) not in removed]
+            bookings = [booking for booking in bookings
+                        if id(booking) not in pending]
+        self._starts.remove_many((booking.start_day, booking)
+                                 for booking in bookings)
+        self._ends.remove_many((booking.end_day, booking)
+                               for booking in bookings)
+
+    def is_free(self, hotel_id, room_number, start_day, end_day):
+        """Verifica si la habitación no tiene reservas en el rango."""
+        with self.room_lock(hotel_id, room_number):
+            return self.room(hotel_id, room_number).is_free(start_day,
+                                                            end_day)
+
+    def add(self, booking, conflict, record=None):
+        """Agrega una reservación si la habitación está libre en sus fechas.
+
+        Lanza ValueError con el mensaje conflict si hay solapamiento, o si
+        el ID ya existe; una reserva de Hotel con la misma estancia no es
+        conflicto y pasa a ser la reservación. record(booking), si se da,
+        se llama con los candados de la habitación y del estado tomados,
+        antes de agregarla: la bitácora conserva el orden de las
+        operaciones, un snapshot no ve el cambio antes que su registro y,
+        si record lanza una excepción, la reservación no se agrega.
+        """
+        room = self.room(booking.hotel_id, booking.room_number)
+        with self.room_lock(booking.hotel_id, booking.room_number):
+            same = self._hotel_stay(room, booking)
+            if same is None and not room.is_free(booking.start_day,
+                                                 booking.end_day):
+                raise ValueError(conflict)
+            with self.lock:
+                if self.registry.get(booking.reservation_id) is not None:
+                    raise ValueError(DUPLICATE_ID)
+                if record is not None:
+                    record(booking)
+                self.registry.append(booking)
+                self._index_many([booking])
+                self._place(room, booking, same)
+        return booking
+
+    def add_many(self, bookings, conflict, atomic=False, record=None):
+        """Agrega muchas reservas validándolas en una sola pasada.
+
+        Rechaza los IDs repetidos, ordena cada habitación por fecha de
+        inicio y rechaza los solapamientos en un barrido; ante un
+        solapamiento se conserva la reserva que inicia primero. Una reserva
+        de Hotel con la misma estancia no es conflicto (ver add). Regresa
+        (agregadas, rechazadas), con las agregadas en el orden recibido y
+        las rechazadas como pares (reserva, motivo). Con atomic, cualquier
+        rechazo lanza ValueError sin agregar nada. record(booking) se llama
+        antes de agregar cada una; si lanza una excepción, se conservan las
+        ya registradas y la excepción se propaga.
+        """
+        rejected = []
+        seen = set()
+        rooms = {}
+        for booking in bookings:
+            if booking.reservation_id in seen \
+                    or self.registry.get(booking.reservation_id) is not None:
+                rejected.append((booking, DUPLICATE_ID))
+                continue
+            seen.add(booking.reservation_id)
+            rooms.setdefault(room_key(booking.hotel_id, booking.room_number),
+                             []).append(booking)
+
+        with ExitStack() as stack:
+            # Candados en un orden fijo para no bloquearse con otra carga
+            for key in sorted(rooms, key=repr):
+                stack.enter_context(self._room_locks.lock(key))
+            accepted = {}
+            for (hotel_id, room_number), candidates in rooms.items():
+                room = self.room(hotel_id, room_number)
+                last_end = None
+                for booking in sorted(candidates,
+                                      key=lambda item: item.start_day):
+                    same = self._hotel_stay(room, booking)
+                    if (last_end is not None
+                            and booking.start_day <= last_end) \
+                            or (same is None
+                                and not room.is_free(booking.start_day,
+                                                     booking.end_day)):
+                        rejected.append((booking, conflict))
+                        continue
+                    last_end = booking.end_day
+                    accepted[id(booking)] = same
+            if atomic and rejected:
+                raise ValueError(rejected[0][1])
+            added = []
+            with self.lock:
+                try:
+                    for booking in bookings:
+                        if id(booking) not in accepted:
+                            continue
+                        # Otro hilo pudo registrar el ID en la validación
+                        if self.registry.get(booking.reservation_id) \
+                                is not None:
+                            rejected.append((booking, DUPLICATE_ID))
+                            continue
+                        if record is not None:
+                            record(booking)
+                        self.registry.append(booking)
+                        added.append(booking)
+                        self._place(self.room(booking.hotel_id,
+                                              booking.room_number),
+                                    booking, accepted[id(booking)])
+                finally:
+                    self._index_many(added)
+        return added, rejected
+
+    def remove(self, booking, record=None):
+        """Quita una reservación; lanza ValueError si ya no está.
+
+        Si el hotel también tenía la estancia, la conserva como RoomBooking.
+        """
+        with self.room_lock(booking.hotel_id, booking.room_number):
+            with self.lock:
+                if booking not in self.registry:
+                    raise ValueError(NOT_FOUND)
+                if record is not None:
+                    record(booking)
+                self.registry.remove(booking)
+                self._unindex_many([booking])
+                self._unplace(booking)
+
+    def move(self, booking, start_day, end_day, conflict, record=None):
+        """Cambia las fechas validando solo contra la misma habitación.
+
+        El nuevo rango se verifica con las noches de la reservación
+        liberadas; si hay conflicto se lanza ValueError sin modificarla.
+        record(booking) se llama antes del cambio, y si lanza una excepción
+        la reservación conserva sus fechas. Si el hotel también tiene la
+        estancia, la cambia con ella. Una reservación que no está en el
+        almacén solo cambia sus fechas.
+        """
+        with self.room_lock(booking.hotel_id, booking.room_number):
+            if booking not in self.registry:
+                booking.start_day = start_day
+                booking.end_day = end_day
+                return
+            room = self.room(booking.hotel_id, booking.room_number)
+            calendar = room.calendar
+            calendar.release(booking.start_day, booking.end_day)
+            free = calendar.is_free(start_day, end_day)
+            calendar.occupy(booking.start_day, booking.end_day)
+            if not free:
+                raise ValueError(conflict)
+            with self.lock:
+                if record is not None:
+                    record(booking)
+                room.remove(booking)
+                self._sort_dates()
+                self._starts.remove(booking.start_day, booking)
+                self._ends.remove(booking.end_day, booking)
+                booking.start_day = start_day
+                booking.end_day = end_day
+                self._starts.add(start_day, end_day, booking)
+                self._ends.add(end_day, end_day, booking)
+                room.append(booking)
+
+    def add_room_booking(self, hotel_id, room_number, booking, conflict,
+                         record=None):
+        """Agrega una reserva de Hotel si la habitación está libre.
+
+        Lanza ValueError con el mensaje conflict si hay solapamiento con
+        cualquier reserva de la habitación, salvo que sea una reservación
+        de Reservation con la misma estancia: el hotel la toma en lugar de
+        agregar booking. record() se llama con los candados de la
+        habitación y del estado tomados antes de agregarla; si lanza una
+        excepción la reserva no se agrega.
+        """
+        room = self.room(hotel_id, room_number)
+        with self.room_lock(hotel_id, room_number):
+            same = None
+            if not room.is_free(booking.start_day, booking.end_day):
+                same = room.same_stay(booking.customer_id,
+                                      booking.start_day, booking.end_day)
+                if same is None or same.held_by_hotel:
+                    raise ValueError(conflict)
+            with self.lock:
+                if record is not None:
+                    record()
+                if same is None:
+                    room.append(booking)
+                else:
+                    same.held_by_hotel = True
+
+    def add_room_bookings(self, rooms, conflict, register=None, replace=()):
+        """Agrega reservas de Hotel de muchas habitaciones o ninguna.
+
+        rooms relaciona (hotel_id, número) con listas de RoomBooking. Cada
+        habitación se valida en una pasada ordenada por fecha de inicio,
+        contra sus demás reservas y su calendario; ante cualquier
+        solapamiento se lanza ValueError con el mensaje conflict sin
+        agregar nada. Una reservación de Reservation con la misma estancia
+        no es conflicto y el hotel la toma (ver add_room_booking). Las
+        habitaciones (hotel_id, número) de replace pierden antes sus
+        reservas de Hotel, como en remove_rooms, y se validan sin ellas.
+        register(), si se da, se llama después de validar y antes de
+        agregar; si lanza una excepción tampoco se agrega nada, y si no, se
+        regresa su resultado.
+        """
+        merged = {}
+        for room, bookings in rooms.items():
+            merged.setdefault(room_key(*room), []).extend(bookings)
+        replaced = {room_key(*room) for room in replace}
+        taken = []
+        skipped = set()
+        with ExitStack() as stack:
+            for key in sorted(set(merged) | replaced, key=repr):
+                stack.enter_context(self._room_locks.lock(key))
+            for key, bookings in merged.items():
+                room = self._room(key)
+                last_end = None
+                for booking in sorted(bookings,
+                                      key=lambda item: item.start_day):
+                    if last_end is not None \
+                            and booking.start_day <= last_end:
+                        raise ValueError(conflict)
+                    last_end = booking.end_day
+                    if room.is_free(booking.start_day, booking.end_day):
+                        continue
+                    same = self._reservation_stay(room, booking,
+                                                  key in replaced, conflict)
+                    if same is not None:
+                        taken.append(same)
+                        skipped.add(id(booking))
+            with self.lock:
+                result = None if register is None else register()
+                for key in replaced:
+                    self._release_hotel(self._room(key))
+                for booking in taken:
+                    booking.held_by_hotel = True
+                for key, bookings in merged.items():
+                    self._room(key).extend(
+                        booking for booking in bookings
+                        if id(booking) not in skipped)
+        return result
+
+    @staticmethod
+    def _reservation_stay(room, booking, replaced, conflict):
+        """Regresa la reservación con la que booking puede compartirse.
+
+        Regresa None si lo que ocupa sus noches son solo reservas de Hotel
+        que se van a quitar (replaced), y lanza ValueError con el mensaje
+        conflict si hay otro solapamiento.
+        """
+        staying = [other for other in room.index.overlapping(
+            booking.start_day, booking.end_day)
+            if not (replaced and isinstance(other, RoomBooking))]
+        if not staying:
+            return None
+        same = staying[0]
+        if len(staying) > 1 or isinstance(same, RoomBooking) \
+                or (same.held_by_hotel and not replaced) \
+                or same.customer_id != booking.customer_id \
+                or same.start_day != booking.start_day \
+                or same.end_day != booking.end_day:
+            raise ValueError(conflict)
+        return same
+
+    def remove_room_booking(self, hotel_id, room_number, customer_id,
+                            record=None):
+        """Quita la primera reserva de Hotel del cliente en la habitación.
+
+        La primera es la de fecha de inicio más temprana. Si es también una
+        reservación de Reservation, esta se conserva. Regresa False si el
+        cliente no tiene reservas de Hotel en la habitación. record() se
+        llama antes de quitarla; si lanza una excepción no se quita.
+        """
+        room = self.room(hotel_id, room_number)
+        with self.room_lock(hotel_id, room_number):
+            for booking in room:
+                if booking.customer_id == customer_id \
+                        and booking.held_by_hotel:
+                    with self.lock:
+                        if record is not None:
+                            record()
+                        if isinstance(booking, RoomBooking):
+                            room.remove(booking)
+                        else:
+                            booking.held_by_hotel = False
+                    return True
+        return False
+
+    def remove_rooms(self, rooms, record=None):
+        """Quita las reservas de Hotel de las habitaciones (hotel_id, número).
+
+        Las reservaciones de Reservation en esas habitaciones se conservan.
+        record(), si se da, se llama con los candados tomados antes de
+        quitar nada; si lanza una excepción las habitaciones no cambian.
+        """
+        with ExitStack() as stack:
+            keys = {room_key(hotel_id, number) for hotel_id, number in rooms}
+            for key in sorted(keys, key=repr):
+                stack.enter_context(self._room_locks.lock(key))
+            with self.lock:
+                if record is not None:
+                    record()
+                for key in keys:
+                    self._release_hotel(self._room(key))
+
+    @staticmethod
+    def _release_hotel(room):
+        """Quita de la habitación las reservas de Hotel."""
+        kept = [booking for booking in room
+                if not isinstance(booking, RoomBooking)]
+        for booking in kept:
+            booking.held_by_hotel = False
+        if len(kept) < len(room):
+            room.clear()
+            room.extend(kept)
+
+    def overlapping(self, start_day, end_day):
+        """Regresa las reservas que se solapan con el rango de días."""
+        with self.lock:
+            self._sort_dates()
+            return list(self._starts.overlapping(start_day, end_day))
+
+    def for_customer(self, customer_id):
+        """Regresa las reservas de un cliente."""
+        with self.lock:
+            return list(self._customers.get(customer_id, {}).values())
+
+    def starting_on(self, day):
+        """Regresa las reservas que inician en el día dado."""
+        with self.lock:
+            self._sort_dates()
+            return self._starts.starting_between(day, day)
+
+    def ending_on(self, day):
+        """Regresa las reservas que terminan en el día dado."""
+        with self.lock:
+            self._sort_dates()
+            return self._ends.starting_between(day, day)
@@ -1,82 +1,211 @@
-"""Module for managing customer data."""
-import json
-import re
-import logging
-
-
-class Customer:
-    """Manages customer information."""
-
-    customers = []
-
-    def __init__(self, customer_id, name, email):
-        """Initialize a new customer object."""
-        self.customer_id = customer_id
-        self.name = name
-        self.email = email
-
-    @classmethod
-    def create_customer(cls, customer_id, name, email):
-        """Create and return a new customer."""
-        if not cls.is_valid_email(email):
-            raise ValueError("Invalid email format.")
-        if any(customer for customer in cls.customers
-               if customer.customer_id == customer_id):
-            raise ValueError("A customer with the given ID already exists.")
-        if not name:
-            raise ValueError("Name cannot be empty.")
-        new_customer = cls(customer_id, name, email)
-        cls.customers.append(new_customer)
-        return new_customer
-
-    @classmethod
-    def delete_customer(cls, customer_id):
-        """Delete a customer by ID."""
-        for existing_customer in cls.customers:
-            if existing_customer.customer_id == customer_id:
-                cls.customers.remove(existing_customer)
-                return True
-        raise ValueError("Customer not found.")
-
-    def modify_customer_info(self, name=None, email=None):
-        """Modify customer's name and/or email."""
-        if name:
-            self.name = name
-        if email:
-            if not self.is_valid_email(email):
-                raise ValueError("Invalid email format.")
-            self.email = email
-
-    @staticmethod
-    def is_valid_email(email):
-        """Validate email format."""
-        email_pattern = (
-            r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-        )
-        return re.match(email_pattern, email) is not None
-
-    @classmethod
-    def save_customers_to_file(cls, filename="customers.json"):
-        """Save all customers to a file."""
-        with open(filename, "w", encoding="utf-8") as file_handle:
-            json.dump([cust.__dict__ for cust in cls.customers],
-                      file_handle, indent=4)
-
-    @classmethod
-    def load_customers_from_file(cls, filename="customers.json"):
-        """Load customers from a file."""
-        try:
-            with open(filename, "r", encoding="utf-8") as file_handle:
-                customers_data = json.load(file_handle)
-            for customer_data in customers_data:
-                try:
-                    cls.create_customer(**customer_data)
-                except ValueError as value_error:
-                    logging.error("Error al cargar cliente: %s", value_error)
-        except FileNotFoundError:
-            logging.error("Archivo %s no encontrado. "
-                          "Se iniciará con una lista vacía.", filename)
-        except json.JSONDecodeError:
-            logging.error("Error al decodificar JSON en %s.", filename)
-        else:
-            logging.info("Customers loaded successfully.")
+"""Module for managing customer data."""
+import functools
+import json
+import re
+import logging
+
+from locks import STATE_LOCK
+from registry import Registry
+
+EMAIL_PATTERN = re.compile(
+    r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+)
+
+
+class Customer:
+    """Manages customer information."""
+
+    __slots__ = ('customer_id', 'name', 'email')
+    customers = Registry('customer_id')
+    # Incremental persistence backend (see storage.py)
+    storage = None
+    # When True, create and modify reject emails already in use
+    unique_emails = False
+    # State lock shared with Hotel and Reservation: every change is applied
+    # and recorded while holding it (see locks.py)
+    lock = STATE_LOCK
+    # Case-folded email -> {customer_id: customer} for the current registry
+    _email_index = {}
+    _indexed = None
+
+    def __init__(self, customer_id, name, email):
+        """Initialize a new customer object."""
+        self.customer_id = customer_id
+        self.name = name
+        self.email = email
+
+    @classmethod
+    def _registry(cls):
+        """Return the customer registry with an up-to-date email index.
+
+        If the customer list was replaced (e.g. Customer.customers = []),
+        it is wrapped in a Registry and the email index is rebuilt once.
+        """
+        if cls.customers is not cls._indexed:
+            registry = cls.customers
+            if not isinstance(registry, Registry):
+                registry = Registry('customer_id', registry)
+            cls.customers = registry
+            cls._email_index = {}
+            for customer in registry:
+                cls._index_email(customer)
+            cls._indexed = registry
+        return cls.customers
+
+    @classmethod
+    def _index_email(cls, customer):
+        """Add the customer to the email index."""
+        cls._email_index.setdefault(customer.email.casefold(),
+                                    {})[customer.customer_id] = customer
+
+    @classmethod
+    def _unindex_email(cls, customer):
+        """Remove the customer from the email index."""
+        key = customer.email.casefold()
+        del cls._email_index[key][customer.customer_id]
+        if not cls._email_index[key]:
+            del cls._email_index[key]
+
+    @classmethod
+    def _check_unique_email(cls, email, customer_id=None):
+        """Raise if unique emails are enforced and the email is taken."""
+        if not cls.unique_emails:
+            return
+        owners = cls._email_index.get(email.casefold(), {})
+        if any(owner_id != customer_id for owner_id in owners):
+            raise ValueError("A customer with the given email "
+                             "already exists.")
+
+    @classmethod
+    def get_customer(cls, customer_id):
+        """Return the customer with the given ID."""
+        customer = cls._registry().get(customer_id)
+        if customer is None:
+            raise ValueError("Customer not found.")
+        return customer
+
+    @classmethod
+    def find_by_email(cls, email):
+        """Return the customers with the given email, ignoring case."""
+        cls._registry()
+        return list(cls._email_index.get(email.casefold(), {}).values())
+
+    @classmethod
+    def create_customer(cls, customer_id, name, email):
+        """Create and return a new customer."""
+        if not cls.is_valid_email(email):
+            raise ValueError("Invalid email format.")
+        return cls._add_customer(customer_id, name, email)
+
+    @classmethod
+    def _add_customer(cls, customer_id, name, email):
+        """Add a customer whose email was already validated."""
+        registry = cls._registry()
+        with cls.lock:
+            if registry.get(customer_id) is not None:
+                raise ValueError("A customer with the given ID "
+                                 "already exists.")
+            if not name:
+                raise ValueError("Name cannot be empty.")
+            cls._check_unique_email(email)
+            new_customer = cls(customer_id, name, email)
+            cls._persist('create', new_customer.to_dict())
+            registry.append(new_customer)
+            cls._index_email(new_customer)
+        return new_customer
+
+    @classmethod
+    def delete_customer(cls, customer_id):
+        """Delete a customer by ID."""
+        registry = cls._registry()
+        with cls.lock:
+            existing_customer = registry.get(customer_id)
+            if existing_customer is None:
+                raise ValueError("Customer not found.")
+            cls._persist('delete', {'customer_id': customer_id})
+            registry.remove(existing_customer)
+            cls._unindex_email(existing_customer)
+        return True
+
+    @classmethod
+    def _persist(cls, operation, data):
+        """Record the operation in the persistence backend, if any.
+
+        Called with the state lock held and before the change is applied,
+        so a backend error leaves the customer unchanged.
+        """
+        if cls.storage is not None:
+            cls.storage.record('customer', operation, data)
+
+    def modify_customer_info(self, name=None, email=None):
+        """Modify customer's name and/or email."""
+        registry = self._registry()
+        with self.lock:
+            registered = self in registry
+            if email:
+                if not self.is_valid_email(email):
+                    raise ValueError("Invalid email format.")
+                if registered:
+                    self._check_unique_email(email, self.customer_id)
+            if registered and (name or email):
+                self._persist('modify', {'customer_id': self.customer_id,
+                                         'name': name or self.name,
+                                         'email': email or self.email})
+            if name:
+                self.name = name
+            if email:
+                if registered:
+                    self._unindex_email(self)
+                self.email = email
+                if registered:
+                    self._index_email(self)
+
+    def to_dict(self):
+        """Return the customer as a JSON-ready dict."""
+        return {'customer_id': self.customer_id,
+                'name': self.name,
+                'email': self.email}
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def is_valid_email(email):
+        """Validate email format."""
+        return EMAIL_PATTERN.match(email) is not None
+
+    @staticmethod
+    def validate_emails(emails):
+        """Validate a list of emails and return the indices that fail."""
+        match = EMAIL_PATTERN.match
+        return [index for index, email in enumerate(emails)
+                if not isinstance(email, str) or match(email) is None]
+
+    @classmethod
+    def save_customers_to_file(cls, filename="customers.json"):
+        """Save all customers to a file."""
+        with open(filename, "w", encoding="utf-8") as file_handle:
+            json.dump([cust.to_dict() for cust in cls.customers],
+                      file_handle, indent=4)
+
+    @classmethod
+    def load_customers_from_file(cls, filename="customers.json"):
+        """Load customers from a file."""
+        try:
+            with open(filename, "r", encoding="utf-8") as file_handle:
+                customers_data = json.load(file_handle)
+            invalid = set(cls.validate_emails(
+                [customer_data.get('email') for customer_data
+                 in customers_data]))
+            for index, customer_data in enumerate(customers_data):
+                try:
+                    if index in invalid:
+                        raise ValueError("Invalid email format.")
+                    cls._add_customer(**customer_data)
+                except ValueError as value_error:
+                    logging.error("Error al cargar cliente: %s", value_error)
+        except FileNotFoundError:
+            logging.error("Archivo %s no encontrado. "
+                          "Se iniciará con una lista vacía.", filename)
+        except json.JSONDecodeError:
+            logging.error("Error al decodificar JSON en %s.", filename)
+        else:
+            logging.info("Customers loaded successfully.")
@@ -0,0 +1,34 @@
+"""Módulo con la representación compacta de fechas como días ordinales."""
+import datetime
+
+DATE_FORMAT = "%Y-%m-%d"
+
+
+def parse_day(text):
+    """Convierte una cadena "%Y-%m-%d" a su número de día ordinal."""
+    if len(text) == 10 and text[4] == '-' and text[7] == '-':
+        try:
+            return datetime.date.fromisoformat(text).toordinal()
+        except ValueError:
+            pass
+    # Formatos sin ceros a la izquierda u otros casos que acepta strptime
+    return datetime.datetime.strptime(text, DATE_FORMAT).toordinal()
+
+
+def to_day(value):
+    """Convierte una cadena, date, datetime u ordinal a día ordinal."""
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        return parse_day(value)
+    return value.toordinal()
+
+
+def day_to_datetime(day):
+    """Convierte un día ordinal a datetime a medianoche."""
+    return datetime.datetime.fromordinal(day)
+
+
+def format_day(day):
+    """Convierte un día ordinal a cadena "%Y-%m-%d"."""
+    return datetime.date.fromordinal(day).isoformat()
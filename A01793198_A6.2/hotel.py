@@ -1,112 +1,420 @@
-"""Módulo que representa la gestión de hoteles."""
-
-import datetime
-import json
-
-
-class Hotel:
-    """Representa un hotel en el sistema."""
-    hotels = []
-
-    def __init__(self, hotel_id, name, location):
-        """Inicializa un nuevo hotel."""
-        self.hotel_id = hotel_id
-        self.name = name
-        self.location = location
-        self.rooms = {}
-
-    @classmethod
-    def create_hotel(cls, hotel_id, name, location):
-        """Crea y añade un nuevo hotel a la lista de hoteles."""
-        if any(hotel for hotel in cls.hotels if hotel.hotel_id == hotel_id):
-            raise ValueError("A hotel with the given ID already exists.")
-        hotel = cls(hotel_id, name, location)
-        cls.hotels.append(hotel)
-        return hotel
-
-    @classmethod
-    def delete_hotel(cls, hotel_id):
-        """Elimina un hotel de la lista de hoteles."""
-        for hotel in cls.hotels:
-            if hotel.hotel_id == hotel_id:
-                cls.hotels.remove(hotel)
-                return True
-        raise ValueError("Hotel not found.")
-
-    def display_hotel_info(self):
-        """Muestra la información del hotel."""
-        print(f"Hotel ID: {self.hotel_id}, Name: {self.name}, "
-              f"Location: {self.location}, Rooms: {len(self.rooms)}")
-
-    def modify_hotel_info(self, name=None, location=None):
-        """Modifica la información del hotel."""
-        if name is not None:
-            self.name = name
-        if location is not None:
-            self.location = location
-
-    def add_room(self, room_number, capacity):
-        """Añade una habitación al hotel."""
-        if room_number in self.rooms:
-            raise ValueError("Room number already exists.")
-        self.rooms[room_number] = {'capacity': capacity, 'reservations': []}
-
-    def is_room_available(self, room_number, start_date, end_date):
-        """Verifica si una habitación está disponible."""
-        for reservation in self.rooms.get(room_number,
-                                          {}).get('reservations', []):
-            if start_date <= datetime.datetime.strptime(
-                    reservation['end_date'], "%Y-%m-%d") \
-                    and end_date >= datetime.datetime.strptime(
-                    reservation['start_date'], "%Y-%m-%d"):
-                return False
-        return True
-
-    def reserve_room(self, room_number, customer_id, start_date, end_date):
-        """Reserva una habitación en el hotel."""
-        if room_number not in self.rooms:
-            raise ValueError("Room number does not exist.")
-        if not self.is_room_available(room_number, datetime.datetime.strptime(
-                start_date, "%Y-%m-%d"),
-                                      datetime.datetime.strptime(
-                                          end_date, "%Y-%m-%d")):
-            raise ValueError("Room is not available for the selected dates.")
-        self.rooms[room_number]['reservations'].append(
-            {'customer_id': customer_id,
-             'start_date': start_date,
-             'end_date': end_date})
-
-    def cancel_reservation(self, room_number, customer_id):
-        """Cancela una reserva en el hotel."""
-        if room_number not in self.rooms:
-            raise ValueError("Room number does not exist.")
-        for reservation in self.rooms[room_number]['reservations']:
-            if reservation['customer_id'] == customer_id:
-                self.rooms[room_number]['reservations'].remove(reservation)
-                return True
-        raise ValueError("Reservation not found for the given customer ID.")
-
-    @classmethod
-    def save_hotels_to_file(cls, filename="hotels.json"):
-        """Guarda la lista de hoteles en un archivo."""
-        with open(filename, "w", encoding="utf-8") as file:
-            json.dump([hotel.__dict__ for hotel in cls.hotels], file)
-
-    @classmethod
-    def load_hotels_from_file(cls, filename="hotels.json"):
-        """Carga hoteles desde un archivo."""
-        try:
-            with open(filename, 'r', encoding="utf-8") as file:
-                hotels_data = json.load(file)
-            for hotel_data in hotels_data:
-                try:
-                    cls.create_hotel(hotel_data['hotel_id'],
-                                     hotel_data['name'],
-                                     hotel_data['location'])
-                except ValueError as error_value:
-                    print(f"Error al cargar hotel: {error_value}")
-        except FileNotFoundError:
-            print(f"Archivo {filename} no encontrado. "
-                  f"Se iniciará con una lista vacía de hoteles.")
-        except json.JSONDecodeError:
-            print(f"Error al decodificar JSON en {filename}.")
+"""Módulo que representa la gestión de hoteles."""
+
+import json
+
+from binary_snapshot import decode_hotels, encode_hotels
+from dates import format_day, parse_day, to_day
+from locks import STATE_LOCK
+from records import Room, RoomBooking, Rooms
+from registry import Registry
+from reservation import Reservation
+from room_search import RoomSearch
+
+CONFLICT = "Room is not available for the selected dates."
+
+
+class Hotel:
+    """Representa un hotel en el sistema."""
+    hotels = Registry('hotel_id')
+    # Backend de persistencia incremental (ver storage.py)
+    storage = None
+    # Índice de búsqueda por ubicación y capacidad (ver search_rooms)
+    search_index = None
+    # Candado del estado compartido con Customer y Reservation: cada cambio
+    # se aplica y se registra con él tomado (ver locks.py)
+    lock = STATE_LOCK
+    _indexed = None
+    # Las reservas de las habitaciones están en el almacén compartido con
+    # Reservation (ver booking_store.py) y muestran también sus
+    # reservaciones; los métodos que lo leen llaman antes a
+    # Reservation.booking_store() para aplicar un reinicio pendiente de
+    # Reservation.reservations. rooms guarda los números de habitación
+    # como cadena, igual que el JSON, y acepta 102 o "102" (ver Rooms).
+
+    def __init__(self, hotel_id, name, location):
+        """Inicializa un nuevo hotel."""
+        self.hotel_id = hotel_id
+        self.name = name
+        self.location = location
+        self.rooms = Rooms()
+
+    @classmethod
+    def _registry(cls):
+        """Regresa el registro de hoteles, convirtiendo la lista si cambió.
+
+        Si la lista se reemplazó (por ejemplo con Hotel.hotels = []), en la
+        siguiente operación de Hotel las reservas de los hoteles que ya no
+        están se quitan del almacén compartido y el índice de búsqueda se
+        descarta. Las reservaciones de Reservation se conservan.
+        """
+        if cls.hotels is not cls._indexed:
+            registry = cls.hotels
+            if not isinstance(registry, Registry):
+                registry = Registry('hotel_id', registry)
+            cls._release([hotel for hotel in cls._indexed or ()
+                          if hotel not in registry])
+            cls.hotels = cls._indexed = registry
+            cls.search_index = None
+        return cls.hotels
+
+    @classmethod
+    def create_hotel(cls, hotel_id, name, location):
+        """Crea y añade un nuevo hotel a la lista de hoteles."""
+        registry = cls._registry()
+        with cls.lock:
+            if registry.get(hotel_id) is not None:
+                raise ValueError("A hotel with the given ID already exists.")
+            hotel = cls(hotel_id, name, location)
+            cls._persist('create', {'hotel_id': hotel_id,
+                                    'name': name,
+                                    'location': location})
+            registry.append(hotel)
+            cls._reindex(hotel)
+        return hotel
+
+    @classmethod
+    def get_hotel(cls, hotel_id):
+        """Regresa el hotel con el ID dado."""
+        hotel = cls._registry().get(hotel_id)
+        if hotel is None:
+            raise ValueError("Hotel not found.")
+        return hotel
+
+    @classmethod
+    def delete_hotel(cls, hotel_id):
+        """Elimina un hotel de la lista de hoteles."""
+        registry = cls._registry()
+        hotel = registry.get(hotel_id)
+        if hotel is None:
+            raise ValueError("Hotel not found.")
+
+        def unregister():
+            """Quita el hotel con los candados de sus habitaciones."""
+            if hotel not in registry:
+                raise ValueError("Hotel not found.")
+            cls._persist('delete', {'hotel_id': hotel_id})
+            registry.remove(hotel)
+            if cls.search_index is not None:
+                cls.search_index.remove_hotel(hotel)
+
+        Reservation.booking_store().remove_rooms(
+            [(hotel_id, room_number) for room_number in hotel.rooms],
+            unregister)
+        return True
+
+    @classmethod
+    def _persist(cls, operation, data):
+        """Registra la operación en el backend de persistencia, si existe.
+
+        Se llama con el candado del estado tomado y antes de aplicar el
+        cambio, que no se aplica si el backend lanza una excepción.
+        """
+        if cls.storage is not None:
+            cls.storage.record('hotel', operation, data)
+
+    @classmethod
+    def _persist_many(cls, entries):
+        """Registra varias operaciones (operación, datos) como _persist.
+
+        Con un backend con record_many (Journal, SQLiteStorage) se
+        registran todas o ninguna.
+        """
+        if cls.storage is None:
+            return
+        entries = [('hotel', operation, data) for operation, data in entries]
+        record_many = getattr(cls.storage, 'record_many', None)
+        if record_many is not None:
+            record_many(entries)
+            return
+        for entry in entries:
+            cls.storage.record(*entry)
+
+    @staticmethod
+    def _release(hotels):
+        """Quita del almacén compartido las reservas de los hoteles."""
+        Reservation.booking_store().remove_rooms(
+            (hotel.hotel_id, room_number) for hotel in hotels
+            for room_number in hotel.rooms)
+
+    @classmethod
+    def _reindex(cls, hotel):
+        """Vuelve a indexar el hotel en el índice de búsqueda, si existe."""
+        if cls.search_index is not None:
+            cls.search_index.add_hotel(hotel)
+
+    @classmethod
+    def search_rooms(cls, location, min_capacity, start_date, end_date,
+                     limit=10, cursor=None):
+        """Busca habitaciones libres por ubicación, capacidad y fechas.
+
+        El índice se construye en la primera búsqueda y después se mantiene
+        al crear, modificar y eliminar hoteles y al añadir habitaciones.
+        Regresa (coincidencias, cursor) como RoomSearch.search.
+        """
+        registry = cls._registry()
+        Reservation.booking_store()
+        if cls.search_index is None:
+            cls.search_index = RoomSearch(registry)
+        return cls.search_index.search(location, min_capacity, start_date,
+                                       end_date, limit, cursor)
+
+    def display_hotel_info(self):
+        """Muestra la información del hotel."""
+        print(f"Hotel ID: {self.hotel_id}, Name: {self.name}, "
+              f"Location: {self.location}, Rooms: {len(self.rooms)}")
+
+    def modify_hotel_info(self, name=None, location=None):
+        """Modifica la información del hotel."""
+        with self.lock:
+            name = self.name if name is None else name
+            moved = location is not None and location != self.location
+            location = self.location if location is None else location
+            self._persist('modify', {'hotel_id': self.hotel_id,
+                                     'name': name,
+                                     'location': location})
+            self.name = name
+            if moved:
+                self.location = location
+                self._reindex(self)
+
+    def add_room(self, room_number, capacity):
+        """Añade una habitación al hotel."""
+        room_number = str(room_number)
+        bookings = Reservation.booking_store().room(self.hotel_id,
+                                                    room_number)
+        with self.lock:
+            if room_number in self.rooms:
+                raise ValueError("Room number already exists.")
+            self._persist('add_room', {'hotel_id': self.hotel_id,
+                                       'room_number': room_number,
+                                       'capacity': capacity})
+            self.rooms[room_number] = Room(capacity, bookings)
+            if self.search_index is not None:
+                self.search_index.add_room(self, room_number)
+
+    def is_room_available(self, room_number, start_date, end_date):
+        """Verifica si una habitación está disponible."""
+        room = self.rooms.get(room_number)
+        if room is None:
+            return True
+        Reservation.booking_store()
+        return room.calendar.is_free(to_day(start_date), to_day(end_date))
+
+    def available_rooms(self, start_date, end_date):
+        """Regresa las habitaciones disponibles en el rango de fechas."""
+        Reservation.booking_store()
+        start_day = to_day(start_date)
+        end_day = to_day(end_date)
+        return [room_number for room_number, room in self.rooms.items()
+                if room.calendar.is_free(start_day, end_day)]
+
+    def occupancy_report(self, start_date, end_date):
+        """Regresa las noches ocupadas por habitación y la ocupación total.
+
+        Cuenta las noches desde start_date hasta el día anterior a
+        end_date.
+        """
+        Reservation.booking_store()
+        start_day = to_day(start_date)
+        end_day = to_day(end_date)
+        nights = max(end_day - start_day, 0)
+        occupied = {room_number: room.calendar.occupied_nights(start_day,
+                                                               end_day)
+                    for room_number, room in self.rooms.items()}
+        total_nights = nights * len(self.rooms)
+        return {'nights': nights,
+                'rooms': occupied,
+                'occupancy_rate': sum(occupied.values()) / total_nights
+                if total_nights else 0}
+
+    def first_free_night(self, room_number, from_date):
+        """Regresa el primer día desde from_date en que se puede reservar.
+
+        Es el primer día en que reserve_room acepta una reserva de una
+        noche: como en is_room_available, el día de salida de otra reserva
+        no está libre para entrar.
+        """
+        if room_number not in self.rooms:
+            raise ValueError("Room number does not exist.")
+        Reservation.booking_store()
+        return format_day(self.rooms[room_number].calendar.first_free_start(
+            to_day(from_date)))
+
+    def reserve_room(self, room_number, customer_id, start_date, end_date):
+        """Reserva una habitación en el hotel.
+
+        La verificación de disponibilidad y el alta se hacen en el almacén
+        compartido bajo el candado de la habitación, así que dos hilos no
+        pueden reservar noches solapadas de la misma habitación, ni con
+        Hotel ni con Reservation. Si una reservación de Reservation ya tiene
+        la misma estancia (mismo cliente y fechas), el hotel la comparte.
+        """
+        if room_number not in self.rooms:
+            raise ValueError("Room number does not exist.")
+        start_day = parse_day(start_date)
+        end_day = parse_day(end_date)
+        if start_day >= end_day:
+            raise ValueError("End date must be after start date.")
+        Reservation.booking_store().add_room_booking(
+            self.hotel_id, room_number,
+            RoomBooking(customer_id, start_day, end_day), CONFLICT,
+            lambda: self._persist('reserve', {
+                'hotel_id': self.hotel_id,
+                'room_number': room_number,
+                'customer_id': customer_id,
+                'start_date': format_day(start_day),
+                'end_date': format_day(end_day)}))
+
+    def cancel_reservation(self, room_number, customer_id):
+        """Cancela la primera reserva del cliente en la habitación.
+
+        Solo cancela reservas hechas con reserve_room; las reservaciones de
+        Reservation se cancelan con Reservation.cancel_reservation, y una
+        estancia compartida con una de ellas la conserva.
+        """
+        if room_number not in self.rooms:
+            raise ValueError("Room number does not exist.")
+        if Reservation.booking_store().remove_room_booking(
+                self.hotel_id, room_number, customer_id,
+                lambda: self._persist('cancel', {
+                    'hotel_id': self.hotel_id,
+                    'room_number': room_number,
+                    'customer_id': customer_id})):
+            return True
+        raise ValueError("Reservation not found for the given customer ID.")
+
+    def to_dict(self, shared=True):
+        """Regresa el hotel en el formato de diccionario del JSON.
+
+        Las habitaciones llevan solo sus reservas de Hotel; las
+        reservaciones de Reservation se guardan con esa clase. Con
+        shared=False se omiten también las estancias que el hotel comparte
+        con una reservación (ver storage.snapshot).
+        """
+        return {'hotel_id': self.hotel_id,
+                'name': self.name,
+                'location': self.location,
+                'rooms': {room_number: room.to_dict(shared)
+                          for room_number, room in self.rooms.items()}}
+
+    @classmethod
+    def from_dict(cls, data):
+        """Crea un hotel con sus habitaciones y reservas desde un diccionario.
+
+        Las reservas se validan entre sí y contra las que ya ocupan las
+        habitaciones, y el hotel se registra antes de agregarlas, así que un
+        registro inválido no deja un hotel a medias. Con un backend de
+        persistencia se registran también cada habitación y cada reserva.
+        """
+        hotel_id = data['hotel_id']
+        # Si la lista se reemplazó, primero se liberan las habitaciones
+        cls._registry()
+        store = Reservation.booking_store()
+        rooms = {}
+        bookings = {}
+        entries = []
+        for room_number, room in data.get('rooms', {}).items():
+            room_number = str(room_number)
+            rooms[room_number] = room['capacity']
+            bookings[(hotel_id, room_number)] = []
+            entries.append(('add_room', {'hotel_id': hotel_id,
+                                         'room_number': room_number,
+                                         'capacity': room['capacity']}))
+            for booking in room['reservations']:
+                start_day = parse_day(booking['start_date'])
+                end_day = parse_day(booking['end_date'])
+                if start_day >= end_day:
+                    raise ValueError("End date must be after start date.")
+                room_booking = RoomBooking(booking['customer_id'],
+                                           start_day, end_day)
+                bookings[(hotel_id, room_number)].append(room_booking)
+                entries.append(('reserve', dict(room_booking.to_dict(),
+                                                hotel_id=hotel_id,
+                                                room_number=room_number)))
+
+        def register():
+            """Crea el hotel y registra sus habitaciones y reservas.
+
+            Si el registro falla, el hotel queda sin habitaciones tanto en
+            memoria como en el backend.
+            """
+            created = cls.create_hotel(hotel_id, data['name'],
+                                       data['location'])
+            cls._persist_many(entries)
+            return created
+
+        hotel = store.add_room_bookings(bookings, CONFLICT, register)
+        hotel.rooms = Rooms(
+            (room_number, Room(capacity, store.room(hotel_id, room_number)))
+            for room_number, capacity in rooms.items())
+        cls._reindex(hotel)
+        return hotel
+
+    @classmethod
+    def save_snapshot(cls, filename="hotels.snapshot"):
+        """Guarda hoteles, habitaciones y reservas en formato binario."""
+        data = encode_hotels(list(cls.hotels))
+        with open(filename, "wb") as file:
+            file.write(data)
+
+    @classmethod
+    def load_snapshot(cls, filename="hotels.snapshot"):
+        """Reemplaza los hoteles por los de un snapshot binario.
+
+        Las reservas del snapshot se validan en una sola pasada contra el
+        almacén sin las de los hoteles anteriores, y solo si no hay
+        conflictos se cambian los hoteles; las reservaciones de
+        Reservation se conservan. No se registra en la persistencia, así
+        que con un backend conectado lanza ValueError.
+        """
+        if cls.storage is not None:
+            raise ValueError("Detach the persistence backend before "
+                             "loading a snapshot.")
+        with open(filename, "rb") as file:
+            hotels_data = decode_hotels(file.read())
+        previous = cls._registry()
+        store = Reservation.booking_store()
+        registry = Registry('hotel_id')
+        bookings = {}
+        for hotel_id, name, location, rooms in hotels_data:
+            hotel = cls(hotel_id, name, location)
+            for room_number, capacity, room_bookings in rooms:
+                room_number = str(room_number)
+                hotel.rooms[room_number] = Room(
+                    capacity, store.room(hotel_id, room_number))
+                bookings[(hotel_id, room_number)] = [
+                    RoomBooking(*booking) for booking in room_bookings]
+            registry.append(hotel)
+
+        def swap():
+            """Cambia los hoteles con los candados de las habitaciones."""
+            cls.hotels = cls._indexed = registry
+            cls.search_index = None
+
+        store.add_room_bookings(
+            bookings, CONFLICT, swap,
+            replace=[(hotel.hotel_id, room_number) for hotel in previous
+                     for room_number in hotel.rooms])
+
+    @classmethod
+    def save_hotels_to_file(cls, filename="hotels.json"):
+        """Guarda la lista de hoteles en un archivo."""
+        with open(filename, "w", encoding="utf-8") as file:
+            json.dump([hotel.to_dict() for hotel in cls.hotels], file)
+
+    @classmethod
+    def load_hotels_from_file(cls, filename="hotels.json"):
+        """Carga hoteles desde un archivo."""
+        try:
+            with open(filename, 'r', encoding="utf-8") as file:
+                hotels_data = json.load(file)
+            for hotel_data in hotels_data:
+                try:
+                    cls.from_dict(hotel_data)
+                except ValueError as error_value:
+                    print(f"Error al cargar hotel: {error_value}")
+        except FileNotFoundError:
+            print(f"Archivo {filename} no encontrado. "
+                  f"Se iniciará con una lista vacía de hoteles.")
+        except json.JSONDecodeError:
+            print(f"Error al decodificar JSON en {filename}.")
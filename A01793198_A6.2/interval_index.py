@@ -0,0 +1,137 @@
+"""Módulo con un índice ordenado de intervalos de fechas."""
+import bisect
+from collections import Counter
+
+# Un lote de menos de 1/16 del índice se inserta o se quita elemento por
+# elemento; uno mayor reconstruye las listas en una sola pasada.
+BATCH_RATIO = 16
+
+
+class IntervalIndex:
+    """Índice de intervalos cerrados [inicio, fin] ordenado por inicio.
+
+    Las consultas de solapamiento hacen búsqueda binaria sobre los inicios
+    y solo revisan los intervalos que empiezan entre start menos la
+    duración máxima actual y end: cuestan O(log n + m), con m esos
+    intervalos revisados. Con duraciones acotadas m es cercano al número
+    de resultados; una sola estancia muy larga agranda la ventana hasta
+    que se elimina.
+    """
+
+    def __init__(self):
+        """Inicializa un índice vacío."""
+        self._starts = []
+        self._ends = []
+        self._items = []
+        # Intervalos por duración, para recalcular la máxima al eliminar
+        self._spans = Counter()
+        self._max_span = 0
+
+    def __len__(self):
+        """Regresa el número de intervalos en el índice."""
+        return len(self._items)
+
+    def __iter__(self):
+        """Itera los elementos en orden de fecha de inicio."""
+        return iter(self._items)
+
+    def __getitem__(self, position):
+        """Regresa el elemento en la posición dada, en orden de inicio."""
+        return self._items[position]
+
+    def clear(self):
+        """Elimina todos los intervalos."""
+        self._starts = []
+        self._ends = []
+        self._items = []
+        self._spans = Counter()
+        self._max_span = 0
+
+    def _count_spans(self):
+        """Recalcula las duraciones desde las listas completas."""
+        self._spans = Counter(end - start for start, end in
+                              zip(self._starts, self._ends))
+        self._max_span = max(self._spans, default=0)
+
+    def _discard_span(self, span):
+        """Descuenta una duración y recalcula la máxima si se agotó."""
+        self._spans[span] -= 1
+        if not self._spans[span]:
+            del self._spans[span]
+            if span == self._max_span:
+                self._max_span = max(self._spans, default=0)
+
+    def add(self, start, end, item):
+        """Agrega un intervalo con su elemento asociado."""
+        position = bisect.bisect_right(self._starts, start)
+        self._starts.insert(position, start)
+        self._ends.insert(position, end)
+        self._items.insert(position, item)
+        self._spans[end - start] += 1
+        self._max_span = max(self._max_span, end - start)
+
+    def extend(self, entries):
+        """Agrega muchos intervalos (inicio, fin, elemento) a la vez."""
+        entries = list(entries)
+        if len(entries) * BATCH_RATIO < len(self._items):
+            for start, end, item in entries:
+                self.add(start, end, item)
+            return
+        merged = list(zip(self._starts, self._ends, self._items))
+        merged.extend(entries)
+        merged.sort(key=lambda entry: entry[0])
+        self._starts = [entry[0] for entry in merged]
+        self._ends = [entry[1] for entry in merged]
+        self._items = [entry[2] for entry in merged]
+        self._count_spans()
+
+    def remove(self, start, item):
+        """Elimina el intervalo que inicia en start asociado al elemento."""
+        position = bisect.bisect_left(self._starts, start)
+        while position < len(self._starts) \
+                and self._starts[position] == start:
+            if self._items[position] is item:
+                self._discard_span(self._ends[position] - start)
+                del self._starts[position]
+                del self._ends[position]
+                del self._items[position]
+                return
+            position += 1
+        raise ValueError("Interval not found.")
+
+    def remove_many(self, entries):
+        """Elimina muchos intervalos (inicio, elemento) a la vez."""
+        entries = list(entries)
+        if len(entries) * BATCH_RATIO < len(self._items):
+            for start, item in entries:
+                self.remove(start, item)
+            return
+        removed = {id(item) for _, item in entries}
+        kept = [position for position, item in enumerate(self._items)
+                if id(item) not in removed]
+        if len(kept) != len(self._items) - len(removed):
+            raise ValueError("Interval not found.")
+        self._starts = [self._starts[position] for position in kept]
+        self._ends = [self._ends[position] for position in kept]
+        self._items = [self._items[position] for position in kept]
+        self._count_spans()
+
+    def overlapping(self, start, end):
+        """Genera los elementos cuyo intervalo se solapa con [start, end]."""
+        first = bisect.bisect_left(self._starts, start - self._max_span)
+        stop = bisect.bisect_right(self._starts, end)
+        for position in range(first, stop):
+            if self._ends[position] >= start:
+                yield self._items[position]
+
+    def starting_between(self, low, high):
+        """Regresa los elementos cuyo inicio está entre low y high."""
+        first = bisect.bisect_left(self._starts, low)
+        stop = bisect.bisect_right(self._starts, high)
+        return self._items[first:stop]
+
+    def overlaps(self, start, end):
+        """Verifica si algún intervalo se solapa con [start, end]."""
+        for _ in self.overlapping(start, end):
+            return True
+        return False
@@ -0,0 +1,150 @@
+"""Módulo con la bitácora de solo anexado para persistencia incremental."""
+import json
+import os
+import threading
+
+
+class Journal:
+    """Bitácora JSON Lines con snapshots periódicos.
+
+    Cada operación agrega una línea a <path>.log.jsonl, por lo que guardar
+    un cambio cuesta O(1) de E/S. La compactación escribe el estado
+    completo en <path>.snapshot.json y vacía la bitácora. Cada entrada
+    lleva un número de secuencia y el snapshot guarda el último que
+    incluye, así que una compactación interrumpida no duplica cambios.
+    """
+
+    def __init__(self, path, compact_every=None, sync=False):
+        """Abre la bitácora con prefijo de archivos path.
+
+        compact_every indica cada cuántas operaciones se compacta usando
+        snapshot_source; sync fuerza os.fsync después de cada escritura.
+        """
+        self.snapshot_path = path + ".snapshot.json"
+        self.log_path = path + ".log.jsonl"
+        self.compact_every = compact_every
+        self.sync = sync
+        self.snapshot_source = None
+        snapshot = self._read_snapshot()
+        entries, valid_end = self._read_log(snapshot.get('seq', 0))
+        # Una escritura cortada deja una línea incompleta al final; se
+        # quita para que la siguiente entrada no quede pegada a ella
+        if os.path.exists(self.log_path) \
+                and os.path.getsize(self.log_path) > valid_end:
+            os.truncate(self.log_path, valid_end)
+        self._seq = entries[-1]['seq'] if entries else snapshot.get('seq', 0)
+        self._pending = len(entries)
+        self._file = None
+        # Las clases llaman record desde varios hilos
+        self._lock = threading.RLock()
+
+    def load(self):
+        """Regresa el último snapshot y las entradas posteriores a él."""
+        snapshot = self._read_snapshot()
+        entries, _ = self._read_log(snapshot.get('seq', 0))
+        return snapshot, entries
+
+    def _read_snapshot(self):
+        """Regresa el último snapshot o un diccionario vacío."""
+        try:
+            with open(self.snapshot_path, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
+
+    def _read_log(self, after):
+        """Regresa las entradas con seq mayor que after y el fin de la
+        última línea completa, en bytes.
+
+        Una línea sin salto final o que no es JSON válido viene de una
+        escritura cortada: la lectura se detiene ahí.
+        """
+        entries = []
+        valid_end = 0
+        try:
+            with open(self.log_path, "rb") as file:
+                for line in file:
+                    if not line.endswith(b"\n"):
+                        break
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        break
+                    valid_end += len(line)
+                    if entry['seq'] > after:
+                        entries.append(entry)
+        except FileNotFoundError:
+            pass
+        return entries, valid_end
+
+    def record(self, entity, operation, data):
+        """Anexa una operación al final de la bitácora.
+
+        Las clases la llaman antes de aplicar el cambio, así que una
+        compactación pendiente se hace antes de anexar la entrada: el
+        snapshot incluye todas las anteriores y esta queda en la bitácora.
+        """
+        self.record_many([(entity, operation, data)])
+
+    def record_many(self, entries):
+        """Anexa varias operaciones (entity, operation, data) a la vez.
+
+        Se escriben en una sola escritura; si falla, la bitácora se trunca
+        a su tamaño anterior, así que quedan todas las entradas o ninguna.
+        """
+        with self._lock:
+            if self.compact_every and self.snapshot_source is not None \
+                    and self._pending >= self.compact_every:
+                self.compact(self.snapshot_source())
+            if self._file is None:
+                # pylint: disable=consider-using-with
+                self._file = open(self.log_path, "a", encoding="utf-8")
+            seq = self._seq
+            lines = []
+            for entity, operation, data in entries:
+                seq += 1
+                lines.append(json.dumps({'seq': seq,
+                                         'entity': entity,
+                                         'op': operation,
+                                         'data': data}) + "\n")
+            size = os.fstat(self._file.fileno()).st_size
+            try:
+                self._file.write("".join(lines))
+                self._file.flush()
+                if self.sync:
+                    os.fsync(self._file.fileno())
+            except OSError:
+                self._truncate(size)
+                raise
+            self._seq = seq
+            self._pending += len(lines)
+
+    def _truncate(self, size):
+        """Cierra el archivo y descarta lo escrito después de size bytes."""
+        try:
+            self._file.close()
+        except OSError:
+            pass
+        self._file = None
+        os.truncate(self.log_path, size)
+
+    def compact(self, state):
+        """Escribe el estado como snapshot atómico y vacía la bitácora."""
+        with self._lock:
+            snapshot = dict(state, seq=self._seq)
+            temporary = self.snapshot_path + ".tmp"
+            with open(temporary, "w", encoding="utf-8") as file:
+                json.dump(snapshot, file)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temporary, self.snapshot_path)
+            self.close()
+            with open(self.log_path, "w", encoding="utf-8"):
+                pass
+            self._pending = 0
+
+    def close(self):
+        """Cierra el archivo de la bitácora."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
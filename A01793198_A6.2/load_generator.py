@@ -0,0 +1,138 @@
+"""Generador de carga para booking_service con latencias p50 y p99.
+
+Abre varios clientes concurrentes con conexiones keep-alive que mezclan
+reservas (60 %), consultas de disponibilidad (30 %) y cancelaciones
+(10 %). Sin puerto, levanta el servicio en el mismo proceso con un
+journal temporal.
+Uso: python load_generator.py [clientes] [peticiones_por_cliente] [puerto]
+"""
+import asyncio
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from collections import Counter
+
+from booking_service import BookingService
+from dates import format_day, to_day
+from journal import Journal
+from reservation import Reservation
+
+FIRST_DAY = to_day("2024-01-01")
+HOTELS = 10
+ROOMS = 50
+
+
+async def request(reader, writer, method, path, body=None):
+    """Envía una petición y regresa (estado HTTP, cuerpo JSON)."""
+    content = json.dumps(body).encode("utf-8") if body is not None else b""
+    writer.write(f"{method} {path} HTTP/1.1\r\n"
+                 f"Host: localhost\r\n"
+                 f"Content-Length: {len(content)}\r\n\r\n".encode("latin-1")
+                 + content)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        header = await reader.readline()
+        if header in (b"\r\n", b""):
+            break
+        name, _, value = header.decode("latin-1").partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    return status, json.loads(await reader.readexactly(length))
+
+
+def random_booking(generator, reservation_id):
+    """Regresa una reservación al azar en algún hotel de la carga."""
+    start = FIRST_DAY + generator.randrange(365)
+    return {'reservation_id': reservation_id,
+            'hotel_id': f"H{generator.randrange(HOTELS)}",
+            'room_number': generator.randrange(ROOMS),
+            'customer_id': f"C{generator.randrange(1000)}",
+            'start_date': format_day(start),
+            'end_date': format_day(start + generator.randint(1, 7))}
+
+
+async def client(number, num_requests, port, latencies, statuses):
+    """Envía num_requests peticiones por una conexión y mide cada una."""
+    generator = random.Random(number)
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    created = []
+    for attempt in range(num_requests):
+        choice = generator.random()
+        if choice < 0.1 and created:
+            method, path, body = ("DELETE", f"/reservations/"
+                                  f"{created.pop()}", None)
+        elif choice < 0.4:
+            booking = random_booking(generator, "")
+            method, body = "GET", None
+            path = (f"/availability?hotel_id={booking['hotel_id']}"
+                    f"&room_number={booking['room_number']}"
+                    f"&start_date={booking['start_date']}"
+                    f"&end_date={booking['end_date']}")
+        else:
+            method, path = "POST", "/reservations"
+            body = random_booking(generator, f"L{number}-{attempt}")
+        started = time.perf_counter()
+        status, _ = await request(reader, writer, method, path, body)
+        latencies.append(time.perf_counter() - started)
+        statuses[status] += 1
+        if method == "POST" and status == 201:
+            created.append(body['reservation_id'])
+    writer.close()
+    await writer.wait_closed()
+
+
+def percentile(values, fraction):
+    """Regresa el percentil (0-1) de una lista ordenada."""
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+async def run(num_clients, num_requests, port=None):
+    """Ejecuta la carga y regresa (latencias, estados, segundos, lotes)."""
+    service = directory = journal = None
+    if port is None:
+        directory = tempfile.mkdtemp()
+        journal = Journal(os.path.join(directory, "load"))
+        Reservation.reservations = []
+        service = BookingService(journal)
+        port = await service.start(port=0)
+    latencies = []
+    statuses = Counter()
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(*(client(number, num_requests, port,
+                                      latencies, statuses)
+                               for number in range(num_clients)))
+    finally:
+        elapsed = time.perf_counter() - started
+        if service is not None:
+            await service.close()
+            journal.close()
+            shutil.rmtree(directory)
+    return sorted(latencies), statuses, elapsed, \
+        service.batches if service is not None else None
+
+
+def main(num_clients, num_requests, port=None):
+    """Ejecuta la carga e imprime el resumen de latencias."""
+    latencies, statuses, elapsed, batches = asyncio.run(
+        run(num_clients, num_requests, port))
+    print(f"Requests: {len(latencies)} in {elapsed:.2f} s "
+          f"({len(latencies) / elapsed:,.0f} req/s)")
+    print(f"p50: {percentile(latencies, 0.50) * 1000:.2f} ms  "
+          f"p99: {percentile(latencies, 0.99) * 1000:.2f} ms")
+    print("Status: " + ", ".join(f"{status}={count}" for status, count
+                                 in sorted(statuses.items())))
+    if batches is not None:
+        print(f"Write batches: {batches}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 200,
+         int(sys.argv[3]) if len(sys.argv) > 3 else None)
@@ -0,0 +1,36 @@
+"""Módulo con los candados por habitación para reservas concurrentes."""
+import threading
+
+
+class LockTable:
+    """Tabla de candados creados bajo demanda, uno por llave.
+
+    Las reservas toman el candado de su (hotel_id, room_number), así que
+    dos hilos que reservan habitaciones distintas avanzan en paralelo y
+    solo se serializan las operaciones sobre la misma habitación.
+    """
+
+    def __init__(self):
+        """Inicializa la tabla sin candados."""
+        self._locks = {}
+        self._guard = threading.Lock()
+
+    def __len__(self):
+        """Regresa el número de candados creados."""
+        return len(self._locks)
+
+    def lock(self, key):
+        """Regresa el candado de la llave, creándolo si no existe."""
+        lock = self._locks.get(key)
+        if lock is None:
+            with self._guard:
+                lock = self._locks.setdefault(key, threading.Lock())
+        return lock
+
+
+# Candado del estado en memoria de Hotel, Customer y Reservation. Cada
+# cambio se registra en la persistencia y luego se aplica con él tomado, y
+# storage.snapshot lo toma para copiar el estado, así que un snapshot no
+# incluye cambios cuyo registro aún no se escribió. Se toma después de los
+# candados de habitación, nunca antes.
+STATE_LOCK = threading.RLock()
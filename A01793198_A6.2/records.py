@@ -0,0 +1,203 @@
+"""Módulo con los registros compactos de habitaciones y sus reservas."""
+from dates import format_day
+from interval_index import IntervalIndex
+from room_calendar import RoomCalendar
+
+
+def stay_value(booking, key):
+    """Regresa un campo de la estancia en el formato de diccionario del JSON.
+
+    Sirve a RoomBooking y a Reservation, que las habitaciones de Hotel
+    muestran como reservas (ver RoomBookings).
+    """
+    if key == 'customer_id':
+        return booking.customer_id
+    if key == 'start_date':
+        return format_day(booking.start_day)
+    if key == 'end_date':
+        return format_day(booking.end_day)
+    raise KeyError(key)
+
+
+def stay_dict(booking):
+    """Regresa la estancia en el formato de reserva de habitación del JSON."""
+    return {'customer_id': booking.customer_id,
+            'start_date': format_day(booking.start_day),
+            'end_date': format_day(booking.end_day)}
+
+
+class RoomBooking:
+    """Reserva de una habitación con fechas como días ordinales.
+
+    Es una reserva hecha solo con Hotel.reserve_room, así que siempre es
+    del hotel.
+    """
+    __slots__ = ('customer_id', 'start_day', 'end_day')
+    held_by_hotel = True
+
+    def __init__(self, customer_id, start_day, end_day):
+        """Inicializa una reserva de habitación."""
+        self.customer_id = customer_id
+        self.start_day = start_day
+        self.end_day = end_day
+
+    def __getitem__(self, key):
+        """Permite el acceso por llave del formato de diccionario."""
+        return stay_value(self, key)
+
+    def to_dict(self):
+        """Regresa la reserva en el formato de diccionario del JSON."""
+        return stay_dict(self)
+
+
+class RoomBookings:
+    """Reservas de una habitación con su índice y su calendario.
+
+    Hay un solo registro por estancia: un RoomBooking si solo la tiene el
+    hotel, o la reservación de Reservation, cuyo held_by_hotel indica si
+    el hotel también la tiene (ver booking_store.py). Agregar o quitar un
+    registro actualiza el índice por fechas y el calendario de noches en
+    un solo paso. Se itera en orden de fecha de inicio.
+    """
+    __slots__ = ('index', 'calendar')
+
+    def __init__(self):
+        """Inicializa una habitación sin reservas."""
+        self.index = IntervalIndex()
+        self.calendar = RoomCalendar()
+
+    def __len__(self):
+        """Regresa el número de reservas."""
+        return len(self.index)
+
+    def __iter__(self):
+        """Itera las reservas en orden de fecha de inicio."""
+        return iter(self.index)
+
+    def __getitem__(self, position):
+        """Regresa la reserva en la posición dada."""
+        return self.index[position]
+
+    def append(self, booking):
+        """Agrega una reserva sin verificar conflictos."""
+        self.index.add(booking.start_day, booking.end_day, booking)
+        self.calendar.occupy(booking.start_day, booking.end_day)
+
+    def extend(self, bookings):
+        """Agrega muchas reservas ordenando el índice una sola vez."""
+        bookings = list(bookings)
+        self.index.extend((booking.start_day, booking.end_day, booking)
+                          for booking in bookings)
+        for booking in bookings:
+            self.calendar.occupy(booking.start_day, booking.end_day)
+
+    def remove(self, booking):
+        """Quita una reserva del índice y libera sus noches."""
+        self.index.remove(booking.start_day, booking)
+        self.calendar.release(booking.start_day, booking.end_day)
+
+    def replace(self, old, new):
+        """Cambia el registro de una estancia por otro con las mismas fechas.
+
+        El calendario no cambia.
+        """
+        self.index.remove(old.start_day, old)
+        self.index.add(new.start_day, new.end_day, new)
+
+    def clear(self):
+        """Quita todas las reservas y libera todas las noches."""
+        self.calendar.clear()
+        self.index.clear()
+
+    def is_free(self, start_day, end_day):
+        """Verifica si ninguna reserva toca el rango de días."""
+        return self.calendar.is_free(start_day, end_day)
+
+    def same_stay(self, customer_id, start_day, end_day):
+        """Regresa el registro del cliente con las mismas fechas o None."""
+        for booking in self.index.starting_between(start_day, start_day):
+            if booking.customer_id == customer_id \
+                    and booking.end_day == end_day:
+                return booking
+        return None
+
+    def held_by_hotel(self):
+        """Regresa las reservas que tiene el hotel, en orden de inicio."""
+        return [booking for booking in self.index if booking.held_by_hotel]
+
+
+class Room:
+    """Habitación con su capacidad y sus reservas.
+
+    Las reservas de una habitación de hotel están en el almacén compartido
+    (ver booking_store.py) e incluyen las reservaciones de Reservation;
+    una habitación suelta tiene las suyas.
+    """
+    __slots__ = ('capacity', 'bookings')
+
+    def __init__(self, capacity, bookings=None):
+        """Inicializa una habitación con sus reservas o sin reservas."""
+        self.capacity = capacity
+        self.bookings = RoomBookings() if bookings is None else bookings
+
+    @property
+    def reservations(self):
+        """Reservas de la habitación en orden de fecha de inicio."""
+        return self.bookings
+
+    @property
+    def index(self):
+        """Índice de las reservas por fechas."""
+        return self.bookings.index
+
+    @property
+    def calendar(self):
+        """Calendario de noches ocupadas."""
+        return self.bookings.calendar
+
+    def __getitem__(self, key):
+        """Permite el acceso por llave del formato de diccionario."""
+        if key in ('capacity', 'reservations'):
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def to_dict(self, shared=True):
+        """Regresa la habitación en el formato de diccionario del JSON.
+
+        Lleva solo las reservas que tiene el hotel; con shared=False omite
+        también las que son además reservaciones de Reservation.
+        """
+        return {'capacity': self.capacity,
+                'reservations': [stay_dict(booking)
+                                 for booking in self.bookings.held_by_hotel()
+                                 if shared
+                                 or isinstance(booking, RoomBooking)]}
+
+
+class Rooms(dict):
+    """Habitaciones de un hotel por número.
+
+    Los números se guardan como cadena, igual que en el JSON, así que 102
+    y "102" nombran la misma habitación.
+    """
+    __slots__ = ()
+
+    def __getitem__(self, room_number):
+        """Regresa la habitación con el número dado."""
+        return super().__getitem__(str(room_number))
+
+    def __setitem__(self, room_number, room):
+        """Guarda la habitación con el número como cadena."""
+        super().__setitem__(str(room_number), room)
+
+    def __delitem__(self, room_number):
+        """Quita la habitación con el número dado."""
+        super().__delitem__(str(room_number))
+
+    def __contains__(self, room_number):
+        """Verifica si existe la habitación con el número dado."""
+        return super().__contains__(str(room_number))
+
+    def get(self, room_number, default=None):
+        """Regresa la habitación con el número dado o default."""
+        return super().get(str(room_number), default)
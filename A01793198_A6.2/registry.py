@@ -0,0 +1,69 @@
+"""Módulo con una colección de registros indexada por llave."""
+
+
+class Registry:
+    """Colección ordenada de registros indexada por uno de sus atributos.
+
+    Se usa como la lista original (len, iteración, índice numérico,
+    append y remove), pero buscar, agregar y eliminar por llave cuestan
+    O(1) porque los registros se guardan en un diccionario. El índice
+    numérico arma una lista de los registros en el primer acceso después
+    de cada alta o baja (O(n)) y la reutiliza mientras no haya cambios.
+
+    La colección solo mantiene su índice por llave. Los índices de Hotel
+    y Customer (búsqueda de habitaciones, correos) y la persistencia solo
+    se actualizan con los métodos de esas clases; un append o remove
+    directo sobre Hotel.hotels o Customer.customers no pasa por ellos y
+    debe evitarse. Reemplazar la lista completa (Hotel.hotels = [...]) sí
+    reconstruye los índices en la siguiente operación de la clase.
+    """
+
+    def __init__(self, key, items=()):
+        """Inicializa la colección con el nombre del atributo llave."""
+        self.key = key
+        self._items = {}
+        self._order = None
+        for item in items:
+            self.append(item)
+
+    def __len__(self):
+        """Regresa el número de registros."""
+        return len(self._items)
+
+    def __iter__(self):
+        """Itera los registros en orden de inserción."""
+        return iter(self._items.values())
+
+    def __getitem__(self, position):
+        """Regresa el registro en la posición dada, como una lista."""
+        if position < 0:
+            position += len(self._items)
+        if not 0 <= position < len(self._items):
+            raise IndexError("Registry index out of range.")
+        if self._order is None:
+            self._order = list(self._items.values())
+        return self._order[position]
+
+    def __contains__(self, item):
+        """Verifica si el registro está en la colección."""
+        return self._items.get(getattr(item, self.key)) is item
+
+    def get(self, key, default=None):
+        """Regresa el registro con la llave dada."""
+        return self._items.get(key, default)
+
+    def append(self, item):
+        """Agrega un registro cuya llave no exista."""
+        key = getattr(item, self.key)
+        if key in self._items:
+            raise ValueError(f"Duplicate {self.key}: {key}.")
+        self._items[key] = item
+        self._order = None
+
+    def remove(self, item):
+        """Elimina el registro de la colección."""
+        key = getattr(item, self.key)
+        if self._items.get(key) is not item:
+            raise ValueError("Item not found.")
+        del self._items[key]
+        self._order = None
@@ -1,126 +1,286 @@
-"""Módulo que representa la gestión de Reservaciones."""
-from dataclasses import dataclass
-import json
-import datetime
-
-
-@dataclass
-class ReservationData:
-    """Clase para encapsular datos de reservación."""
-    reservation_id: str
-    hotel_id: str
-    room_number: int
-    customer_id: str
-    start_date: datetime.datetime
-    end_date: datetime.datetime
-
-
-class Reservation:
-    """Clase para manejar reservaciones."""
-    reservations = []
-
-    def __init__(self, reservation_data: ReservationData):
-        """Inicializa una nueva reservación."""
-        self.reservation_id = reservation_data.reservation_id
-        self.hotel_id = reservation_data.hotel_id
-        self.room_number = reservation_data.room_number
-        self.customer_id = reservation_data.customer_id
-        self.start_date = datetime.datetime.strptime(reservation_data.
-                                                     start_date,
-                                                     "%Y-%m-%d")
-        self.end_date = datetime.datetime.strptime(reservation_data.end_date,
-                                                   "%Y-%m-%d")
-        if self.start_date >= self.end_date:
-            raise ValueError("The start date must be before the end date.")
-
-    @classmethod
-    def create_reservation(cls, reservation_data: ReservationData):
-        """Crea y agrega una nueva reservación a la lista de reservaciones."""
-        start_date_dt = datetime.datetime.strptime(reservation_data.
-                                                   start_date,
-                                                   "%Y-%m-%d")
-        end_date_dt = datetime.datetime.strptime(reservation_data.end_date,
-                                                 "%Y-%m-%d")
-
-        if any(reservation for reservation in cls.reservations
-               if reservation.reservation_id ==
-                reservation_data.reservation_id):
-            raise ValueError("A reservation with the given ID already exists.")
-        if start_date_dt >= end_date_dt:
-            raise ValueError("End date must be after start date.")
-
-        for reservation in cls.reservations:
-            if reservation.room_number == reservation_data.room_number \
-                    and reservation.hotel_id == reservation_data.hotel_id:
-                if not (start_date_dt > reservation.end_date
-                        or end_date_dt < reservation.start_date):
-                    raise ValueError("The room is already booked"
-                                     " for the selected dates.")
-
-        reservation = cls(reservation_data)
-        cls.reservations.append(reservation)
-        return reservation
-
-    @classmethod
-    def cancel_reservation(cls, reservation_id):
-        """Cancela una reservación existente."""
-        reservation = next((res for res in cls.reservations
-                            if res.reservation_id == reservation_id), None)
-        if reservation:
-            cls.reservations.remove(reservation)
-        else:
-            raise ValueError("Reservation not found.")
-
-    def modify_reservation(self, start_date=None, end_date=None):
-        """Modifica las fechas de una reservación existente."""
-        if start_date:
-            self.start_date = datetime.datetime.strptime(start_date,
-                                                         "%Y-%m-%d")
-        if end_date:
-            self.end_date = datetime.datetime.strptime(end_date, "%Y-%m-%d")
-        if self.start_date >= self.end_date:
-            raise ValueError("End date must be after start date.")
-
-    def display_reservation_info(self):
-        """Muestra la información de la reservación."""
-        print(f"Reservation ID: {self.reservation_id}, "
-              f"Hotel ID: {self.hotel_id}, "
-              f"Room Number: {self.room_number}, "
-              f"Customer ID: {self.customer_id}, "
-              f"Start Date: {self.start_date.strftime('%Y-%m-%d')}, "
-              f"End Date: {self.end_date.strftime('%Y-%m-%d')}")
-
-    @classmethod
-    def save_reservations_to_file(cls, filename):
-        """Guarda las reservaciones actuales en un archivo."""
-        with open(filename, "w", encoding='utf-8') as file:
-            data = [{
-                'reservation_id': r.reservation_id,
-                'hotel_id': r.hotel_id,
-                'room_number': r.room_number,
-                'customer_id': r.customer_id,
-                'start_date': r.start_date.strftime("%Y-%m-%d"),
-                'end_date': r.end_date.strftime("%Y-%m-%d")
-            } for r in cls.reservations]
-            json.dump(data, file, indent=4)
-
-    @classmethod
-    def load_reservations_from_file(cls, filename="reservations.json"):
-        """Carga reservaciones desde un archivo."""
-        try:
-            with open(filename, "r", encoding='utf-8') as file:
-                reservations_data = json.load(file)
-                for data in reservations_data:
-                    reservation_data = ReservationData(
-                        data['reservation_id'],
-                        data['hotel_id'],
-                        data['room_number'],
-                        data['customer_id'],
-                        data['start_date'],
-                        data['end_date']
-                    )
-                    cls.create_reservation(reservation_data)
-        except FileNotFoundError:
-            print("No previous reservation data found.")
-        except json.JSONDecodeError:
-            print(f"Error al decodificar JSON en {filename}.")
+"""Módulo que representa la gestión de Reservaciones."""
+from dataclasses import dataclass, field, replace
+import json
+import datetime
+
+from booking_store import BookingStore
+from dates import day_to_datetime, format_day, to_day
+from records import stay_value
+
+CONFLICT = "The room is already booked for the selected dates."
+
+
+@dataclass
+class ReservationData:
+    """Clase para encapsular datos de reservación."""
+    reservation_id: str
+    hotel_id: str
+    room_number: int
+    customer_id: str
+    start_date: datetime.datetime
+    end_date: datetime.datetime
+
+
+@dataclass
+class LoadReport:
+    """Resultado de una carga masiva de reservaciones."""
+    loaded: int = 0
+    rejected: list = field(default_factory=list)
+
+    def reject(self, position, record, reason):
+        """Registra un registro rechazado con su posición y motivo."""
+        self.rejected.append({'position': position,
+                              'record': record,
+                              'reason': reason})
+
+
+class Reservation:
+    """Clase para manejar reservaciones."""
+    __slots__ = ('reservation_id', 'hotel_id', 'room_number',
+                 'customer_id', 'start_day', 'end_day', 'held_by_hotel')
+    # Almacén de reservas compartido con Hotel (ver booking_store.py);
+    # reservations es su registro por ID, solo con reservaciones de esta
+    # clase. held_by_hotel indica que Hotel.reserve_room también tiene la
+    # misma estancia, guardada en este mismo registro
+    bookings = BookingStore()
+    reservations = bookings.registry
+    # Backend de persistencia incremental (ver storage.py)
+    storage = None
+
+    def __init__(self, reservation_data: ReservationData):
+        """Inicializa una nueva reservación."""
+        self.reservation_id = reservation_data.reservation_id
+        self.hotel_id = reservation_data.hotel_id
+        self.room_number = reservation_data.room_number
+        self.customer_id = reservation_data.customer_id
+        self.start_day = to_day(reservation_data.start_date)
+        self.end_day = to_day(reservation_data.end_date)
+        self.held_by_hotel = False
+        if self.start_day >= self.end_day:
+            raise ValueError("The start date must be before the end date.")
+
+    def __getitem__(self, key):
+        """Permite el acceso por llave como reserva de una habitación."""
+        return stay_value(self, key)
+
+    @property
+    def start_date(self):
+        """Fecha de inicio como datetime."""
+        return day_to_datetime(self.start_day)
+
+    @property
+    def end_date(self):
+        """Fecha de fin como datetime."""
+        return day_to_datetime(self.end_day)
+
+    @classmethod
+    def booking_store(cls):
+        """Regresa el almacén de reservas compartido, al día.
+
+        Si la lista de reservaciones se reemplazó (por ejemplo con
+        Reservation.reservations = []), el almacén se reinicia con ella una
+        sola vez; las reservas de Hotel se conservan.
+        """
+        if cls.reservations is not cls.bookings.registry:
+            with cls.bookings.lock:
+                if cls.reservations is not cls.bookings.registry:
+                    cls.reservations = cls.bookings.reset(
+                        list(cls.reservations))
+        return cls.bookings
+
+    @classmethod
+    def _registry(cls):
+        """Regresa el registro de reservaciones con sus índices al día."""
+        return cls.booking_store().registry
+
+    @classmethod
+    def get_reservation(cls, reservation_id):
+        """Regresa la reservación con el ID dado."""
+        reservation = cls._registry().get(reservation_id)
+        if reservation is None:
+            raise ValueError("Reservation not found.")
+        return reservation
+
+    @classmethod
+    def is_room_available(cls, hotel_id, room_number, start_date, end_date):
+        """Verifica si la habitación no tiene reservaciones en el rango.
+
+        Cuenta también las reservas hechas con Hotel.reserve_room.
+        """
+        return cls.booking_store().is_free(hotel_id, room_number,
+                                           to_day(start_date),
+                                           to_day(end_date))
+
+    @classmethod
+    def find_overlapping(cls, start_date, end_date):
+        """Regresa las reservaciones que se solapan con el rango de fechas.
+
+        Usa el índice por fecha de inicio, acotado por la estancia más
+        larga vigente (ver IntervalIndex.overlapping).
+        """
+        return cls.booking_store().overlapping(to_day(start_date),
+                                               to_day(end_date))
+
+    @classmethod
+    def reservations_for_customer(cls, customer_id):
+        """Regresa las reservaciones de un cliente."""
+        return cls.booking_store().for_customer(customer_id)
+
+    @classmethod
+    def arrivals(cls, date):
+        """Regresa las reservaciones que inician en la fecha dada."""
+        return cls.booking_store().starting_on(to_day(date))
+
+    @classmethod
+    def departures(cls, date):
+        """Regresa las reservaciones que terminan en la fecha dada."""
+        return cls.booking_store().ending_on(to_day(date))
+
+    @classmethod
+    def create_reservation(cls, reservation_data: ReservationData):
+        """Crea y agrega una nueva reservación a la lista de reservaciones.
+
+        Es segura entre hilos: la verificación de conflictos y el alta se
+        hacen bajo el candado de la habitación en el almacén compartido. Si
+        el hotel ya tiene la misma estancia (mismo cliente y fechas) con
+        Hotel.reserve_room, la reservación la comparte en vez de
+        rechazarse.
+        """
+        store = cls.booking_store()
+        start_day = to_day(reservation_data.start_date)
+        end_day = to_day(reservation_data.end_date)
+
+        if store.get(reservation_data.reservation_id) is not None:
+            raise ValueError("A reservation with the given ID already exists.")
+        if start_day >= end_day:
+            raise ValueError("End date must be after start date.")
+
+        # Las fechas ya convertidas se pasan como ordinales
+        reservation = cls(replace(reservation_data, start_date=start_day,
+                                  end_date=end_day))
+        return store.add(reservation, CONFLICT,
+                         lambda added: cls._persist('create',
+                                                    added.to_dict()))
+
+    @classmethod
+    def cancel_reservation(cls, reservation_id):
+        """Cancela una reservación existente."""
+        store = cls.booking_store()
+        reservation = store.get(reservation_id)
+        if reservation is None:
+            raise ValueError("Reservation not found.")
+        store.remove(reservation, lambda removed: cls._persist(
+            'cancel', {'reservation_id': reservation_id}))
+
+    def modify_reservation(self, start_date=None, end_date=None):
+        """Modifica las fechas de una reservación existente."""
+        self.reschedule(start_date, end_date)
+
+    def reschedule(self, start_date=None, end_date=None):
+        """Cambia las fechas validando solo contra la misma habitación.
+
+        Si hay conflicto se lanza ValueError sin modificar la reservación.
+        """
+        start_day = to_day(start_date) if start_date else self.start_day
+        end_day = to_day(end_date) if end_date else self.end_day
+        if start_day >= end_day:
+            raise ValueError("End date must be after start date.")
+        self.booking_store().move(
+            self, start_day, end_day, CONFLICT,
+            lambda _: self._persist(
+                'modify', {'reservation_id': self.reservation_id,
+                           'start_date': format_day(start_day),
+                           'end_date': format_day(end_day)}))
+
+    @classmethod
+    def _persist(cls, operation, data):
+        """Registra la operación en el backend de persistencia, si existe."""
+        if cls.storage is not None:
+            cls.storage.record('reservation', operation, data)
+
+    def to_dict(self):
+        """Regresa la reservación en el formato de diccionario del JSON."""
+        return {'reservation_id': self.reservation_id,
+                'hotel_id': self.hotel_id,
+                'room_number': self.room_number,
+                'customer_id': self.customer_id,
+                'start_date': format_day(self.start_day),
+                'end_date': format_day(self.end_day)}
+
+    def display_reservation_info(self):
+        """Muestra la información de la reservación."""
+        print(f"Reservation ID: {self.reservation_id}, "
+              f"Hotel ID: {self.hotel_id}, "
+              f"Room Number: {self.room_number}, "
+              f"Customer ID: {self.customer_id}, "
+              f"Start Date: {self.start_date.strftime('%Y-%m-%d')}, "
+              f"End Date: {self.end_date.strftime('%Y-%m-%d')}")
+
+    @classmethod
+    def save_reservations_to_file(cls, filename):
+        """Guarda las reservaciones actuales en un archivo."""
+        with open(filename, "w", encoding='utf-8') as file:
+            data = [r.to_dict() for r in cls.reservations]
+            json.dump(data, file, indent=4)
+
+    @classmethod
+    def bulk_load_reservations(cls, filename="reservations.json"):
+        """Carga muchas reservaciones validándolas en una sola pasada.
+
+        Convierte todos los registros primero, detecta IDs duplicados,
+        ordena cada habitación por fecha de inicio y rechaza los
+        solapamientos en un barrido; ante un solapamiento se conserva la
+        reservación que inicia primero. Regresa un LoadReport.
+        """
+        report = LoadReport()
+        try:
+            with open(filename, "r", encoding='utf-8') as file:
+                reservations_data = json.load(file)
+        except FileNotFoundError:
+            print("No previous reservation data found.")
+            return report
+        except json.JSONDecodeError:
+            print(f"Error al decodificar JSON en {filename}.")
+            return report
+
+        candidates = []
+        for position, data in enumerate(reservations_data):
+            try:
+                candidates.append((position, cls(ReservationData(
+                    data['reservation_id'], data['hotel_id'],
+                    data['room_number'], data['customer_id'],
+                    data['start_date'], data['end_date']))))
+            except (KeyError, TypeError, ValueError) as error:
+                report.reject(position, data, f"Invalid record: {error}")
+        positions = {id(reservation): position
+                     for position, reservation in candidates}
+        added, rejected = cls.booking_store().add_many(
+            [reservation for _, reservation in candidates], CONFLICT,
+            record=lambda added: cls._persist('create', added.to_dict()))
+        for reservation, reason in rejected:
+            position = positions[id(reservation)]
+            report.reject(position, reservations_data[position], reason)
+        report.rejected.sort(key=lambda rejection: rejection['position'])
+        report.loaded = len(added)
+        return report
+
+    @classmethod
+    def load_reservations_from_file(cls, filename="reservations.json"):
+        """Carga reservaciones desde un archivo."""
+        try:
+            with open(filename, "r", encoding='utf-8') as file:
+                reservations_data = json.load(file)
+                for data in reservations_data:
+                    reservation_data = ReservationData(
+                        data['reservation_id'],
+                        data['hotel_id'],
+                        data['room_number'],
+                        data['customer_id'],
+                        data['start_date'],
+                        data['end_date']
+                    )
+                    cls.create_reservation(reservation_data)
+        except FileNotFoundError:
+            print("No previous reservation data found.")
+        except json.JSONDecodeError:
+            print(f"Error al decodificar JSON en {filename}.")
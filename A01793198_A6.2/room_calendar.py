@@ -0,0 +1,83 @@
+"""Módulo con el calendario de ocupación de una habitación como bitset."""
+
+
+class RoomCalendar:
+    """Noches ocupadas de una habitación guardadas como bits de un entero.
+
+    El bit i representa la noche del día origin + i. Una reservación
+    [inicio, fin] ocupa las noches inicio .. fin - 1. El entero crece solo
+    para cubrir las noches reservadas, así que las consultas cuestan
+    O(días / tamaño de palabra).
+    """
+
+    def __init__(self):
+        """Inicializa un calendario sin noches ocupadas."""
+        self.origin = None
+        self.bits = 0
+
+    def _window(self, first, last):
+        """Regresa los bits de las noches first .. last (inclusive)."""
+        if self.origin is None or last < first:
+            return 0
+        low = max(first - self.origin, 0)
+        high = last - self.origin
+        if high < low:
+            return 0
+        return (self.bits >> low) & ((1 << (high - low + 1)) - 1)
+
+    def _mask(self, start_day, end_day):
+        """Regresa la máscara de las noches start_day .. end_day - 1."""
+        if self.origin is None:
+            self.origin = start_day
+        elif start_day < self.origin:
+            self.bits <<= self.origin - start_day
+            self.origin = start_day
+        return ((1 << (end_day - start_day)) - 1) \
+            << (start_day - self.origin)
+
+    def clear(self):
+        """Libera todas las noches."""
+        self.origin = None
+        self.bits = 0
+
+    def occupy(self, start_day, end_day):
+        """Marca como ocupadas las noches de la reservación."""
+        if start_day < end_day:
+            # La máscara puede recorrer el origen, se calcula antes
+            mask = self._mask(start_day, end_day)
+            self.bits |= mask
+
+    def release(self, start_day, end_day):
+        """Marca como libres las noches de la reservación."""
+        if start_day < end_day and self.origin is not None:
+            mask = self._mask(start_day, end_day)
+            self.bits &= ~mask
+
+    def is_free(self, start_day, end_day):
+        """Verifica que [start_day, end_day] no toque otra reservación.
+
+        Las fechas de inicio y fin cuentan como solapamiento, igual que
+        en las reservaciones del hotel, por lo que se revisa también la noche
+        anterior a start_day.
+        """
+        return self._window(start_day - 1, end_day) == 0
+
+    def occupied_nights(self, start_day, end_day):
+        """Cuenta las noches ocupadas entre start_day y end_day - 1."""
+        return self._window(start_day, end_day - 1).bit_count()
+
+    def first_free_start(self, from_day):
+        """Regresa el primer día desde from_day en que puede iniciar una
+        reserva de una noche.
+
+        Como en is_free, las noches anterior y siguiente también deben
+        estar libres, así que el día de salida de otra reservación no
+        sirve como inicio.
+        """
+        if self.origin is None:
+            return from_day
+        # Bit k de window: noche from_day - 1 + k
+        shift = from_day - 1 - self.origin
+        window = self.bits >> shift if shift >= 0 else self.bits << -shift
+        blocked = window | (window >> 1) | (window >> 2)
+        return from_day + (~blocked & (blocked + 1)).bit_length() - 1
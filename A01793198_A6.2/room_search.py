@@ -0,0 +1,108 @@
+"""Módulo con el índice de búsqueda de habitaciones por varios criterios."""
+import bisect
+
+from dates import to_day
+
+
+class RoomSearch:
+    """Índice de habitaciones por ubicación y capacidad.
+
+    Por cada ubicación guarda las capacidades en una lista ordenada y, por
+    cada capacidad, la cubeta de habitaciones (hotel_id, número,
+    calendario) en orden de alta. Una búsqueda de capacidad mínima N
+    empieza en la primera cubeta >= N con bisect y revisa la
+    disponibilidad solo de esas habitaciones, con el calendario de cada
+    una, hasta juntar el límite pedido.
+    """
+
+    def __init__(self, hotels=()):
+        """Inicializa el índice con las habitaciones de los hoteles."""
+        self._capacities = {}
+        self._buckets = {}
+        self._indexed = {}
+        for hotel in hotels:
+            self.add_hotel(hotel)
+
+    def __len__(self):
+        """Regresa el número de habitaciones indexadas."""
+        return sum(len(bucket) for buckets in self._buckets.values()
+                   for bucket in buckets.values())
+
+    def add_room(self, hotel, room_number):
+        """Indexa una habitación del hotel."""
+        location = hotel.location
+        capacity = hotel.rooms[room_number].capacity
+        buckets = self._buckets.setdefault(location, {})
+        if capacity not in buckets:
+            buckets[capacity] = []
+            bisect.insort(self._capacities.setdefault(location, []),
+                          capacity)
+        buckets[capacity].append((hotel.hotel_id, room_number,
+                                  hotel.rooms[room_number].calendar))
+        self._indexed.setdefault(hotel.hotel_id, set()).add(
+            (location, capacity))
+
+    def add_hotel(self, hotel):
+        """Indexa las habitaciones del hotel, reemplazando las anteriores."""
+        self.remove_hotel(hotel)
+        for room_number in hotel.rooms:
+            self.add_room(hotel, room_number)
+
+    def remove_hotel(self, hotel):
+        """Quita del índice las habitaciones del hotel.
+
+        Solo recorre las cubetas en las que el hotel tiene habitaciones.
+        """
+        for location, capacity in self._indexed.pop(hotel.hotel_id, ()):
+            buckets = self._buckets[location]
+            bucket = [entry for entry in buckets[capacity]
+                      if entry[0] != hotel.hotel_id]
+            if bucket:
+                buckets[capacity] = bucket
+                continue
+            del buckets[capacity]
+            self._capacities[location].remove(capacity)
+            if not buckets:
+                del self._buckets[location]
+                del self._capacities[location]
+
+    def search(self, location, min_capacity, start_date, end_date,
+               limit=10, cursor=None):
+        """Busca habitaciones libres en location con capacidad >= min_capacity.
+
+        Regresa (coincidencias, cursor): hasta limit pares (hotel_id,
+        número de habitación) ordenados por capacidad de menor a mayor, y
+        el cursor para pedir la página siguiente, o None si ya se revisaron
+        todas las habitaciones.
+        Las fechas de inicio y fin cuentan como solapamiento, igual que en
+        Hotel.is_room_available.
+        """
+        start_day = to_day(start_date)
+        end_day = to_day(end_date)
+        if start_day >= end_day:
+            raise ValueError("End date must be after start date.")
+        if limit < 1:
+            raise ValueError("Limit must be positive.")
+        capacities = self._capacities.get(location, [])
+        buckets = self._buckets.get(location, {})
+        first = bisect.bisect_left(capacities, min_capacity)
+        position = 0
+        if cursor is not None:
+            resume_capacity, resume_position = cursor
+            resume = bisect.bisect_left(capacities, resume_capacity)
+            if resume >= first:
+                first = resume
+                if resume < len(capacities) \
+                        and capacities[resume] == resume_capacity:
+                    position = resume_position
+        matches = []
+        for capacity in capacities[first:]:
+            bucket = buckets[capacity]
+            for position in range(position, len(bucket)):
+                hotel_id, room_number, calendar = bucket[position]
+                if calendar.is_free(start_day, end_day):
+                    matches.append((hotel_id, room_number))
+                    if len(matches) == limit:
+                        return matches, (capacity, position + 1)
+            position = 0
+        return matches, None
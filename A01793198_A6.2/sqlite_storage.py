@@ -0,0 +1,372 @@
+"""Módulo con el backend de persistencia en SQLite.
+
+SQLiteStorage es solo un espejo de escritura de las clases. Hotel,
+Customer y Reservation siguen validando y consultando en memoria (la
+disponibilidad, los conflictos y las búsquedas no leen la base), y al
+arrancar hay que cargar todo el estado en memoria, por ejemplo con
+storage.load_snapshot(db.snapshot()). Las consultas de esta clase
+(is_room_available, get_reservation, ...) sirven a otros lectores de la
+misma base, no a las clases.
+"""
+import json
+import sqlite3
+import threading
+
+from dates import format_day, to_day
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS hotels (
+    hotel_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    location TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS rooms (
+    hotel_id TEXT NOT NULL,
+    room_number NOT NULL,
+    capacity INTEGER NOT NULL,
+    PRIMARY KEY (hotel_id, room_number)
+);
+CREATE TABLE IF NOT EXISTS room_bookings (
+    booking_id INTEGER PRIMARY KEY,
+    hotel_id TEXT NOT NULL,
+    room_number NOT NULL,
+    customer_id TEXT NOT NULL,
+    start_day INTEGER NOT NULL,
+    end_day INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS room_bookings_by_room
+    ON room_bookings (hotel_id, room_number, start_day, end_day);
+CREATE TABLE IF NOT EXISTS customers (
+    customer_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS customers_by_email
+    ON customers (email COLLATE NOCASE);
+CREATE TABLE IF NOT EXISTS reservations (
+    reservation_id TEXT PRIMARY KEY,
+    hotel_id TEXT NOT NULL,
+    room_number NOT NULL,
+    customer_id TEXT NOT NULL,
+    start_day INTEGER NOT NULL,
+    end_day INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS reservations_by_room
+    ON reservations (hotel_id, room_number, start_day, end_day);
+CREATE INDEX IF NOT EXISTS reservations_by_customer
+    ON reservations (customer_id);
+"""
+
+# Las reservas de una habitación no se solapan, así que solo la última
+# que inicia antes del fin del rango puede chocar con él: una búsqueda
+# en el índice por habitación basta en cada tabla.
+LATEST_BOOKING = """
+SELECT start_day, end_day, customer_id FROM {table}
+WHERE hotel_id = ? AND room_number = ? AND start_day <= ?
+ORDER BY start_day DESC LIMIT 1
+"""
+
+
+class SQLiteStorage:
+    """Backend de persistencia en SQLite con modo WAL.
+
+    Se conecta con storage.attach y las clases llaman record(entity,
+    operation, data) antes de aplicar cada cambio ya validado, así que si
+    SQLite falla el cambio tampoco se aplica en memoria y ambos quedan
+    iguales. Las habitaciones se guardan con el número como texto, igual
+    que en el almacén compartido.
+    """
+
+    def __init__(self, path="hotel_system.db"):
+        """Abre (o crea) la base de datos en path."""
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+        # La conexión se comparte entre hilos; cada transacción es exclusiva
+        self._lock = threading.Lock()
+
+    def close(self):
+        """Cierra la conexión a la base de datos."""
+        self.connection.close()
+
+    def record(self, entity, operation, data):
+        """Aplica en la base de datos una operación de las clases."""
+        self.record_many([(entity, operation, data)])
+
+    def record_many(self, entries):
+        """Aplica varias operaciones (entity, operation, data) en una sola
+        transacción: si una falla no queda ninguna."""
+        handlers = [(self._handler(entity, operation), data)
+                    for entity, operation, data in entries]
+        with self._lock, self.connection:
+            for handler, data in handlers:
+                handler(data)
+
+    def _handler(self, entity, operation):
+        """Regresa el método que aplica la operación."""
+        handler = getattr(self, f"_{entity}_{operation}", None)
+        if handler is None:
+            raise ValueError(f"Unknown {entity} operation: {operation}.")
+        return handler
+
+    def _hotel_create(self, data):
+        """Inserta un hotel."""
+        self.connection.execute(
+            "INSERT INTO hotels VALUES (?, ?, ?)",
+            (data['hotel_id'], data['name'], data['location']))
+
+    def _hotel_modify(self, data):
+        """Actualiza el nombre y la ubicación de un hotel."""
+        self.connection.execute(
+            "UPDATE hotels SET name = ?, location = ? WHERE hotel_id = ?",
+            (data['name'], data['location'], data['hotel_id']))
+
+    def _hotel_delete(self, data):
+        """Elimina un hotel con sus habitaciones y reservas."""
+        for table in ("room_bookings", "rooms", "hotels"):
+            self.connection.execute(
+                f"DELETE FROM {table} WHERE hotel_id = ?",
+                (data['hotel_id'],))
+
+    def _hotel_add_room(self, data):
+        """Inserta una habitación."""
+        self.connection.execute(
+            "INSERT INTO rooms VALUES (?, ?, ?)",
+            (data['hotel_id'], str(data['room_number']), data['capacity']))
+
+    def _hotel_reserve(self, data):
+        """Inserta la reserva de una habitación."""
+        self.connection.execute(
+            "INSERT INTO room_bookings (hotel_id, room_number, customer_id,"
+            " start_day, end_day) VALUES (?, ?, ?, ?, ?)",
+            (data['hotel_id'], str(data['room_number']), data['customer_id'],
+             to_day(data['start_date']), to_day(data['end_date'])))
+
+    def _hotel_cancel(self, data):
+        """Elimina la primera reserva del cliente en la habitación.
+
+        La primera es la de fecha de inicio más temprana, como en
+        Hotel.cancel_reservation.
+        """
+        self.connection.execute(
+            "DELETE FROM room_bookings WHERE booking_id = ("
+            "SELECT booking_id FROM room_bookings WHERE hotel_id = ?"
+            " AND room_number = ? AND customer_id = ?"
+            " ORDER BY start_day LIMIT 1)",
+            (data['hotel_id'], str(data['room_number']),
+             data['customer_id']))
+
+    def _customer_create(self, data):
+        """Inserta un cliente."""
+        self.connection.execute(
+            "INSERT INTO customers VALUES (?, ?, ?)",
+            (data['customer_id'], data['name'], data['email']))
+
+    def _customer_modify(self, data):
+        """Actualiza el nombre y el correo de un cliente."""
+        self.connection.execute(
+            "UPDATE customers SET name = ?, email = ? WHERE customer_id = ?",
+            (data['name'], data['email'], data['customer_id']))
+
+    def _customer_delete(self, data):
+        """Elimina un cliente."""
+        self.connection.execute(
+            "DELETE FROM customers WHERE customer_id = ?",
+            (data['customer_id'],))
+
+    def _reservation_create(self, data):
+        """Inserta una reservación si no choca con otra de la habitación.
+
+        Una reserva de Hotel con la misma estancia no es conflicto, como en
+        el almacén compartido: ambas filas la representan.
+        """
+        start_day = to_day(data['start_date'])
+        end_day = to_day(data['end_date'])
+        if self._booked(data['hotel_id'], data['room_number'], start_day,
+                        end_day, data['customer_id']):
+            raise ValueError("The room is already booked"
+                             " for the selected dates.")
+        try:
+            self.connection.execute(
+                "INSERT INTO reservations VALUES (?, ?, ?, ?, ?, ?)",
+                (data['reservation_id'], data['hotel_id'],
+                 str(data['room_number']), data['customer_id'],
+                 start_day, end_day))
+        except sqlite3.IntegrityError as error:
+            raise ValueError("A reservation with the given ID"
+                             " already exists.") from error
+
+    def _reservation_modify(self, data):
+        """Actualiza las fechas de una reservación.
+
+        Si el hotel tiene la misma estancia, su reserva cambia con ella.
+        """
+        start_day = to_day(data['start_date'])
+        end_day = to_day(data['end_date'])
+        row = self.connection.execute(
+            "SELECT hotel_id, room_number, customer_id, start_day, end_day"
+            " FROM reservations WHERE reservation_id = ?",
+            (data['reservation_id'],)).fetchone()
+        self.connection.execute(
+            "UPDATE reservations SET start_day = ?, end_day = ?"
+            " WHERE reservation_id = ?",
+            (start_day, end_day, data['reservation_id']))
+        if row is not None:
+            self.connection.execute(
+                "UPDATE room_bookings SET start_day = ?, end_day = ?"
+                " WHERE booking_id = ("
+                "SELECT booking_id FROM room_bookings WHERE hotel_id = ?"
+                " AND room_number = ? AND customer_id = ? AND start_day = ?"
+                " AND end_day = ? LIMIT 1)",
+                (start_day, end_day) + row)
+
+    def _reservation_cancel(self, data):
+        """Elimina una reservación."""
+        self.connection.execute(
+            "DELETE FROM reservations WHERE reservation_id = ?",
+            (data['reservation_id'],))
+
+    def _conflicts(self, table, hotel_id, room_number, start_day, end_day,
+                   customer_id=None):
+        """Verifica si [start_day, end_day] choca con una reserva.
+
+        Con customer_id, la misma estancia de ese cliente no cuenta.
+        """
+        row = self.connection.execute(
+            LATEST_BOOKING.format(table=table),
+            (hotel_id, str(room_number), end_day)).fetchone()
+        if row is None or row[1] < start_day:
+            return False
+        return row != (start_day, end_day, customer_id)
+
+    def _booked(self, hotel_id, room_number, start_day, end_day,
+                customer_id=None):
+        """Verifica el rango contra las reservas de Hotel y Reservation.
+
+        Las dos clases comparten las noches de cada habitación, así que
+        un rango ocupado en cualquiera de las tablas está ocupado. Con
+        customer_id, una reserva de Hotel de ese cliente con la misma
+        estancia no cuenta (ver _reservation_create).
+        """
+        return self._conflicts("room_bookings", hotel_id, room_number,
+                               start_day, end_day, customer_id) \
+            or self._conflicts("reservations", hotel_id, room_number,
+                               start_day, end_day)
+
+    def is_room_available(self, hotel_id, room_number, start_date,
+                          end_date):
+        """Verifica si una habitación de hotel está disponible."""
+        return not self._booked(hotel_id, room_number, to_day(start_date),
+                                to_day(end_date))
+
+    def has_reservation_conflict(self, hotel_id, room_number, start_date,
+                                 end_date):
+        """Verifica si el rango choca con una reserva de la habitación."""
+        return self._booked(hotel_id, room_number, to_day(start_date),
+                            to_day(end_date))
+
+    def get_customer(self, customer_id):
+        """Regresa el cliente con el ID dado como diccionario."""
+        row = self.connection.execute(
+            "SELECT customer_id, name, email FROM customers"
+            " WHERE customer_id = ?", (customer_id,)).fetchone()
+        if row is None:
+            raise ValueError("Customer not found.")
+        return dict(zip(('customer_id', 'name', 'email'), row))
+
+    def get_reservation(self, reservation_id):
+        """Regresa la reservación con el ID dado como diccionario."""
+        row = self.connection.execute(
+            "SELECT * FROM reservations WHERE reservation_id = ?",
+            (reservation_id,)).fetchone()
+        if row is None:
+            raise ValueError("Reservation not found.")
+        return self._reservation_dict(row)
+
+    def reservations_for_customer(self, customer_id):
+        """Regresa las reservaciones de un cliente."""
+        return [self._reservation_dict(row) for row in
+                self.connection.execute(
+                    "SELECT * FROM reservations WHERE customer_id = ?"
+                    " ORDER BY start_day", (customer_id,))]
+
+    @staticmethod
+    def _reservation_dict(row):
+        """Convierte una fila de reservations al formato del JSON."""
+        return {'reservation_id': row[0],
+                'hotel_id': row[1],
+                'room_number': row[2],
+                'customer_id': row[3],
+                'start_date': format_day(row[4]),
+                'end_date': format_day(row[5])}
+
+    def snapshot(self):
+        """Regresa todo el contenido en el formato de storage.snapshot."""
+        hotels = {}
+        for hotel_id, name, location in self.connection.execute(
+                "SELECT * FROM hotels ORDER BY rowid"):
+            hotels[hotel_id] = {'hotel_id': hotel_id, 'name': name,
+                                'location': location, 'rooms': {}}
+        for hotel_id, room_number, capacity in self.connection.execute(
+                "SELECT * FROM rooms ORDER BY rowid"):
+            hotels[hotel_id]['rooms'][room_number] = {
+                'capacity': capacity, 'reservations': []}
+        for _, hotel_id, room_number, customer_id, start_day, end_day \
+                in self.connection.execute(
+                    "SELECT * FROM room_bookings ORDER BY booking_id"):
+            hotels[hotel_id]['rooms'][room_number]['reservations'].append(
+                {'customer_id': customer_id,
+                 'start_date': format_day(start_day),
+                 'end_date': format_day(end_day)})
+        customers = [dict(zip(('customer_id', 'name', 'email'), row))
+                     for row in self.connection.execute(
+                         "SELECT * FROM customers ORDER BY rowid")]
+        reservations = [self._reservation_dict(row)
+                        for row in self.connection.execute(
+                            "SELECT * FROM reservations ORDER BY rowid")]
+        return {'hotels': list(hotels.values()),
+                'customers': customers,
+                'reservations': reservations}
+
+    def import_json(self, hotels_file=None, customers_file=None,
+                    reservations_file=None):
+        """Importa los archivos JSON de save_*_to_file en una transacción."""
+        with self.connection:
+            if hotels_file:
+                for hotel in _read_json(hotels_file):
+                    self._hotel_create(hotel)
+                    for room_number, room in hotel.get('rooms', {}).items():
+                        self._hotel_add_room({'hotel_id': hotel['hotel_id'],
+                                              'room_number': room_number,
+                                              'capacity': room['capacity']})
+                        for booking in room['reservations']:
+                            self._hotel_reserve(dict(
+                                booking, hotel_id=hotel['hotel_id'],
+                                room_number=room_number))
+            if customers_file:
+                for customer in _read_json(customers_file):
+                    self._customer_create(customer)
+            if reservations_file:
+                for reservation in _read_json(reservations_file):
+                    self._reservation_create(reservation)
+
+    def export_json(self, hotels_file=None, customers_file=None,
+                    reservations_file=None):
+        """Exporta el contenido a los formatos JSON de save_*_to_file."""
+        state = self.snapshot()
+        if hotels_file:
+            with open(hotels_file, "w", encoding="utf-8") as file:
+                json.dump(state['hotels'], file)
+        if customers_file:
+            with open(customers_file, "w", encoding="utf-8") as file:
+                json.dump(state['customers'], file, indent=4)
+        if reservations_file:
+            with open(reservations_file, "w", encoding="utf-8") as file:
+                json.dump(state['reservations'], file, indent=4)
+
+
+def _read_json(filename):
+    """Lee un archivo JSON."""
+    with open(filename, "r", encoding="utf-8") as file:
+        return json.load(file)
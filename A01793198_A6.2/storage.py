@@ -0,0 +1,157 @@
+"""Módulo que conecta Hotel, Customer y Reservation con la persistencia.
+
+Un backend es cualquier objeto con el método record(entity, operation,
+data); las clases lo llaman con el candado del estado tomado, después de
+validar cada cambio y antes de aplicarlo. Si record lanza una excepción el
+cambio no se aplica, así que la memoria y el backend no se separan.
+"""
+import logging
+
+from customer import Customer
+from hotel import Hotel
+from reservation import Reservation, ReservationData
+
+MODELS = (Hotel, Customer, Reservation)
+
+
+def attach(backend):
+    """Conecta el backend a las tres clases."""
+    for model in MODELS:
+        model.storage = backend
+    if hasattr(backend, 'snapshot_source'):
+        backend.snapshot_source = snapshot
+
+
+def detach():
+    """Desconecta el backend de las tres clases."""
+    for model in MODELS:
+        model.storage = None
+
+
+def snapshot():
+    """Regresa el estado completo en el formato de diccionario del JSON.
+
+    Copia el estado con los candados de las tres clases tomados, así que
+    no ve cambios a medias ni cambios cuyo registro aún no se escribió.
+    Una estancia que Hotel comparte con una reservación se guarda una sola
+    vez, en la reservación marcada con held_by_hotel.
+    """
+    with Hotel.lock, Customer.lock, Reservation.bookings.lock:
+        return {'hotels': [hotel.to_dict(shared=False)
+                           for hotel in Hotel.hotels],
+                'customers': [customer.to_dict()
+                              for customer in Customer.customers],
+                'reservations': [_reservation_state(reservation)
+                                 for reservation
+                                 in Reservation.reservations]}
+
+
+def _reservation_state(reservation):
+    """Regresa la reservación del snapshot, marcada si el hotel la tiene."""
+    data = reservation.to_dict()
+    if reservation.held_by_hotel:
+        data['held_by_hotel'] = True
+    return data
+
+
+def load_snapshot(state):
+    """Reemplaza el estado en memoria por el de un snapshot."""
+    Hotel.hotels = []
+    Customer.customers = []
+    Reservation.reservations = []
+    for hotel_data in state.get('hotels', []):
+        Hotel.from_dict(hotel_data)
+    for customer_data in state.get('customers', []):
+        Customer.create_customer(**customer_data)
+    for reservation_data in state.get('reservations', []):
+        data = dict(reservation_data)
+        held_by_hotel = data.pop('held_by_hotel', False)
+        Reservation.create_reservation(ReservationData(**data))
+        if held_by_hotel:
+            Hotel.get_hotel(data['hotel_id']).reserve_room(
+                data['room_number'], data['customer_id'],
+                data['start_date'], data['end_date'])
+
+
+def _apply_hotel(operation, data):
+    """Aplica una operación registrada sobre hoteles."""
+    if operation == 'create':
+        Hotel.create_hotel(data['hotel_id'], data['name'], data['location'])
+        return
+    if operation == 'delete':
+        Hotel.delete_hotel(data['hotel_id'])
+        return
+    hotel = Hotel.get_hotel(data['hotel_id'])
+    if operation == 'modify':
+        hotel.modify_hotel_info(data['name'], data['location'])
+    elif operation == 'add_room':
+        hotel.add_room(data['room_number'], data['capacity'])
+    elif operation == 'reserve':
+        hotel.reserve_room(data['room_number'], data['customer_id'],
+                           data['start_date'], data['end_date'])
+    elif operation == 'cancel':
+        hotel.cancel_reservation(data['room_number'], data['customer_id'])
+    else:
+        raise ValueError(f"Unknown hotel operation: {operation}.")
+
+
+def _apply_customer(operation, data):
+    """Aplica una operación registrada sobre clientes."""
+    if operation == 'create':
+        Customer.create_customer(**data)
+    elif operation == 'modify':
+        Customer.get_customer(data['customer_id']).modify_customer_info(
+            data['name'], data['email'])
+    elif operation == 'delete':
+        Customer.delete_customer(data['customer_id'])
+    else:
+        raise ValueError(f"Unknown customer operation: {operation}.")
+
+
+def _apply_reservation(operation, data):
+    """Aplica una operación registrada sobre reservaciones."""
+    if operation == 'create':
+        Reservation.create_reservation(ReservationData(**data))
+    elif operation == 'modify':
+        Reservation.get_reservation(data['reservation_id']).reschedule(
+            data['start_date'], data['end_date'])
+    elif operation == 'cancel':
+        Reservation.cancel_reservation(data['reservation_id'])
+    else:
+        raise ValueError(f"Unknown reservation operation: {operation}.")
+
+
+APPLY = {'hotel': _apply_hotel,
+         'customer': _apply_customer,
+         'reservation': _apply_reservation}
+
+
+def apply(entity, operation, data):
+    """Aplica una operación registrada al estado en memoria."""
+    APPLY[entity](operation, data)
+
+
+def restore(journal):
+    """Carga el último snapshot, reproduce la bitácora y conecta el journal.
+
+    Las operaciones reproducidas no se vuelven a registrar.
+    """
+    detach()
+    state, entries = journal.load()
+    load_snapshot(state)
+    for entry in entries:
+        try:
+            apply(entry['entity'], entry['op'], entry['data'])
+        except (KeyError, ValueError) as error:
+            logging.error("Error al reproducir la bitácora: %s", error)
+    attach(journal)
+
+
+def compact(journal):
+    """Escribe un snapshot del estado actual y vacía la bitácora.
+
+    Los candados se conservan hasta vaciar la bitácora, para que ningún
+    cambio se registre entre el snapshot y la compactación.
+    """
+    with Hotel.lock, Customer.lock, Reservation.bookings.lock:
+        journal.compact(snapshot())
@@ -0,0 +1,146 @@
+"""Pruebas unitarias para el servicio HTTP de reservaciones."""
+import asyncio
+import os
+import shutil
+import tempfile
+import unittest
+from booking_service import BookingService
+from hotel import Hotel
+from journal import Journal
+from load_generator import request
+from reservation import Reservation
+
+BOOKING = {"reservation_id": "R1", "hotel_id": "H1", "room_number": 101,
+           "customer_id": "C1", "start_date": "2024-02-10",
+           "end_date": "2024-02-15"}
+
+
+class TestBookingService(unittest.IsolatedAsyncioTestCase):
+    """Clase que engloba las pruebas
+    unitarias necesarias para BookingService."""
+    async def asyncSetUp(self):
+        """Levantar el servicio con un journal temporal."""
+        # Hotel libera las habitaciones de otras pruebas en su siguiente
+        # operación; se hace aquí para que no ocupen H1
+        Hotel.hotels = []
+        Hotel.create_hotel("H0", "Service Hotel", "City")
+        Hotel.hotels = []
+        Reservation.reservations = []
+        self.directory = tempfile.mkdtemp()
+        self.journal = Journal(os.path.join(self.directory, "service"))
+        self.service = BookingService(self.journal)
+        port = await self.service.start(port=0)
+        self.reader, self.writer = await asyncio.open_connection(
+            "127.0.0.1", port)
+
+    async def call(self, method, path, body=None):
+        """Envía una petición por la conexión de la prueba."""
+        return await request(self.reader, self.writer, method, path, body)
+
+    async def test_book_and_cancel(self):
+        """Probar reservar, consultar y cancelar por HTTP."""
+        status, body = await self.call("POST", "/reservations", BOOKING)
+        self.assertEqual(status, 201)
+        self.assertEqual(body, BOOKING)
+        status, body = await self.call(
+            "GET", "/availability?hotel_id=H1&room_number=101"
+                   "&start_date=2024-02-12&end_date=2024-02-20")
+        self.assertEqual((status, body), (200, {"available": False}))
+        status, body = await self.call("GET", "/reservations/R1")
+        self.assertEqual((status, body["end_date"]), (200, "2024-02-15"))
+        status, _ = await self.call("DELETE", "/reservations/R1")
+        self.assertEqual(status, 200)
+        status, _ = await self.call("GET", "/reservations/R1")
+        self.assertEqual(status, 404)
+        _, entries = self.journal.load()
+        self.assertEqual([entry["op"] for entry in entries],
+                         ["create", "cancel"])
+
+    async def test_errors(self):
+        """Probar los estados HTTP de peticiones inválidas."""
+        await self.call("POST", "/reservations", BOOKING)
+        status, _ = await self.call("POST", "/reservations",
+                                    dict(BOOKING, reservation_id="R2"))
+        self.assertEqual(status, 409)
+        status, _ = await self.call("POST", "/reservations",
+                                    {"reservation_id": "R3"})
+        self.assertEqual(status, 400)
+        status, _ = await self.call("DELETE", "/reservations/R9")
+        self.assertEqual(status, 404)
+        status, _ = await self.call("GET", "/hotels")
+        self.assertEqual(status, 404)
+
+    async def test_concurrent_bookings_batched(self):
+        """Probar que reservas simultáneas se aplican en pocos lotes."""
+        results = await asyncio.gather(*(
+            self.service.dispatch("POST", "/reservations",
+                                  dict(BOOKING, reservation_id=f"R{number}",
+                                       room_number=number))
+            for number in range(20)))
+        self.assertEqual({status for status, _ in results}, {201})
+        self.assertEqual(len(Reservation.reservations), 20)
+        self.assertLess(self.service.batches, 20)
+
+    async def test_invalid_payload_does_not_stop_worker(self):
+        """Probar que un cuerpo con tipos inválidos no detiene las
+        escrituras siguientes."""
+        status, _ = await self.call("POST", "/reservations",
+                                    dict(BOOKING, start_date=None))
+        self.assertEqual(status, 400)
+        status, _ = await self.call("POST", "/reservations", [BOOKING])
+        self.assertEqual(status, 400)
+        with self.assertRaises(AttributeError):
+            await self.service.submit(lambda: None.missing)
+        status, _ = await self.call("POST", "/reservations", BOOKING)
+        self.assertEqual(status, 201)
+
+    async def test_failed_flush_rolls_back(self):
+        """Probar que si la persistencia falla los cambios se deshacen."""
+        await self.call("POST", "/reservations", BOOKING)
+        record_many = self.journal.record_many
+
+        def fail(*_):
+            """Simular un disco lleno."""
+            raise OSError("disk full")
+
+        self.journal.record_many = fail
+        status, _ = await self.call("POST", "/reservations",
+                                    dict(BOOKING, reservation_id="R2",
+                                         room_number=102))
+        self.assertEqual(status, 500)
+        status, _ = await self.call("DELETE", "/reservations/R1")
+        self.assertEqual(status, 500)
+        self.assertEqual([reservation.reservation_id for reservation
+                          in Reservation.reservations], ["R1"])
+        self.assertFalse(Reservation.is_room_available(
+            "H1", 101, "2024-02-12", "2024-02-12"))
+        self.journal.record_many = record_many
+        status, _ = await self.call("DELETE", "/reservations/R1")
+        self.assertEqual(status, 200)
+
+    async def test_malformed_request(self):
+        """Probar que una petición mal formada recibe 400."""
+        for raw in (b"GARBAGE\r\n\r\n",
+                    b"POST /reservations HTTP/1.1\r\n"
+                    b"Content-Length: abc\r\n\r\n"):
+            reader, writer = await asyncio.open_connection(
+                "127.0.0.1", self.service.server.sockets[0].getsockname()[1])
+            writer.write(raw)
+            await writer.drain()
+            status_line = await reader.readline()
+            self.assertEqual(status_line.split()[1], b"400")
+            writer.close()
+            await writer.wait_closed()
+
+    async def asyncTearDown(self):
+        """Cerrar el servicio y borrar los archivos temporales."""
+        self.writer.close()
+        await self.writer.wait_closed()
+        await self.service.close()
+        self.journal.close()
+        Reservation.reservations = []
+        shutil.rmtree(self.directory)
+
+
+if __name__ == '__main__':
+    unittest.main()
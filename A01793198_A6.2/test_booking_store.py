@@ -0,0 +1,205 @@
+"""Pruebas unitarias para el almacén de reservas compartido."""
+import os
+import shutil
+import tempfile
+import unittest
+import storage
+from hotel import Hotel
+from reservation import Reservation, ReservationData
+
+
+class TestBookingStore(unittest.TestCase):
+    """Clase que engloba las pruebas
+    unitarias necesarias para BookingStore."""
+    def setUp(self):
+        """Crear un hotel con una habitación y limpiar las reservas."""
+        Hotel.hotels = []
+        Reservation.reservations = []
+        self.hotel = Hotel.create_hotel("H1", "Shared Hotel", "City")
+        self.hotel.add_room("101", 2)
+
+    def reserve(self, start="2024-02-10", end="2024-02-12"):
+        """Reservar la habitación 101 con Reservation."""
+        return Reservation.create_reservation(ReservationData(
+            "R1", "H1", 101, "C2", start, end))
+
+    def test_hotel_booking_blocks_reservation(self):
+        """Probar que una reserva de Hotel ocupa la habitación
+        para Reservation."""
+        self.hotel.reserve_room("101", "C1", "2024-02-10", "2024-02-12")
+        self.assertFalse(Reservation.is_room_available(
+            "H1", 101, "2024-02-11", "2024-02-11"))
+        with self.assertRaises(ValueError) as context:
+            self.reserve()
+        self.assertEqual(str(context.exception),
+                         "The room is already booked for the selected dates.")
+
+    def test_reservation_blocks_hotel_booking(self):
+        """Probar que una reservación ocupa la habitación para Hotel."""
+        self.reserve()
+        self.assertFalse(self.hotel.is_room_available(
+            "101", "2024-02-11", "2024-02-11"))
+        self.assertEqual(self.hotel.available_rooms("2024-02-12",
+                                                    "2024-02-14"), [])
+        with self.assertRaises(ValueError) as context:
+            self.hotel.reserve_room("101", "C1", "2024-02-12", "2024-02-14")
+        self.assertEqual(str(context.exception),
+                         "Room is not available for the selected dates.")
+
+    def test_rooms_show_every_booking(self):
+        """Probar que la habitación muestra las reservas de ambas clases
+        y que cada clase cancela solo las suyas."""
+        self.hotel.reserve_room("101", "C1", "2024-02-01", "2024-02-03")
+        reservation = self.reserve()
+        room = self.hotel.rooms["101"]
+        self.assertEqual([booking['customer_id']
+                          for booking in room['reservations']], ["C1", "C2"])
+        self.assertIs(room.reservations[1], reservation)
+        self.assertEqual(room.to_dict()['reservations'],
+                         [{'customer_id': "C1", 'start_date': "2024-02-01",
+                           'end_date': "2024-02-03"}])
+        self.assertEqual(list(Reservation.reservations), [reservation])
+        self.assertEqual(Reservation.reservations_for_customer("C1"), [])
+        self.assertEqual(Reservation.find_overlapping("2024-02-01",
+                                                      "2024-02-03"), [])
+        with self.assertRaises(ValueError):
+            self.hotel.cancel_reservation("101", "C2")
+        reservation.reschedule("2024-02-20", "2024-02-22")
+        self.assertTrue(self.hotel.is_room_available(
+            "101", "2024-02-10", "2024-02-12"))
+        self.assertFalse(self.hotel.is_room_available(
+            "101", "2024-02-21", "2024-02-21"))
+        Reservation.cancel_reservation("R1")
+        self.assertEqual(len(room.reservations), 1)
+        self.hotel.cancel_reservation("101", "C1")
+        self.assertTrue(self.hotel.is_room_available(
+            "101", "2024-02-01", "2024-02-28"))
+
+    def test_same_stay_is_one_record(self):
+        """Probar que la misma estancia de ambas clases es un registro."""
+        self.hotel.reserve_room("101", "C2", "2024-02-10", "2024-02-12")
+        reservation = self.reserve()
+        room = self.hotel.rooms[101]
+        self.assertEqual(list(room.reservations), [reservation])
+        self.assertTrue(reservation.held_by_hotel)
+        with self.assertRaises(ValueError):
+            self.hotel.reserve_room("101", "C2", "2024-02-10", "2024-02-12")
+        reservation.reschedule("2024-02-20", "2024-02-22")
+        self.assertEqual(room.to_dict()['reservations'][0]['start_date'],
+                         "2024-02-20")
+        Reservation.cancel_reservation("R1")
+        self.assertFalse(reservation.held_by_hotel)
+        self.assertEqual(room.reservations[0]['end_date'], "2024-02-22")
+        self.assertFalse(self.hotel.is_room_available(
+            "101", "2024-02-21", "2024-02-21"))
+        reservation = self.reserve("2024-02-20", "2024-02-22")
+        self.assertEqual(list(room.reservations), [reservation])
+        self.hotel.cancel_reservation("101", "C2")
+        self.assertEqual(list(room.reservations), [reservation])
+        self.assertFalse(reservation.held_by_hotel)
+        self.assertEqual(room.to_dict()['reservations'], [])
+        with self.assertRaises(ValueError):
+            self.hotel.cancel_reservation("101", "C2")
+        self.hotel.reserve_room(101, "C2", "2024-02-20", "2024-02-22")
+        Hotel.delete_hotel("H1")
+        self.assertFalse(reservation.held_by_hotel)
+        self.assertEqual(Reservation.reservations_for_customer("C2"),
+                         [reservation])
+
+    def test_resets_keep_the_other_class_bookings(self):
+        """Probar que reiniciar o eliminar solo libera las reservas
+        propias."""
+        self.hotel.reserve_room("101", "C1", "2024-02-01", "2024-02-03")
+        self.reserve()
+        Reservation.reservations = []
+        self.assertTrue(self.hotel.is_room_available(
+            "101", "2024-02-10", "2024-02-12"))
+        self.assertFalse(self.hotel.is_room_available(
+            "101", "2024-02-02", "2024-02-02"))
+        self.assertEqual(len(self.hotel.rooms["101"].reservations), 1)
+        self.reserve()
+        Hotel.delete_hotel("H1")
+        self.assertEqual(len(Reservation.reservations), 1)
+        hotel = Hotel.create_hotel("H1", "Shared Hotel", "City")
+        hotel.add_room("101", 2)
+        self.assertTrue(hotel.is_room_available("101", "2024-02-01",
+                                                "2024-02-03"))
+        self.assertFalse(hotel.is_room_available("101", "2024-02-11",
+                                                 "2024-02-11"))
+        Hotel.hotels = []
+        hotel = Hotel.create_hotel("H1", "Shared Hotel", "City")
+        hotel.add_room("101", 2)
+        self.assertEqual(len(Reservation.reservations), 1)
+        self.assertFalse(hotel.is_room_available("101", "2024-02-11",
+                                                 "2024-02-11"))
+
+    def test_files_keep_each_class_bookings(self):
+        """Probar que cada archivo guarda y carga solo las reservas de su
+        clase, aunque ambas tengan la misma estancia."""
+        self.hotel.reserve_room("101", "C1", "2024-02-01", "2024-02-03")
+        self.hotel.reserve_room("101", "C2", "2024-02-10", "2024-02-12")
+        self.reserve()
+        expected = self.hotel.to_dict()
+        directory = tempfile.mkdtemp()
+        hotels_file = os.path.join(directory, "hotels.json")
+        reservations_file = os.path.join(directory, "reservations.json")
+        try:
+            Hotel.save_hotels_to_file(hotels_file)
+            Reservation.save_reservations_to_file(reservations_file)
+            Hotel.hotels = []
+            Reservation.reservations = []
+            Hotel.load_hotels_from_file(hotels_file)
+            Reservation.load_reservations_from_file(reservations_file)
+            self.assertEqual(Hotel.get_hotel("H1").to_dict(), expected)
+            Hotel.hotels = []
+            Reservation.reservations = []
+            Reservation.load_reservations_from_file(reservations_file)
+            Hotel.load_hotels_from_file(hotels_file)
+        finally:
+            shutil.rmtree(directory)
+        self.assertEqual(len(Reservation.reservations), 1)
+        hotel = Hotel.get_hotel("H1")
+        self.assertEqual(hotel.to_dict(), expected)
+        self.assertEqual(len(hotel.rooms["101"].reservations), 2)
+        self.assertTrue(Reservation.get_reservation("R1").held_by_hotel)
+
+    def test_snapshot_writes_each_booking_once(self):
+        """Probar que el snapshot guarda cada reserva una sola vez."""
+        self.hotel.reserve_room("101", "C1", "2024-02-01", "2024-02-03")
+        self.hotel.reserve_room("101", "C2", "2024-02-10", "2024-02-12")
+        self.reserve()
+        expected = self.hotel.to_dict()
+        state = storage.snapshot()
+        self.assertEqual(
+            [booking['customer_id'] for booking
+             in state['hotels'][0]['rooms']['101']['reservations']], ["C1"])
+        self.assertEqual([(reservation['reservation_id'],
+                           reservation.get('held_by_hotel'))
+                          for reservation in state['reservations']],
+                         [("R1", True)])
+        storage.load_snapshot(state)
+        self.assertEqual(Hotel.get_hotel("H1").to_dict(), expected)
+        self.assertEqual(
+            len(Hotel.get_hotel("H1").rooms["101"].reservations), 2)
+        self.assertFalse(Hotel.get_hotel("H1").is_room_available(
+            "101", "2024-02-11", "2024-02-11"))
+
+    def test_room_numbers_are_normalized(self):
+        """Probar que 102 y "102" son la misma habitación."""
+        self.hotel.add_room(102, 2)
+        with self.assertRaises(ValueError):
+            self.hotel.add_room("102", 2)
+        self.hotel.reserve_room(102, "C1", "2024-02-01", "2024-02-03")
+        self.assertFalse(self.hotel.is_room_available(
+            "102", "2024-02-02", "2024-02-02"))
+        self.assertIs(self.hotel.rooms[102], self.hotel.rooms["102"])
+        self.assertEqual(list(self.hotel.rooms), ["101", "102"])
+
+    def tearDown(self):
+        """Limpiar el estado."""
+        Hotel.hotels = []
+        Reservation.reservations = []
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+"""Pruebas unitarias para las utilidades de fechas."""
+import unittest
+import datetime
+from dates import parse_day, to_day, day_to_datetime, format_day
+
+
+class TestDates(unittest.TestCase):
+    """Clase que engloba las pruebas
+    unitarias necesarias para el módulo dates."""
+    def test_parse_day(self):
+        """Probar la conversión de cadenas a días ordinales."""
+        expected = datetime.date(2024, 2, 10).toordinal()
+        self.assertEqual(parse_day("2024-02-10"), expected)
+        # strptime acepta meses y días sin ceros a la izquierda
+        self.assertEqual(parse_day("2024-2-10"), expected)
+        with self.assertRaises(ValueError):
+            parse_day("2024-02-30")
+
+    def test_to_day(self):
+        """Probar la conversión de distintos tipos a día ordinal."""
+        day = datetime.date(2024, 2, 10).toordinal()
+        self.assertEqual(to_day(day), day)
+        self.assertEqual(to_day(datetime.date(2024, 2, 10)), day)
+        self.assertEqual(to_day(datetime.datetime(2024, 2, 10, 15)), day)
+
+    def test_round_trip(self):
+        """Probar la conversión de regreso a datetime y cadena."""
+        day = parse_day("2024-02-10")
+        self.assertEqual(day_to_datetime(day),
+                         datetime.datetime(2024, 2, 10))
+        self.assertEqual(format_day(day), "2024-02-10")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+"""Pruebas unitarias para IntervalIndex."""
+import unittest
+from interval_index import IntervalIndex
+
+
+class TestIntervalIndex(unittest.TestCase):
+    """Clase que engloba las pruebas
+    unitarias necesarias para la clase IntervalIndex."""
+    def setUp(self):
+        """Crear un índice con tres intervalos."""
+        self.index = IntervalIndex()
+        self.index.add(10, 12, "A")
+        self.index.add(20, 25, "B")
+        self.index.add(1, 3, "C")
+
+    def test_items_sorted_by_start(self):
+        """Probar que los elementos se recorren en orden de inicio."""
+        self.assertEqual(list(self.index), ["C", "A", "B"])
+        self.assertEqual(len(self.index), 3)
+
+    def test_overlapping(self):
+        """Probar la búsqueda de intervalos solapados."""
+        self.assertEqual(list(self.index.overlapping(11, 21)), ["A", "B"])
+        self.assertEqual(list(self.index.overlapping(4, 9)), [])
+
+    def test_overlaps_is_inclusive(self):
+        """Probar que los extremos cuentan como solapamiento."""
+        self.assertTrue(self.index.overlaps(12, 15))
+        self.assertTrue(self.index.overlaps(5, 10))
+        self.assertFalse(self.index.overlaps(13, 19))
+
+    def test_extend_and_starting_between(self):
+        """Probar la carga de muchos intervalos y la búsqueda por inicio."""
+        self.index.extend([(15, 16, "D"), (0, 30, "E")])
+        self.assertEqual(list(self.index), ["E", "C", "A", "D", "B"])
+        self.assertEqual(self.index.starting_between(10, 20),
+                         ["A", "D", "B"])
+        self.assertEqual(list(self.index.overlapping(27, 29)), ["E"])
+
+    def test_remove(self):
+        """Probar la eliminación de un intervalo."""
+        self.index.remove(20, "B")
+        self.assertFalse(self.index.overlaps(20, 25))
+        with self.assertRaises(ValueError):
+            self.index.remove(20, "B")
+
+    def test_remove_shrinks_search_window(self):
+        """Probar que eliminar la estancia más larga reduce la ventana."""
+        self.index.add(0, 1000, "L")
+        self.assertEqual(list(self.index.overlapping(999, 999)), ["L"])
+        self.index.remove(0, "L")
+        # pylint: disable=protected-access
+        self.assertEqual(self.index._max_span, 5)
+        self.index.remove_many([(20, "B"), (10, "A"), (1, "C")])
+        self.assertEqual(self.index._max_span, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
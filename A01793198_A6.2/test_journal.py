@@ -0,0 +1,205 @@
+"""Pruebas unitarias para la bitácora de persistencia."""
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+import storage
+from customer import Customer
+from hotel import Hotel
+from journal import Journal
+from reservation import Reservation, ReservationData
+
+
+class TestJournal(unittest.TestCase):
+    """Clase que engloba las pruebas
+    unitarias necesarias para Journal y storage."""
+    def setUp(self):
+        """Crear un directorio temporal y limpiar el estado."""
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "state")
+        Hotel.hotels = []
+        Customer.customers = []
+        Reservation.reservations = []
+
+    def make_changes(self):
+        """Realizar cambios sobre las tres clases."""
+        hotel = Hotel.create_hotel("H1", "Journal Hotel", "City")
+        hotel.add_room("101", 2)
+        hotel.add_room("102", 2)
+        hotel.reserve_room("101", "C1", "2024-02-10", "2024-02-12")
+        hotel.modify_hotel_info(location="Other City")
+        customer = Customer.create_customer("C1", "Jane", "jane@example.com")
+        customer.modify_customer_info(name="Jane Doe")
+        Customer.create_customer("C2", "John", "john@example.com")
+        Customer.delete_customer("C2")
+        reservation = Reservation.create_reservation(ReservationData(
+            "R1", "H1", "102", "C1", "2024-02-10", "2024-02-12"))
+        reservation.modify_reservation(end_date="2024-02-14")
+
+    def assert_restored(self):
+        """Verificar que el estado restaurado coincide con los cambios."""
+        hotel = Hotel.get_hotel("H1")
+        self.assertEqual(hotel.location, "Other City")
+        self.assertFalse(hotel.is_room_available("101", "2024-02-11",
+                                                 "2024-02-11"))
+        self.assertEqual(Customer.get_customer("C1").name, "Jane Doe")
+        self.assertIsNone(Customer.customers.get("C2"))
+        self.assertEqual(Reservation.get_reservation("R1").to_dict()
+                         ['end_date'], "2024-02-14")
+
+    def test_record_and_restore(self):
+        """Probar que reproducir la bitácora reconstruye el estado."""
+        journal = Journal(self.path)
+        storage.attach(journal)
+        self.make_changes()
+        journal.close()
+        storage.detach()
+        Hotel.hotels = []
+        Customer.customers = []
+        Reservation.reservations = []
+        storage.restore(Journal(self.path))
+        self.assert_restored()
+
+    def test_compact(self):
+        """Probar que la compactación escribe un snapshot
+        y vacía la bitácora."""
+        journal = Journal(self.path)
+        storage.attach(journal)
+        self.make_changes()
+        storage.compact(journal)
+        self.assertEqual(os.path.getsize(journal.log_path), 0)
+        Customer.create_customer("C3", "Ann", "ann@example.com")
+        journal.close()
+        storage.restore(Journal(self.path))
+        self.assert_restored()
+        self.assertIsNotNone(Customer.customers.get("C3"))
+
+    def test_periodic_compaction(self):
+        """Probar la compactación automática cada N operaciones."""
+        journal = Journal(self.path, compact_every=3)
+        storage.attach(journal)
+        self.make_changes()
+        self.assertTrue(os.path.exists(journal.snapshot_path))
+        snapshot, entries = journal.load()
+        self.assertLess(len(entries), 3)
+        self.assertGreater(snapshot['seq'], 0)
+
+    def test_loaded_hotels_are_journaled(self):
+        """Probar que cargar hoteles de un archivo registra habitaciones y
+        reservas."""
+        hotels_file = os.path.join(self.directory, "hotels.json")
+        hotel = Hotel.create_hotel("H1", "Journal Hotel", "City")
+        hotel.add_room("101", 2)
+        hotel.reserve_room("101", "C1", "2024-02-10", "2024-02-12")
+        expected = hotel.to_dict()
+        Hotel.save_hotels_to_file(hotels_file)
+        Hotel.hotels = []
+        journal = Journal(self.path)
+        storage.attach(journal)
+        Hotel.load_hotels_from_file(hotels_file)
+        journal.close()
+        storage.detach()
+        Hotel.hotels = []
+        storage.restore(Journal(self.path))
+        self.assertEqual(Hotel.get_hotel("H1").to_dict(), expected)
+
+    def test_torn_last_line_is_ignored(self):
+        """Probar que una última línea incompleta se ignora."""
+        journal = Journal(self.path)
+        storage.attach(journal)
+        Customer.create_customer("C1", "Jane", "jane@example.com")
+        journal.close()
+        with open(journal.log_path, "a", encoding="utf-8") as file:
+            file.write('{"seq": 2, "entity": "cust')
+        _, entries = Journal(self.path).load()
+        self.assertEqual(len(entries), 1)
+
+    def test_restart_after_torn_write(self):
+        """Probar que las entradas escritas tras reiniciar con una línea
+        cortada se recuperan."""
+        journal = Journal(self.path)
+        storage.attach(journal)
+        Customer.create_customer("C1", "Jane", "jane@example.com")
+        journal.close()
+        with open(journal.log_path, "a", encoding="utf-8") as file:
+            file.write('{"seq": 2, "entity": "cust')
+        journal = Journal(self.path)
+        storage.attach(journal)
+        Customer.create_customer("C2", "John", "john@example.com")
+        journal.close()
+        storage.detach()
+        Customer.customers = []
+        storage.restore(Journal(self.path))
+        self.assertEqual([customer.customer_id
+                          for customer in Customer.customers], ["C1", "C2"])
+
+    def test_failed_batch_leaves_no_entries(self):
+        """Probar que un lote que falla a medio escribir no deja entradas."""
+        journal = Journal(self.path)
+        journal.record('customer', 'create', {'customer_id': "C1"})
+        log_file = journal._file  # pylint: disable=protected-access
+
+        class FailingFile:
+            """Archivo que escribe solo una parte y falla."""
+            def write(self, text):
+                """Escribir el inicio del texto y simular un disco lleno."""
+                log_file.write(text[:30])
+                log_file.flush()
+                raise OSError("disk full")
+
+            def fileno(self):
+                """Regresar el descriptor del archivo real."""
+                return log_file.fileno()
+
+            def close(self):
+                """Cerrar el archivo real."""
+                log_file.close()
+
+        journal._file = FailingFile()  # pylint: disable=protected-access
+        with self.assertRaises(OSError):
+            journal.record_many(
+                [('customer', 'create', {'customer_id': "C2"}),
+                 ('customer', 'delete', {'customer_id': "C1"})])
+        journal.record('customer', 'create', {'customer_id': "C3"})
+        journal.close()
+        _, entries = Journal(self.path).load()
+        self.assertEqual([(entry['seq'], entry['data']['customer_id'])
+                          for entry in entries], [(1, "C1"), (2, "C3")])
+
+    def test_compaction_during_concurrent_writes(self):
+        """Probar que compactar mientras otros hilos escriben no duplica
+        ni pierde cambios."""
+        journal = Journal(self.path, compact_every=7)
+        storage.attach(journal)
+
+        def create_customers(prefix):
+            """Crear clientes desde un hilo."""
+            for number in range(50):
+                Customer.create_customer(f"{prefix}{number}", "Jane",
+                                         "jane@example.com")
+
+        threads = [threading.Thread(target=create_customers, args=(prefix,))
+                   for prefix in "ABCD"]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        journal.close()
+        storage.detach()
+        Customer.customers = []
+        with self.assertNoLogs(level="ERROR"):
+            storage.restore(Journal(self.path))
+        self.assertEqual(len(Customer.customers), 200)
+
+    def tearDown(self):
+        """Desconectar el backend y borrar los archivos temporales."""
+        storage.detach()
+        Hotel.hotels = []
+        Customer.customers = []
+        Reservation.reservations = []
+        shutil.rmtree(self.directory)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+"""Pruebas de concurrencia para LockTable, Hotel y Reservation."""
+import random
+import sys
+import threading
+import unittest
+from dates import format_day, to_day
+from hotel import Hotel
+from locks import LockTable
+from reservation import Reservation, ReservationData
+
+THREADS = 8
+ATTEMPTS = 1000
+ROOMS = 3
+FIRST_DAY = to_day("2024-01-01")
+
+
+def run_threads(target):
+    """Ejecuta target(número_de_hilo) en varios hilos a la vez."""
+    barrier = threading.Barrier(THREADS)
+
+    def worker(number):
+        barrier.wait()
+        target(number)
+
+    threads = [threading.Thread(target=worker, args=(number,))
+               for number in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def random_stay(generator):
+    """Regresa las fechas de una estancia corta al azar en 2024."""
+    start = FIRST_DAY + generator.randrange(360)
+    return format_day(start), format_day(start + generator.randint(1, 4))
+
+
+def overlapping_pairs(stays):
+    """Regresa los pares de (inicio, fin) que comparten algún día."""
+    stays = sorted(stays)
+    return [(first, second) for first, second in zip(stays, stays[1:])
+            if second[0] <= first[1]]
+
+
+class TestLocks(unittest.TestCase):
+    """Clase que engloba las pruebas
+    de reservas concurrentes."""
+    def setUp(self):
+        """Cambiar de hilo muy seguido para provocar carreras."""
+        self.switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        Hotel.hotels = []
+        Reservation.reservations = []
+
+    def test_lock_per_key(self):
+        """Probar que cada llave tiene un único candado."""
+        table = LockTable()
+        self.assertIs(table.lock(("H1", "101")), table.lock(("H1", "101")))
+        self.assertIsNot(table.lock(("H1", "101")),
+                         table.lock(("H1", "102")))
+        self.assertEqual(len(table), 2)
+
+    def test_concurrent_reserve_room(self):
+        """Probar que Hotel.reserve_room no solapa reservas entre hilos."""
+        hotel = Hotel.create_hotel("H1", "Stress Hotel", "City")
+        for room in range(ROOMS):
+            hotel.add_room(str(room), 2)
+        accepted = []
+
+        def book(number):
+            generator = random.Random(number)
+            for attempt in range(ATTEMPTS):
+                room = str(generator.randrange(ROOMS))
+                start, end = random_stay(generator)
+                try:
+                    hotel.reserve_room(room, f"C{number}-{attempt}",
+                                       start, end)
+                except ValueError:
+                    continue
+                accepted.append(room)
+
+        run_threads(book)
+        for room_number, room in hotel.rooms.items():
+            stays = [(booking.start_day, booking.end_day)
+                     for booking in room.reservations]
+            self.assertEqual(overlapping_pairs(stays), [])
+            self.assertEqual(len(stays), accepted.count(room_number))
+            self.assertEqual(len(room.index), len(stays))
+
+    def test_concurrent_create_reservation(self):
+        """Probar que create_reservation no solapa reservas entre hilos."""
+        accepted = []
+
+        def book(number):
+            generator = random.Random(number)
+            for attempt in range(ATTEMPTS):
+                start, end = random_stay(generator)
+                try:
+                    accepted.append(Reservation.create_reservation(
+                        ReservationData(f"R{number}-{attempt}", "H1",
+                                        generator.randrange(ROOMS),
+                                        f"C{number}", start, end)))
+                except ValueError:
+                    continue
+
+        run_threads(book)
+        self.assertEqual(len(Reservation.reservations), len(accepted))
+        for room in range(ROOMS):
+            stays = [(reservation.start_day, reservation.end_day)
+                     for reservation in accepted
+                     if reservation.room_number == room]
+            self.assertEqual(overlapping_pairs(stays), [])
+        self.assertEqual(len(Reservation.find_overlapping("2024-01-01",
+                                                          "2025-01-31")),
+                         len(accepted))
+
+    def tearDown(self):
+        """Restaurar el intervalo de cambio de hilo y limpiar el estado."""
+        sys.setswitchinterval(self.switch_interval)
+        Hotel.hotels = []
+        Reservation.reservations = []
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+"""Pruebas unitarias para los registros de habitaciones."""
+import unittest
+from dates import parse_day
+from records import Room, RoomBooking
+
+
+class TestRecords(unittest.TestCase):
+    """Clase que engloba las pruebas
+    unitarias necesarias para Room y RoomBooking."""
+    def setUp(self):
+        """Crear una habitación con una reserva."""
+        self.booking = RoomBooking("C001", parse_day("2024-02-10"),
+                                   parse_day("2024-02-12"))
+        self.room = Room(2)
+        self.room.reservations.append(self.booking)
+
+    def test_key_access(self):
+        """Probar el acceso por llave del formato de diccionario."""
+        self.assertEqual(self.room['capacity'], 2)
+        self.assertEqual(self.room['reservations'][0]['customer_id'],
+                         "C001")
+        self.assertEqual(self.booking['start_date'], "2024-02-10")
+        with self.assertRaises(KeyError):
+            _ = self.booking['hotel_id']
+
+    def test_to_dict(self):
+        """Probar la conversión al formato del JSON."""
+        self.assertEqual(self.room.to_dict(),
+                         {'capacity': 2,
+                          'reservations': [{'customer_id': "C001",
+                                            'start_date': "2024-02-10",
+                                            'end_date': "2024-02-12"}]})
+
+    def test_no_instance_dict(self):
+        """Probar que los registros no tienen __dict__."""
+        self.assertFalse(hasattr(self.booking, '__dict__'))
+        self.assertFalse(hasattr(self.room, '__dict__'))
+
+
+if __name__ == '__main__':
+    unittest.main()
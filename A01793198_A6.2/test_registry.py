@@ -0,0 +1,48 @@
+"""Pruebas unitarias para Registry."""
+import unittest
+from types import SimpleNamespace
+from registry import Registry
+
+
+class TestRegistry(unittest.TestCase):
+    """Clase que engloba las pruebas
+    unitarias necesarias para la clase Registry."""
+    def setUp(self):
+        """Crear un registro con dos elementos."""
+        self.first = SimpleNamespace(item_id="A")
+        self.second = SimpleNamespace(item_id="B")
+        self.registry = Registry('item_id', [self.first, self.second])
+
+    def test_list_behaviour(self):
+        """Probar que se comporta como la lista original."""
+        self.assertEqual(len(self.registry), 2)
+        self.assertIs(self.registry[0], self.first)
+        self.assertIs(self.registry[-1], self.second)
+        self.assertEqual(list(self.registry), [self.first, self.second])
+        with self.assertRaises(IndexError):
+            _ = self.registry[2]
+
+    def test_get_and_contains(self):
+        """Probar la búsqueda por llave."""
+        self.assertIs(self.registry.get("B"), self.second)
+        self.assertIsNone(self.registry.get("C"))
+        self.assertIn(self.first, self.registry)
+        self.assertNotIn(SimpleNamespace(item_id="A"), self.registry)
+
+    def test_duplicate_key(self):
+        """Probar que no se aceptan llaves duplicadas."""
+        with self.assertRaises(ValueError):
+            self.registry.append(SimpleNamespace(item_id="A"))
+
+    def test_remove(self):
+        """Probar la eliminación de un elemento."""
+        self.assertIs(self.registry[0], self.first)
+        self.registry.remove(self.first)
+        self.assertEqual(list(self.registry), [self.second])
+        self.assertIs(self.registry[0], self.second)
+        with self.assertRaises(ValueError):
+            self.registry.remove(self.first)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,141 +1,252 @@
-"""Pruebas unitarias para Reservaciones."""
-import unittest
-import datetime
-import os
-from io import StringIO
-from unittest.mock import patch, mock_open
-from reservation import Reservation, ReservationData
-
-
-class TestReservation(unittest.TestCase):
-    """Clase que engloba toas las pruebas
-    unitarias necesarias para la clase reservación."""
-    @classmethod
-    def setUpClass(cls):
-        """Preparar el entorno de prueba antes
-        de ejecutar las pruebas de esta clase."""
-        Reservation.reservations = []
-
-    def test_create_reservation(self):
-        """Probar la creación de una reservación."""
-        reservation_data = ReservationData("R001", "H001", 101,
-                                           "C001", "2024-02-10", "2024-02-15")
-        reservation = Reservation.create_reservation(reservation_data)
-        self.assertEqual(reservation.start_date,
-                         datetime.datetime.strptime("2024-02-10",
-                                                    "%Y-%m-%d"))
-        self.assertEqual(reservation.end_date,
-                         datetime.datetime.strptime("2024-02-15",
-                                                    "%Y-%m-%d"))
-
-    def test_cancel_reservation(self):
-        """Probar la cancelación de una reservación."""
-        reservation_data = ReservationData("R003", "H001", 102, "C002",
-                                           "2024-03-10", "2024-03-15")
-        Reservation.create_reservation(reservation_data)
-        result = Reservation.cancel_reservation("R003")
-        self.assertIsNone(result)
-
-    def test_modify_reservation(self):
-        """Probar la modificación de una reservación."""
-        reservation_data = ReservationData("R004", "H001", 103, "C003",
-                                           "2024-04-10", "2024-04-15")
-        reservation = Reservation.create_reservation(reservation_data)
-        reservation.modify_reservation(start_date="2024-04-12")
-        self.assertEqual(reservation.start_date,
-                         datetime.datetime.strptime("2024-04-12",
-                                                    "%Y-%m-%d"))
-
-    def test_save_and_load_reservations(self):
-        """Test para guardar y cargar reservaciones desde un archivo."""
-        Reservation.reservations = []
-        reservation_data_1 = ReservationData("XCV", "H001", 101, "C001",
-                                             "2025-02-10", "2025-02-15")
-        reservation_data_2 = ReservationData("QWE", "H001", 102, "C002",
-                                             "2025-03-10", "2025-03-15")
-        Reservation.create_reservation(reservation_data_1)
-        Reservation.create_reservation(reservation_data_2)
-        Reservation.save_reservations_to_file("test_reservations.json")
-        self.assertTrue(os.path.exists("test_reservations.json"))
-        Reservation.reservations = []
-        Reservation.load_reservations_from_file("test_reservations.json")
-        self.assertEqual(len(Reservation.reservations), 2)
-        loaded_reservation_data_1 = Reservation.reservations[0]
-        self.assertEqual(loaded_reservation_data_1.reservation_id, "XCV")
-        loaded_reservation_data_2 = Reservation.reservations[1]
-        self.assertEqual(loaded_reservation_data_2.reservation_id, "QWE")
-
-    def test_reservation_conflict(self):
-        """Probar que no se pueden hacer
-        reservaciones que se solapen en las mismas fechas."""
-        Reservation.reservations = []
-        reservation_data_1 = ReservationData("R100", "H001", 101, "C001",
-                                             "2028-02-10", "2028-02-15")
-        Reservation.create_reservation(reservation_data_1)
-        reservation_data_2 = ReservationData("R101", "H001", 101, "C002",
-                                             "2028-02-14", "2028-02-20")
-        with self.assertRaises(ValueError):
-            Reservation.create_reservation(reservation_data_2)
-
-    def test_create_reservation_with_end_date_before_start_date(self):
-        """Probar que se lanza un ValueError si la fecha de
-        inicio es igual o posterior a la fecha de fin."""
-        reservation_data = ReservationData("R005", "H001", 102, "C001",
-                                           "2024-02-15", "2024-02-10")
-        with self.assertRaises(ValueError):
-            Reservation.create_reservation(reservation_data)
-
-    def test_create_reservation_with_existing_id(self):
-        """Probar que se lanza un ValueError
-        si el ID de la reservación ya existe."""
-        Reservation.reservations = []
-        reservation_data_1 = ReservationData("R006", "H001", 103, "C001",
-                                             "2024-03-15", "2024-03-20")
-        Reservation.create_reservation(reservation_data_1)
-        reservation_data_2 = ReservationData("R006", "H001", 103, "C002",
-                                             "2024-03-21", "2024-03-25")
-        with self.assertRaises(ValueError):
-            Reservation.create_reservation(reservation_data_2)
-
-    def test_cancel_nonexistent_reservation(self):
-        """Test that a ValueError is raised when trying to
-        cancel a reservation that does not exist."""
-        with self.assertRaises(ValueError):
-            Reservation.cancel_reservation("R999")
-
-    def test_display_reservation_info(self):
-        """Test that display_reservation_info
-        method prints the correct output."""
-        reservation_data = ReservationData("R00300", "H003", 303, "C003",
-                                           "2024-04-10", "2024-04-15")
-        reservation = Reservation.create_reservation(reservation_data)
-        expected_output = f"Reservation ID: {reservation.reservation_id}, " \
-            f"Hotel ID: {reservation.hotel_id}, " \
-            f"Room Number: {reservation.room_number}, " \
-            f"Customer ID: {reservation.customer_id}, " \
-            f"Start Date: {reservation.start_date.strftime('%Y-%m-%d')}, " \
-            f"End Date: {reservation.end_date.strftime('%Y-%m-%d')}\n"
-        with patch('sys.stdout', new_callable=StringIO) as fake_out:
-            reservation.display_reservation_info()
-            self.assertEqual(fake_out.getvalue(), expected_output)
-
-    @patch('builtins.open', new_callable=mock_open)
-    def test_load_reservations_file_not_found(self, mock_file):
-        """Test loading reservations from a
-        non-existent file logs the correct message."""
-        mock_file.side_effect = FileNotFoundError
-        with patch('sys.stdout', new_callable=StringIO) as fake_out:
-            Reservation.load_reservations_from_file("nonexistent_file.json")
-            self.assertIn("No previous reservation data found.",
-                          fake_out.getvalue())
-
-    @classmethod
-    def tearDownClass(cls):
-        """Limpiar después de todas las pruebas de esta clase."""
-        Reservation.reservations = []
-        if os.path.exists("test_reservations.json"):
-            os.remove("test_reservations.json")
-
-
-if __name__ == '__main__':
-    unittest.main()
+"""Pruebas unitarias para Reservaciones."""
+import unittest
+import datetime
+import json
+import os
+from io import StringIO
+from unittest.mock import patch, mock_open
+from reservation import Reservation, ReservationData
+
+
+class TestReservation(unittest.TestCase):
+    """Clase que engloba toas las pruebas
+    unitarias necesarias para la clase reservación."""
+    @classmethod
+    def setUpClass(cls):
+        """Preparar el entorno de prueba antes
+        de ejecutar las pruebas de esta clase."""
+        Reservation.reservations = []
+
+    def test_create_reservation(self):
+        """Probar la creación de una reservación."""
+        reservation_data = ReservationData("R001", "H001", 101,
+                                           "C001", "2024-02-10", "2024-02-15")
+        reservation = Reservation.create_reservation(reservation_data)
+        self.assertEqual(reservation.start_date,
+                         datetime.datetime.strptime("2024-02-10",
+                                                    "%Y-%m-%d"))
+        self.assertEqual(reservation.end_date,
+                         datetime.datetime.strptime("2024-02-15",
+                                                    "%Y-%m-%d"))
+
+    def test_cancel_reservation(self):
+        """Probar la cancelación de una reservación."""
+        reservation_data = ReservationData("R003", "H001", 102, "C002",
+                                           "2024-03-10", "2024-03-15")
+        Reservation.create_reservation(reservation_data)
+        result = Reservation.cancel_reservation("R003")
+        self.assertIsNone(result)
+
+    def test_modify_reservation(self):
+        """Probar la modificación de una reservación."""
+        reservation_data = ReservationData("R004", "H001", 103, "C003",
+                                           "2024-04-10", "2024-04-15")
+        reservation = Reservation.create_reservation(reservation_data)
+        reservation.modify_reservation(start_date="2024-04-12")
+        self.assertEqual(reservation.start_date,
+                         datetime.datetime.strptime("2024-04-12",
+                                                    "%Y-%m-%d"))
+
+    def test_save_and_load_reservations(self):
+        """Test para guardar y cargar reservaciones desde un archivo."""
+        Reservation.reservations = []
+        reservation_data_1 = ReservationData("XCV", "H001", 101, "C001",
+                                             "2025-02-10", "2025-02-15")
+        reservation_data_2 = ReservationData("QWE", "H001", 102, "C002",
+                                             "2025-03-10", "2025-03-15")
+        Reservation.create_reservation(reservation_data_1)
+        Reservation.create_reservation(reservation_data_2)
+        Reservation.save_reservations_to_file("test_reservations.json")
+        self.assertTrue(os.path.exists("test_reservations.json"))
+        Reservation.reservations = []
+        Reservation.load_reservations_from_file("test_reservations.json")
+        self.assertEqual(len(Reservation.reservations), 2)
+        loaded_reservation_data_1 = Reservation.reservations[0]
+        self.assertEqual(loaded_reservation_data_1.reservation_id, "XCV")
+        loaded_reservation_data_2 = Reservation.reservations[1]
+        self.assertEqual(loaded_reservation_data_2.reservation_id, "QWE")
+
+    def test_reservation_conflict(self):
+        """Probar que no se pueden hacer
+        reservaciones que se solapen en las mismas fechas."""
+        Reservation.reservations = []
+        reservation_data_1 = ReservationData("R100", "H001", 101, "C001",
+                                             "2028-02-10", "2028-02-15")
+        Reservation.create_reservation(reservation_data_1)
+        reservation_data_2 = ReservationData("R101", "H001", 101, "C002",
+                                             "2028-02-14", "2028-02-20")
+        with self.assertRaises(ValueError):
+            Reservation.create_reservation(reservation_data_2)
+
+    def test_create_reservation_with_end_date_before_start_date(self):
+        """Probar que se lanza un ValueError si la fecha de
+        inicio es igual o posterior a la fecha de fin."""
+        reservation_data = ReservationData("R005", "H001", 102, "C001",
+                                           "2024-02-15", "2024-02-10")
+        with self.assertRaises(ValueError):
+            Reservation.create_reservation(reservation_data)
+
+    def test_create_reservation_with_existing_id(self):
+        """Probar que se lanza un ValueError
+        si el ID de la reservación ya existe."""
+        Reservation.reservations = []
+        reservation_data_1 = ReservationData("R006", "H001", 103, "C001",
+                                             "2024-03-15", "2024-03-20")
+        Reservation.create_reservation(reservation_data_1)
+        reservation_data_2 = ReservationData("R006", "H001", 103, "C002",
+                                             "2024-03-21", "2024-03-25")
+        with self.assertRaises(ValueError):
+            Reservation.create_reservation(reservation_data_2)
+
+    def test_cancel_nonexistent_reservation(self):
+        """Test that a ValueError is raised when trying to
+        cancel a reservation that does not exist."""
+        with self.assertRaises(ValueError):
+            Reservation.cancel_reservation("R999")
+
+    def test_display_reservation_info(self):
+        """Test that display_reservation_info
+        method prints the correct output."""
+        reservation_data = ReservationData("R00300", "H003", 303, "C003",
+                                           "2024-04-10", "2024-04-15")
+        reservation = Reservation.create_reservation(reservation_data)
+        expected_output = f"Reservation ID: {reservation.reservation_id}, " \
+            f"Hotel ID: {reservation.hotel_id}, " \
+            f"Room Number: {reservation.room_number}, " \
+            f"Customer ID: {reservation.customer_id}, " \
+            f"Start Date: {reservation.start_date.strftime('%Y-%m-%d')}, " \
+            f"End Date: {reservation.end_date.strftime('%Y-%m-%d')}\n"
+        with patch('sys.stdout', new_callable=StringIO) as fake_out:
+            reservation.display_reservation_info()
+            self.assertEqual(fake_out.getvalue(), expected_output)
+
+    @patch('builtins.open', new_callable=mock_open)
+    def test_load_reservations_file_not_found(self, mock_file):
+        """Test loading reservations from a
+        non-existent file logs the correct message."""
+        mock_file.side_effect = FileNotFoundError
+        with patch('sys.stdout', new_callable=StringIO) as fake_out:
+            Reservation.load_reservations_from_file("nonexistent_file.json")
+            self.assertIn("No previous reservation data found.",
+                          fake_out.getvalue())
+
+    def test_get_reservation(self):
+        """Probar la búsqueda de una reservación por ID."""
+        reservation_data = ReservationData("R200", "H002", 201, "C001",
+                                           "2024-05-10", "2024-05-15")
+        reservation = Reservation.create_reservation(reservation_data)
+        self.assertIs(Reservation.get_reservation("R200"), reservation)
+        with self.assertRaises(ValueError):
+            Reservation.get_reservation("R999")
+
+    def test_cancel_frees_room(self):
+        """Probar que cancelar libera la habitación para esas fechas."""
+        reservation_data = ReservationData("R201", "H002", 202, "C001",
+                                           "2024-05-10", "2024-05-15")
+        Reservation.create_reservation(reservation_data)
+        Reservation.cancel_reservation("R201")
+        reservation_data = ReservationData("R202", "H002", 202, "C002",
+                                           "2024-05-12", "2024-05-14")
+        reservation = Reservation.create_reservation(reservation_data)
+        self.assertEqual(reservation.reservation_id, "R202")
+
+    def test_reset_reservations_list(self):
+        """Probar que reemplazar la lista reinicia los índices."""
+        reservation_data = ReservationData("R203", "H002", 203, "C001",
+                                           "2024-05-10", "2024-05-15")
+        Reservation.create_reservation(reservation_data)
+        Reservation.reservations = []
+        reservation = Reservation.create_reservation(reservation_data)
+        self.assertEqual(len(Reservation.reservations), 1)
+        self.assertIs(Reservation.reservations[0], reservation)
+
+    def test_bulk_load_reservations(self):
+        """Probar la carga masiva con registros rechazados."""
+        Reservation.reservations = []
+        records = [
+            {"reservation_id": "B1", "hotel_id": "H009", "room_number": 1,
+             "customer_id": "C001", "start_date": "2024-06-10",
+             "end_date": "2024-06-15"},
+            {"reservation_id": "B2", "hotel_id": "H009", "room_number": 1,
+             "customer_id": "C002", "start_date": "2024-06-01",
+             "end_date": "2024-06-05"},
+            {"reservation_id": "B3", "hotel_id": "H009", "room_number": 1,
+             "customer_id": "C003", "start_date": "2024-06-04",
+             "end_date": "2024-06-08"},
+            {"reservation_id": "B1", "hotel_id": "H009", "room_number": 2,
+             "customer_id": "C004", "start_date": "2024-06-01",
+             "end_date": "2024-06-05"},
+            {"reservation_id": "B4", "hotel_id": "H009", "room_number": 2,
+             "customer_id": "C005", "start_date": "2024-06-09",
+             "end_date": "2024-06-05"},
+        ]
+        with open("test_bulk_reservations.json", "w",
+                  encoding="utf-8") as file:
+            json.dump(records, file)
+        report = Reservation.bulk_load_reservations(
+            "test_bulk_reservations.json")
+        os.remove("test_bulk_reservations.json")
+        self.assertEqual(report.loaded, 2)
+        self.assertEqual([reservation.reservation_id for reservation
+                          in Reservation.reservations], ["B1", "B2"])
+        self.assertEqual(sorted(rejected['position']
+                                for rejected in report.rejected), [2, 3, 4])
+        with self.assertRaises(ValueError):
+            Reservation.create_reservation(ReservationData(
+                "B5", "H009", 1, "C006", "2024-06-05", "2024-06-07"))
+
+    def test_date_and_customer_queries(self):
+        """Probar las consultas por rango de fechas, cliente,
+        llegadas y salidas, incluso después de modificar fechas."""
+        Reservation.reservations = []
+        first = Reservation.create_reservation(ReservationData(
+            "Q1", "H010", 1, "C001", "2024-07-01", "2024-07-05"))
+        second = Reservation.create_reservation(ReservationData(
+            "Q2", "H010", 2, "C002", "2024-07-04", "2024-07-10"))
+        third = Reservation.create_reservation(ReservationData(
+            "Q3", "H010", 3, "C001", "2024-07-20", "2024-07-22"))
+        self.assertEqual(Reservation.find_overlapping("2024-07-05",
+                                                      "2024-07-06"),
+                         [first, second])
+        self.assertEqual(Reservation.reservations_for_customer("C001"),
+                         [first, third])
+        self.assertEqual(Reservation.arrivals("2024-07-04"), [second])
+        self.assertEqual(Reservation.departures("2024-07-05"), [first])
+        first.modify_reservation(start_date="2024-07-03",
+                                 end_date="2024-07-04")
+        self.assertEqual(Reservation.arrivals("2024-07-03"), [first])
+        self.assertEqual(Reservation.departures("2024-07-05"), [])
+        self.assertEqual(Reservation.find_overlapping("2024-07-05",
+                                                      "2024-07-06"),
+                         [second])
+
+    def test_reschedule_conflict_rolls_back(self):
+        """Probar que reprogramar sobre otra reservación de la misma
+        habitación falla sin modificar nada."""
+        Reservation.reservations = []
+        first = Reservation.create_reservation(ReservationData(
+            "S1", "H011", 1, "C001", "2024-08-01", "2024-08-05"))
+        Reservation.create_reservation(ReservationData(
+            "S2", "H011", 1, "C002", "2024-08-10", "2024-08-15"))
+        with self.assertRaises(ValueError):
+            first.reschedule("2024-08-03", "2024-08-11")
+        self.assertEqual(first.end_date, datetime.datetime(2024, 8, 5))
+        self.assertEqual(Reservation.departures("2024-08-05"), [first])
+        with self.assertRaises(ValueError):
+            Reservation.create_reservation(ReservationData(
+                "S3", "H011", 1, "C003", "2024-08-04", "2024-08-06"))
+        first.reschedule("2024-08-02", "2024-08-08")
+        self.assertEqual(Reservation.find_overlapping("2024-08-08",
+                                                      "2024-08-08"),
+                         [first])
+
+    @classmethod
+    def tearDownClass(cls):
+        """Limpiar después de todas las pruebas de esta clase."""
+        Reservation.reservations = []
+        if os.path.exists("test_reservations.json"):
+            os.remove("test_reservations.json")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+"""Pruebas unitarias para RoomCalendar."""
+import unittest
+from room_calendar import RoomCalendar
+
+
+class TestRoomCalendar(unittest.TestCase):
+    """Clase que engloba las pruebas
+    unitarias necesarias para la clase RoomCalendar."""
+    def setUp(self):
+        """Crear un calendario con las noches 10, 11, 20 y 21 ocupadas."""
+        self.calendar = RoomCalendar()
+        self.calendar.occupy(20, 22)
+        self.calendar.occupy(10, 12)
+
+    def test_is_free(self):
+        """Probar que los días de entrada y salida cuentan como ocupados."""
+        self.assertFalse(self.calendar.is_free(12, 15))
+        self.assertFalse(self.calendar.is_free(5, 10))
+        self.assertTrue(self.calendar.is_free(13, 19))
+        self.assertTrue(self.calendar.is_free(1, 5))
+
+    def test_occupied_nights(self):
+        """Probar el conteo de noches ocupadas en un rango."""
+        self.assertEqual(self.calendar.occupied_nights(0, 30), 4)
+        self.assertEqual(self.calendar.occupied_nights(11, 21), 2)
+
+    def test_first_free_start(self):
+        """Probar la búsqueda del primer día en que se puede entrar."""
+        self.assertEqual(self.calendar.first_free_start(10), 13)
+        self.assertEqual(self.calendar.first_free_start(5), 5)
+        self.assertEqual(self.calendar.first_free_start(9), 13)
+        self.assertEqual(self.calendar.first_free_start(18), 18)
+        self.assertEqual(self.calendar.first_free_start(19), 23)
+        for day in (10, 13, 19):
+            start = self.calendar.first_free_start(day)
+            self.assertTrue(self.calendar.is_free(start, start + 1))
+        self.assertEqual(RoomCalendar().first_free_start(7), 7)
+
+    def test_release(self):
+        """Probar que liberar una reservación desocupa sus noches."""
+        self.calendar.release(10, 12)
+        self.assertTrue(self.calendar.is_free(9, 13))
+        self.assertEqual(self.calendar.occupied_nights(0, 30), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+"""Pruebas unitarias para la búsqueda de habitaciones."""
+import unittest
+
+from hotel import Hotel
+from room_search import RoomSearch
+
+
+class TestRoomSearch(unittest.TestCase):
+    """Pruebas de RoomSearch y Hotel.search_rooms."""
+
+    def setUp(self):
+        """Crea hoteles en dos ciudades con habitaciones de varios tamaños."""
+        Hotel.hotels = []
+        self.north = Hotel.create_hotel("H1", "North", "Monterrey")
+        self.south = Hotel.create_hotel("H2", "South", "Monterrey")
+        self.other = Hotel.create_hotel("H3", "Other", "Puebla")
+        for hotel in (self.north, self.south, self.other):
+            hotel.add_room("101", 2)
+            hotel.add_room("201", 4)
+            hotel.add_room("301", 1)
+
+    def search(self, location="Monterrey", min_capacity=2,
+               start="2024-03-01", end="2024-03-05", **options):
+        """Busca con valores por omisión y regresa las coincidencias."""
+        return Hotel.search_rooms(location, min_capacity, start, end,
+                                  **options)[0]
+
+    def test_filters_location_and_capacity(self):
+        """Solo regresa habitaciones de la ciudad con capacidad suficiente."""
+        self.assertEqual(self.search(),
+                         [("H1", "101"), ("H2", "101"),
+                          ("H1", "201"), ("H2", "201")])
+        self.assertEqual(self.search(min_capacity=3),
+                         [("H1", "201"), ("H2", "201")])
+        self.assertEqual(self.search(location="Cancun"), [])
+
+    def test_skips_booked_rooms(self):
+        """Las habitaciones reservadas en el rango no se regresan."""
+        self.north.reserve_room("101", "C1", "2024-03-04", "2024-03-08")
+        self.assertNotIn(("H1", "101"), self.search())
+        self.assertIn(("H1", "101"), self.search(start="2024-03-10",
+                                                 end="2024-03-12"))
+        self.north.cancel_reservation("101", "C1")
+        self.assertIn(("H1", "101"), self.search())
+
+    def test_pagination(self):
+        """Las páginas recorren todas las coincidencias sin repetir."""
+        expected = self.search(min_capacity=1)
+        pages = []
+        cursor = None
+        while True:
+            page, cursor = Hotel.search_rooms("Monterrey", 1, "2024-03-01",
+                                              "2024-03-05", limit=4,
+                                              cursor=cursor)
+            pages.extend(page)
+            if cursor is None:
+                break
+        self.assertEqual(pages, expected)
+        self.assertEqual(len(pages), 6)
+
+    def test_index_follows_changes(self):
+        """Altas, cambios de ubicación y bajas se reflejan en el índice."""
+        self.search()
+        self.north.add_room("401", 6)
+        self.assertEqual(self.search(min_capacity=5), [("H1", "401")])
+        self.north.modify_hotel_info(location="Puebla")
+        self.assertEqual(self.search(min_capacity=5), [])
+        self.assertEqual(self.search(location="Puebla", min_capacity=5),
+                         [("H1", "401")])
+        Hotel.delete_hotel("H1")
+        self.assertEqual(self.search(location="Puebla", min_capacity=5),
+                         [])
+
+    def test_reset_rebuilds_index(self):
+        """Reemplazar la lista de hoteles descarta el índice anterior."""
+        self.search()
+        Hotel.hotels = []
+        self.assertEqual(self.search(), [])
+
+    def test_invalid_arguments(self):
+        """Fechas invertidas o un límite no positivo son errores."""
+        with self.assertRaises(ValueError):
+            self.search(start="2024-03-05", end="2024-03-01")
+        with self.assertRaises(ValueError):
+            self.search(limit=0)
+
+    def test_remove_hotel_drops_empty_buckets(self):
+        """Al quitar el único hotel de una cubeta se quita la cubeta."""
+        index = RoomSearch([self.other])
+        self.assertEqual(len(index), 3)
+        index.remove_hotel(self.other)
+        self.assertEqual(len(index), 0)
+        self.assertEqual(index.search("Puebla", 1, "2024-03-01",
+                                      "2024-03-05"), ([], None))
+
+
+if __name__ == '__main__':
+    unittest.main()
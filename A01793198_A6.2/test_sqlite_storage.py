@@ -0,0 +1,170 @@
+"""Pruebas unitarias para el backend SQLite."""
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+import storage
+from customer import Customer
+from hotel import Hotel
+from reservation import Reservation, ReservationData
+from sqlite_storage import SQLiteStorage
+
+
+class TestSQLiteStorage(unittest.TestCase):
+    """Clase que engloba las pruebas
+    unitarias necesarias para SQLiteStorage."""
+    def setUp(self):
+        """Crear una base de datos temporal y limpiar el estado."""
+        self.directory = tempfile.mkdtemp()
+        self.database = SQLiteStorage(os.path.join(self.directory,
+                                                   "hotel.db"))
+        Hotel.hotels = []
+        Customer.customers = []
+        Reservation.reservations = []
+
+    def test_wal_mode(self):
+        """Probar que la base de datos usa el modo WAL."""
+        mode = self.database.connection.execute(
+            "PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(mode, "wal")
+
+    def test_attached_operations(self):
+        """Probar que las operaciones de las clases llegan a SQLite."""
+        storage.attach(self.database)
+        hotel = Hotel.create_hotel("H1", "SQL Hotel", "City")
+        hotel.add_room("101", 2)
+        hotel.add_room("102", 2)
+        hotel.reserve_room("101", "C1", "2024-02-10", "2024-02-12")
+        Customer.create_customer("C1", "Jane", "jane@example.com")
+        reservation = Reservation.create_reservation(ReservationData(
+            "R1", "H1", "102", "C1", "2024-02-10", "2024-02-12"))
+        reservation.modify_reservation(end_date="2024-02-14")
+        self.assertFalse(self.database.is_room_available(
+            "H1", "101", "2024-02-12", "2024-02-13"))
+        self.assertTrue(self.database.is_room_available(
+            "H1", "101", "2024-02-13", "2024-02-15"))
+        self.assertTrue(self.database.has_reservation_conflict(
+            "H1", "102", "2024-02-14", "2024-02-20"))
+        self.assertEqual(self.database.get_reservation("R1")['end_date'],
+                         "2024-02-14")
+        self.assertEqual(self.database.get_customer("C1")['name'], "Jane")
+        hotel.cancel_reservation("101", "C1")
+        Reservation.cancel_reservation("R1")
+        Customer.delete_customer("C1")
+        self.assertTrue(self.database.is_room_available(
+            "H1", "101", "2024-02-10", "2024-02-12"))
+        self.assertEqual(self.database.reservations_for_customer("C1"), [])
+        with self.assertRaises(ValueError):
+            self.database.get_customer("C1")
+
+    def test_queries_check_both_tables(self):
+        """Probar que las consultas ven las reservas de ambas clases."""
+        storage.attach(self.database)
+        hotel = Hotel.create_hotel("H1", "SQL Hotel", "City")
+        hotel.add_room("101", 2)
+        hotel.add_room("102", 2)
+        hotel.reserve_room("101", "C1", "2024-02-10", "2024-02-12")
+        Reservation.create_reservation(ReservationData(
+            "R1", "H1", 102, "C1", "2024-02-10", "2024-02-12"))
+        self.assertTrue(self.database.has_reservation_conflict(
+            "H1", 101, "2024-02-11", "2024-02-11"))
+        self.assertFalse(self.database.is_room_available(
+            "H1", "102", "2024-02-11", "2024-02-11"))
+        with self.assertRaises(ValueError):
+            self.database.record('reservation', 'create', {
+                "reservation_id": "R2", "hotel_id": "H1",
+                "room_number": "101", "customer_id": "C1",
+                "start_date": "2024-02-11", "end_date": "2024-02-13"})
+
+    def test_failed_write_leaves_memory_unchanged(self):
+        """Probar que un error de SQLite no aplica el cambio en memoria."""
+        storage.attach(self.database)
+        hotel = Hotel.create_hotel("H1", "SQL Hotel", "City")
+        hotel.add_room("101", 2)
+        self.database.connection.executescript(
+            "DROP TABLE room_bookings; DROP TABLE reservations;"
+            " DROP TABLE customers;")
+        with self.assertRaises(sqlite3.Error):
+            hotel.reserve_room("101", "C1", "2024-02-10", "2024-02-12")
+        with self.assertRaises(sqlite3.Error):
+            Reservation.create_reservation(ReservationData(
+                "R1", "H1", "101", "C1", "2024-02-10", "2024-02-12"))
+        with self.assertRaises(sqlite3.Error):
+            Customer.create_customer("C1", "Jane", "jane@example.com")
+        self.assertEqual(len(hotel.rooms["101"].reservations), 0)
+        self.assertEqual(len(Reservation.reservations), 0)
+        self.assertEqual(len(Customer.customers), 0)
+        self.assertTrue(hotel.is_room_available("101", "2024-02-10",
+                                                "2024-02-12"))
+
+    def test_reservation_conflict(self):
+        """Probar que SQLite rechaza reservaciones solapadas."""
+        record = {"reservation_id": "R1", "hotel_id": "H1",
+                  "room_number": 1, "customer_id": "C1",
+                  "start_date": "2024-02-10", "end_date": "2024-02-15"}
+        self.database.record('reservation', 'create', record)
+        with self.assertRaises(ValueError):
+            self.database.record('reservation', 'create',
+                                 dict(record, reservation_id="R2",
+                                      start_date="2024-02-15",
+                                      end_date="2024-02-20"))
+
+    def test_import_and_export_json(self):
+        """Probar la importación y exportación en los formatos JSON."""
+        hotels_file = os.path.join(self.directory, "hotels.json")
+        hotel = Hotel.create_hotel("H1", "SQL Hotel", "City")
+        hotel.add_room("101", 2)
+        hotel.reserve_room("101", "C1", "2024-02-10", "2024-02-12")
+        Hotel.save_hotels_to_file(hotels_file)
+        self.database.import_json(
+            hotels_file=hotels_file,
+            customers_file="test_customers.json")
+        exported = os.path.join(self.directory, "exported.json")
+        self.database.export_json(hotels_file=exported)
+        with open(hotels_file, encoding="utf-8") as original, \
+                open(exported, encoding="utf-8") as copy:
+            self.assertEqual(json.load(original), json.load(copy))
+        storage.load_snapshot(self.database.snapshot())
+        self.assertFalse(Hotel.get_hotel("H1").is_room_available(
+            "101", "2024-02-11", "2024-02-11"))
+        self.assertEqual(len(Customer.customers), 5)
+
+    def test_same_stay_in_both_tables(self):
+        """Probar que la misma estancia de ambas clases no es conflicto."""
+        hotels_file = os.path.join(self.directory, "hotels.json")
+        reservations_file = os.path.join(self.directory, "reservations.json")
+        hotel = Hotel.create_hotel("H1", "SQL Hotel", "City")
+        hotel.add_room("101", 2)
+        hotel.reserve_room("101", "C1", "2024-02-10", "2024-02-12")
+        reservation = Reservation.create_reservation(ReservationData(
+            "R1", "H1", 101, "C1", "2024-02-10", "2024-02-12"))
+        Hotel.save_hotels_to_file(hotels_file)
+        Reservation.save_reservations_to_file(reservations_file)
+        self.database.import_json(hotels_file=hotels_file,
+                                  reservations_file=reservations_file)
+        storage.attach(self.database)
+        reservation.modify_reservation(end_date="2024-02-14")
+        self.assertFalse(self.database.is_room_available(
+            "H1", "101", "2024-02-13", "2024-02-13"))
+        state = self.database.snapshot()
+        self.assertEqual(
+            state['hotels'][0]['rooms']['101']['reservations'][0]['end_date'],
+            "2024-02-14")
+        storage.detach()
+        storage.load_snapshot(state)
+        self.assertTrue(Reservation.get_reservation("R1").held_by_hotel)
+
+    def tearDown(self):
+        """Cerrar la base de datos y borrar los archivos temporales."""
+        storage.detach()
+        self.database.close()
+        Hotel.hotels = []
+        Customer.customers = []
+        Reservation.reservations = []
+        shutil.rmtree(self.directory)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,193 @@
+"""Generadores de datos sintéticos reproducibles para los benchmarks.
+
+Cada generador recibe la ruta de salida, el número de registros y una
+semilla, y escribe el archivo por bloques para que 10^8 registros no
+tengan que caber en memoria. La misma semilla produce el mismo archivo.
+"""
+import datetime
+import json
+import random
+from functools import lru_cache
+from math import isqrt
+
+CHUNK = 10000
+VOCABULARY_SIZE = 5000
+PRODUCT_TYPES = ("dairy", "fruit", "bakery", "meat", "vegetable")
+FIRST_DAY = 738521  # 2023-01-01 como ordinal
+ROOMS_PER_HOTEL = 100
+
+
+def _write_lines(path, lines):
+    """Escribe las líneas generadas en bloques de CHUNK."""
+    with open(path, "w", encoding="utf-8") as file:
+        block = []
+        for line in lines:
+            block.append(line)
+            if len(block) == CHUNK:
+                file.write("\n".join(block) + "\n")
+                block = []
+        if block:
+            file.write("\n".join(block) + "\n")
+
+
+def _write_json_array(path, records):
+    """Escribe una lista JSON registro por registro."""
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("[")
+        block = []
+        first = True
+        for record in records:
+            block.append(json.dumps(record))
+            if len(block) == CHUNK:
+                file.write(("" if first else ",\n") + ",\n".join(block))
+                first = False
+                block = []
+        if block:
+            file.write(("" if first else ",\n") + ",\n".join(block))
+        file.write("]\n")
+
+
+def write_numbers(path, count, seed):
+    """Archivo de flotantes para compute_statistics, 0.1 % inválidos."""
+    generator = random.Random(seed)
+
+    def lines():
+        for _ in range(count):
+            if generator.random() < 0.001:
+                yield "n/a"
+            else:
+                yield repr(round(generator.gauss(500, 150), 3))
+    _write_lines(path, lines())
+
+
+def write_integers(path, count, seed):
+    """Archivo de enteros con signo para convert_numbers."""
+    generator = random.Random(seed)
+    _write_lines(path, (str(generator.randint(-2 ** 31, 2 ** 31))
+                        for _ in range(count)))
+
+
+def _vocabulary(generator):
+    """Regresa palabras alfabéticas al azar para el corpus."""
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    return ["".join(generator.choice(letters)
+                    for _ in range(generator.randint(2, 10)))
+            for _ in range(VOCABULARY_SIZE)]
+
+
+def write_text(path, count, seed):
+    """Corpus de count palabras con frecuencias tipo Zipf para word_count."""
+    generator = random.Random(seed)
+    vocabulary = _vocabulary(generator)
+    weights = [1 / rank for rank in range(1, VOCABULARY_SIZE + 1)]
+
+    def lines():
+        remaining = count
+        while remaining > 0:
+            words = generator.choices(vocabulary, weights, k=min(10,
+                                                                 remaining))
+            if generator.random() < 0.01:
+                words[0] = words[0] + "1"
+            remaining -= len(words)
+            yield " ".join(word.capitalize() if generator.random() < 0.1
+                           else word for word in words)
+    _write_lines(path, lines())
+
+
+def catalog_size(count):
+    """Número de productos del catálogo para count ventas."""
+    return max(10, isqrt(count))
+
+
+def write_catalog(path, count, seed):
+    """Catálogo de productos con el formato de TC*.ProductList.json."""
+    generator = random.Random(seed)
+    _write_json_array(path, ({'title': f"Product {number}",
+                              'type': generator.choice(PRODUCT_TYPES),
+                              'price': round(generator.uniform(1, 100), 2)}
+                             for number in range(catalog_size(count))))
+
+
+def write_sales(path, count, seed):
+    """Registro de count ventas con el formato de TC*.Sales.json."""
+    generator = random.Random(seed)
+    products = catalog_size(count)
+    _write_json_array(path, ({'SALE_ID': number // 5 + 1,
+                              'SALE_Date': "01/12/23",
+                              'Product': f"Product "
+                                         f"{generator.randrange(products)}",
+                              'Quantity': generator.randint(1, 10)}
+                             for number in range(count)))
+
+
+def write_customers(path, count, seed):
+    """Clientes con el formato de save_customers_to_file."""
+    generator = random.Random(seed)
+    _write_json_array(path, ({'customer_id': f"C{number}",
+                              'name': f"Customer {number}",
+                              'email': f"customer{number}@example.com"
+                              if generator.random() > 0.001
+                              else f"customer{number}.example.com"}
+                             for number in range(count)))
+
+
+def _stays(generator, count):
+    """Genera (habitación, inicio, fin) de estancias casi sin choques."""
+    rooms = max(1, count // 20)
+    next_day = [FIRST_DAY] * rooms
+    for _ in range(count):
+        room = generator.randrange(rooms)
+        start = next_day[room] + generator.randint(-1, 5)
+        end = start + generator.randint(1, 7)
+        next_day[room] = max(next_day[room], end + 1)
+        yield room, start, end
+
+
+@lru_cache(maxsize=None)
+def _iso(day):
+    """Convierte un ordinal en fecha ISO, recordando las ya convertidas."""
+    return datetime.date.fromordinal(day).isoformat()
+
+
+def write_reservations(path, count, seed):
+    """Reservaciones con el formato de save_reservations_to_file.
+
+    Unas pocas se solapan con la anterior de su habitación para que la
+    carga ejerza el rechazo de conflictos.
+    """
+    generator = random.Random(seed)
+    _write_json_array(path, ({'reservation_id': f"R{number}",
+                              'hotel_id': f"H{room // ROOMS_PER_HOTEL}",
+                              'room_number': room % ROOMS_PER_HOTEL,
+                              'customer_id': f"C{generator.randrange(1000)}",
+                              'start_date': _iso(start),
+                              'end_date': _iso(end)}
+                             for number, (room, start, end)
+                             in enumerate(_stays(generator, count))))
+
+
+def write_hotels(path, count, seed):
+    """Hoteles con el formato de save_hotels_to_file y hasta count reservas.
+
+    Las reservas se agrupan por habitación en memoria antes de escribir.
+    """
+    generator = random.Random(seed)
+    hotels = {}
+    for room, start, end in _stays(generator, count):
+        hotel = hotels.setdefault(room // ROOMS_PER_HOTEL, {})
+        bookings = hotel.setdefault(str(room % ROOMS_PER_HOTEL), [])
+        if bookings and start <= bookings[-1][2]:
+            continue
+        bookings.append((f"C{generator.randrange(1000)}", start, end))
+    _write_json_array(path, ({'hotel_id': f"H{number}",
+                              'name': f"Hotel {number}",
+                              'location': f"City {number % 50}",
+                              'rooms': {room: {'capacity': 2,
+                                               'reservations': [
+                                                   {'customer_id': customer,
+                                                    'start_date': _iso(start),
+                                                    'end_date': _iso(end)}
+                                                   for customer, start, end
+                                                   in bookings]}
+                                        for room, bookings in rooms.items()}}
+                             for number, rooms in sorted(hotels.items())))
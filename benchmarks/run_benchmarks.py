@@ -0,0 +1,257 @@
+"""Benchmarks reproducibles de los puntos de entrada del repositorio.
+
+Para cada caso y tamaño genera los datos con una semilla fija y corre la
+operación en un subproceso, para que el pico de RSS sea el de ese caso.
+Guarda en JSON el tiempo, el throughput (registros/s), el pico de RSS y
+la curva de escalamiento de cada caso. Con --compare marca los casos cuyo
+throughput cayó más que --tolerance contra una corrida anterior.
+Uso: python benchmarks/run_benchmarks.py [--sizes 1000 10000 ...]
+     [--cases statistics convert ...] [--output resultados.json]
+     [--compare base.json] [--tolerance 0.2] [--seed 42]
+"""
+import argparse
+import contextlib
+import functools
+import importlib
+import json
+import math
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import generators
+
+try:
+    import resource
+except ImportError:  # Windows no tiene el módulo resource
+    resource = None
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FOLDERS = {'A4.2': 'A01793198_A4.2',
+           'A5.2': 'A01793198_A5.2',
+           'A6.2': 'A01793198_A6.2'}
+DEFAULT_SIZES = (1000, 10000, 100000)
+
+
+def load_module(folder, name):
+    """Importa un módulo de la carpeta de una actividad.
+
+    Las carpetas llevan puntos en el nombre y no son paquetes, así que se
+    agregan a sys.path y el módulo se importa por su nombre de archivo.
+    """
+    path = os.path.join(REPO, FOLDERS[folder])
+    if path not in sys.path:
+        sys.path.insert(0, path)
+    return importlib.import_module(name)
+
+
+def entry_point(folder, module, attribute):
+    """Regresa un prepare que llama module.attribute con las rutas."""
+    def prepare(paths, size, seed):  # pylint: disable=unused-argument
+        target = functools.reduce(getattr, attribute.split("."),
+                                  load_module(folder, module))
+        return lambda: target(*paths)
+    return prepare
+
+
+def prepare_availability(paths, size, seed):
+    """Carga las reservaciones y regresa size consultas de disponibilidad."""
+    reservation = load_module('A6.2', 'reservation').Reservation
+    reservation.bulk_load_reservations(paths[0])
+    generator = random.Random(seed)
+    rooms = max(1, size // 20)
+    queries = []
+    for _ in range(size):
+        room = generator.randrange(rooms)
+        start = generators.FIRST_DAY + generator.randrange(365)
+        queries.append((f"H{room // generators.ROOMS_PER_HOTEL}",
+                        room % generators.ROOMS_PER_HOTEL, start,
+                        start + generator.randint(1, 7)))
+
+    def run():
+        for query in queries:
+            reservation.is_room_available(*query)
+    return run
+
+
+# Cada caso: archivos de entrada (nombre, generador) y prepare, que
+# regresa la función sin argumentos que se mide.
+CASES = {
+    'statistics': ((("numbers.txt", generators.write_numbers),),
+                   entry_point('A4.2', 'compute_statistics',
+                               'compute_statistics')),
+    'convert': ((("integers.txt", generators.write_integers),),
+                entry_point('A4.2', 'convert_numbers', 'convert_numbers')),
+    'wordcount': ((("corpus.txt", generators.write_text),),
+                  entry_point('A4.2', 'word_count', 'count_words')),
+    'sales': ((("catalog.json", generators.write_catalog),
+               ("sales.json", generators.write_sales)),
+              entry_point('A5.2', 'compute_sales', 'main')),
+    'customers': ((("customers.json", generators.write_customers),),
+                  entry_point('A6.2', 'customer',
+                              'Customer.load_customers_from_file')),
+    'hotels': ((("hotels.json", generators.write_hotels),),
+               entry_point('A6.2', 'hotel', 'Hotel.load_hotels_from_file')),
+    'reservations': ((("reservations.json", generators.write_reservations),),
+                     entry_point('A6.2', 'reservation',
+                                 'Reservation.bulk_load_reservations')),
+    'availability': ((("reservations.json", generators.write_reservations),),
+                     prepare_availability),
+}
+
+
+def peak_rss_kb():
+    """Regresa el pico de memoria residente del proceso en KiB."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS lo reporta en bytes, Linux en KiB
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def run_child(case, size, seed, directory):
+    """Mide un caso dentro del subproceso e imprime el resultado en JSON."""
+    inputs, prepare = CASES[case]
+    paths = [os.path.join(directory, name) for name, _ in inputs]
+    os.chdir(directory)
+    with open(os.devnull, "w", encoding="utf-8") as devnull, \
+            contextlib.redirect_stdout(devnull):
+        operation = prepare(paths, size, seed)
+        started = time.perf_counter()
+        operation()
+        elapsed = time.perf_counter() - started
+    print(json.dumps({'seconds': elapsed, 'peak_rss_kb': peak_rss_kb()}))
+
+
+def measure(case, size, seed, timeout=None):
+    """Genera los datos del caso y lo corre en un subproceso."""
+    directory = tempfile.mkdtemp(prefix=f"bench_{case}_")
+    try:
+        started = time.perf_counter()
+        for name, writer in CASES[case][0]:
+            writer(os.path.join(directory, name), size, seed)
+        point = {'size': size,
+                 'generate_seconds': time.perf_counter() - started}
+        try:
+            child = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--child", case,
+                 str(size), str(seed), directory],
+                capture_output=True, text=True, timeout=timeout,
+                check=False)
+        except subprocess.TimeoutExpired:
+            point['error'] = "timeout"
+            return point
+        if child.returncode != 0:
+            point['error'] = child.stderr.strip().splitlines()[-1:]
+            return point
+        point.update(json.loads(child.stdout.strip().splitlines()[-1]))
+        point['throughput'] = size / point['seconds'] \
+            if point['seconds'] else None
+        return point
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def scaling_exponent(points):
+    """Pendiente log-log del tiempo contra el tamaño (1.0 = lineal)."""
+    pairs = [(math.log(point['size']), math.log(point['seconds']))
+             for point in points if point.get('seconds')]
+    if len(pairs) < 2:
+        return None
+    mean_x = sum(x for x, _ in pairs) / len(pairs)
+    mean_y = sum(y for _, y in pairs) / len(pairs)
+    spread = sum((x - mean_x) ** 2 for x, _ in pairs)
+    return sum((x - mean_x) * (y - mean_y) for x, y in pairs) / spread
+
+
+def compare(results, baseline, tolerance):
+    """Regresa los casos cuyo throughput cayó más que la tolerancia."""
+    regressions = []
+    for case, data in results['cases'].items():
+        before = {point['size']: point.get('throughput')
+                  for point in baseline.get('cases', {}).get(
+                      case, {}).get('points', [])}
+        for point in data['points']:
+            old = before.get(point['size'])
+            new = point.get('throughput')
+            if old and new and new < old * (1 - tolerance):
+                regressions.append({'case': case, 'size': point['size'],
+                                    'baseline': old, 'current': new,
+                                    'ratio': new / old})
+    return regressions
+
+
+def run(cases, sizes, seed, timeout=None):
+    """Corre los casos en todos los tamaños y regresa los resultados."""
+    results = {'meta': {'python': platform.python_version(),
+                        'platform': platform.platform(),
+                        'seed': seed,
+                        'timestamp': time.strftime("%Y-%m-%dT%H:%M:%S")},
+               'cases': {}}
+    for case in cases:
+        points = []
+        for size in sizes:
+            point = measure(case, size, seed, timeout)
+            points.append(point)
+            print(f"{case:>12} {size:>11} " + (
+                f"{point['seconds']:>10.3f} s "
+                f"{point['throughput']:>14,.0f}/s "
+                f"{point['peak_rss_kb'] or 0:>10} KiB"
+                if 'error' not in point else f"error: {point['error']}"))
+        results['cases'][case] = {'points': points,
+                                  'scaling_exponent': scaling_exponent(
+                                      points)}
+    return results
+
+
+def parse_args(argv):
+    """Interpreta los argumentos de la línea de comandos."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        default=list(DEFAULT_SIZES),
+                        help="número de registros por corrida "
+                             "(de 10^3 a 10^8)")
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES),
+                        default=list(CASES))
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--compare", help="JSON de una corrida anterior")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="caída de throughput permitida (0.2 = 20 %%)")
+    parser.add_argument("--timeout", type=float,
+                        help="segundos máximos por caso y tamaño")
+    parser.add_argument("--child", nargs=4, help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Corre los benchmarks, guarda el JSON y compara si se pidió."""
+    args = parse_args(argv)
+    if args.child:
+        case, size, seed, directory = args.child
+        run_child(case, int(size), int(seed), directory)
+        return 0
+    results = run(args.cases, args.sizes, args.seed, args.timeout)
+    status = 0
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as file:
+            regressions = compare(results, json.load(file), args.tolerance)
+        results['regressions'] = regressions
+        for regression in regressions:
+            print(f"Regression: {regression['case']} at "
+                  f"{regression['size']}: {regression['ratio']:.0%} of "
+                  f"baseline throughput")
+        status = 1 if regressions else 0
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=2)
+    print(f"Results written to {args.output}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,236 @@
+"""Corre los scripts de las actividades sobre muchos archivos a la vez.
+
+Los subcomandos (stats, convert, wordcount, sales) importan su script
+solo cuando se usan y lo llaman en este mismo proceso, o en un pool de
+procesos que se queda con el módulo ya importado, en lugar de arrancar un
+intérprete por archivo. Cada archivo escribe su archivo de resultados como
+lo hace el script, y al final se escribe un resumen con una columna por
+archivo, como A4.2.P1.Results.txt.
+Uso: python run_batch.py stats 'A01793198_A4.2/P1/TC*.txt' [--jobs 4]
+     python run_batch.py sales --catalogue precios.json ventas*.json
+"""
+import argparse
+import concurrent.futures
+import contextlib
+import glob
+import importlib
+import os
+import sys
+import time
+
+REPO = os.path.dirname(os.path.abspath(__file__))
+MISSING = "#N/A"
+# Terminación de los archivos que escriben los scripts (TC1.txt.Results.txt,
+# TC1.txt.P2.Results.txt, ventas.json.SalesResults.txt, ...)
+RESULTS_SUFFIX = "Results.txt"
+
+
+def stats_summary(statistics):
+    """Filas del resumen de compute_statistics.
+
+    Sin una moda única la celda queda en #N/A, como en la hoja de P1.
+    """
+    mode = statistics['mode']
+    return {'COUNT': statistics['count'],
+            'MEAN': statistics['mean'],
+            'MEDIAN': statistics['median'],
+            'MODE': MISSING if isinstance(mode, list) else mode,
+            'SD': statistics['stdev'],
+            'VARIANCE': statistics['sample_variance']}
+
+
+def convert_summary(converted):
+    """Filas del resumen de convert_numbers.
+
+    MIN y MAX se regresan ya en decimal (ver decimal), porque pueden pasar
+    el límite de dígitos de str() que convert_numbers quita solo mientras
+    convierte.
+    """
+    numbers = [number for number, _, _ in converted]
+    if not numbers:
+        return {'COUNT': 0, 'MIN': MISSING, 'MAX': MISSING}
+    return {'COUNT': len(numbers),
+            'MIN': decimal(min(numbers)),
+            'MAX': decimal(max(numbers))}
+
+
+def decimal(number):
+    """Regresa el entero en decimal aunque tenga más de 4300 dígitos."""
+    if not hasattr(sys, 'set_int_max_str_digits'):
+        return str(number)
+    digit_limit = sys.get_int_max_str_digits()
+    sys.set_int_max_str_digits(0)
+    try:
+        return str(number)
+    finally:
+        sys.set_int_max_str_digits(digit_limit)
+
+
+def wordcount_summary(word_count):
+    """Filas del resumen de count_words."""
+    return {'WORDS': sum(word_count.values()),
+            'DISTINCT': len(word_count),
+            'TOP': max(word_count, key=word_count.get, default=MISSING)}
+
+
+def sales_summary(result):
+    """Filas del resumen de compute_sales."""
+    total_sales, grand_total = result
+    return {'PRODUCTS': len(total_sales),
+            'QUANTITY': sum(details['quantity']
+                            for details in total_sales.values()),
+            'TOTAL': f"{grand_total:.2f}"}
+
+
+# Cada subcomando: carpeta, módulo, función, resumen y nombre por omisión
+# del archivo de resumen.
+COMMANDS = {
+    'stats': ('A01793198_A4.2', 'compute_statistics', 'compute_statistics',
+              stats_summary, 'A4.2.P1.Results.txt'),
+    'convert': ('A01793198_A4.2', 'convert_numbers', 'convert_numbers',
+                convert_summary, 'A4.2.P2.Results.txt'),
+    'wordcount': ('A01793198_A4.2', 'word_count', 'count_words',
+                  wordcount_summary, 'A4.2.P3.Results.txt'),
+    'sales': ('A01793198_A5.2', 'compute_sales', 'main',
+              sales_summary, 'A5.2.Results.txt'),
+}
+
+
+def load_command(command):
+    """Importa el script del subcomando y regresa su función.
+
+    Las carpetas llevan puntos en el nombre y no son paquetes, así que se
+    agregan a sys.path y el módulo se importa por su nombre de archivo. Solo
+    se agrega la carpeta del subcomando, porque las actividades tienen
+    módulos auxiliares con el mismo nombre (metrics, profiling).
+    """
+    folder, module, function = COMMANDS[command][:3]
+    path = os.path.join(REPO, folder)
+    if path not in sys.path:
+        sys.path.insert(0, path)
+    return getattr(importlib.import_module(module), function)
+
+
+def expand(patterns):
+    """Expande los globs en orden, sin repetir archivos.
+
+    Los archivos de resultados de una corrida anterior que coinciden con
+    un glob se omiten (TC*.txt también coincide con TC1.txt.Results.txt);
+    nombrados tal cual sí se procesan. Un patrón que no coincide con nada
+    se deja tal cual para que el script reporte el archivo faltante.
+    """
+    paths = []
+    seen = set()
+    for pattern in patterns:
+        for path in sorted(glob.glob(pattern)) or [pattern]:
+            if path.endswith(RESULTS_SUFFIX) and path != pattern:
+                continue
+            if path not in seen:
+                seen.add(path)
+                paths.append(path)
+    return paths
+
+
+def arguments_for(command, path, catalogue):
+    """Regresa los argumentos de la función del subcomando para un archivo."""
+    if command == 'sales':
+        return (catalogue, path), {'results_file': path + '.SalesResults.txt'}
+    return (path,), {}
+
+
+def process(command, path, catalogue=None, echo=False):
+    """Corre el subcomando sobre un archivo y regresa su resumen o None.
+
+    La salida en pantalla del script se descarta salvo con echo, porque con
+    miles de archivos imprimir cada resultado cuesta más que calcularlo. Un
+    archivo que hace fallar al script se reporta en stderr y no detiene el
+    lote.
+    """
+    function = load_command(command)
+    args, kwargs = arguments_for(command, path, catalogue)
+    with open(os.devnull, "w", encoding="utf-8") as devnull, \
+            contextlib.redirect_stdout(sys.stdout if echo else devnull):
+        try:
+            result = function(*args, **kwargs)
+        except SystemExit:  # compute_sales sale así con archivos inválidos
+            result = None
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            print(f"{path}: {type(error).__name__}: {error}",
+                  file=sys.stderr)
+            result = None
+    return None if result is None else COMMANDS[command][3](result)
+
+
+def run(command, paths, jobs=1, catalogue=None, echo=False):
+    """Procesa los archivos y regresa sus resúmenes en el mismo orden."""
+    if jobs <= 1 or len(paths) <= 1:
+        return [process(command, path, catalogue, echo) for path in paths]
+    # Bloques grandes para que los archivos pequeños no se paguen en IPC
+    chunksize = max(1, len(paths) // (jobs * 4))
+    with concurrent.futures.ProcessPoolExecutor(
+            max_workers=jobs, initializer=load_command,
+            initargs=(command,)) as pool:
+        return list(pool.map(process, [command] * len(paths), paths,
+                             [catalogue] * len(paths), [echo] * len(paths),
+                             chunksize=chunksize))
+
+
+def format_summary(paths, summaries):
+    """Regresa el resumen como tabla separada por tabuladores.
+
+    La primera fila lleva el nombre de cada archivo (TC1, TC2, ...) y cada
+    fila siguiente un valor; los archivos que fallaron quedan en #N/A.
+    """
+    names = [os.path.basename(path).split(".")[0] for path in paths]
+    keys = []
+    for summary in summaries:
+        for key in summary or ():
+            if key not in keys:
+                keys.append(key)
+    lines = ["\t".join(["TC"] + names)]
+    for key in keys:
+        lines.append("\t".join([key] + [
+            str(summary.get(key, MISSING)) if summary else MISSING
+            for summary in summaries]))
+    return "\n".join(lines) + "\n"
+
+
+def parse_args(argv):
+    """Interpreta los argumentos de la línea de comandos."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for command in COMMANDS:
+        subparser = subparsers.add_parser(command)
+        subparser.add_argument("files", nargs="+",
+                               help="archivos o globs de entrada")
+        if command == 'sales':
+            subparser.add_argument("--catalogue", required=True,
+                                   metavar="priceCatalogue.json")
+        subparser.add_argument("--jobs", type=int, default=1,
+                               help="procesos del pool (1 = este proceso)")
+        subparser.add_argument("--summary", default=COMMANDS[command][4],
+                               help="archivo del resumen combinado")
+        subparser.add_argument("--echo", action="store_true",
+                               help="muestra la salida de cada archivo")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Corre el subcomando y escribe el resumen combinado."""
+    args = parse_args(argv)
+    paths = expand(args.files)
+    started = time.perf_counter()
+    summaries = run(args.command, paths, args.jobs,
+                    getattr(args, 'catalogue', None), args.echo)
+    elapsed = time.perf_counter() - started
+    with open(args.summary, "w", encoding="utf-8") as file:
+        file.write(format_summary(paths, summaries))
+    failed = sum(summary is None for summary in summaries)
+    print(f"Processed {len(paths)} files ({failed} failed) in "
+          f"{elapsed:.2f} seconds with {max(args.jobs, 1)} process(es). "
+          f"Summary written to {args.summary}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())